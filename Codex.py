@@ -1,9 +1,25 @@
 # sully_engine/codex.py
 # 📚 Sully's Symbolic Codex (Knowledge Repository)
 
+from bisect import bisect_left
+from collections import Counter
 from datetime import datetime
+import heapq
 import json
-from typing import Dict, List, Any, Optional, Union, Set
+import math
+import re
+import threading
+from typing import Dict, List, Any, Optional, Union, Set, Tuple
+
+# Entry fields that describe an entry's structure rather than its content
+_STRUCTURAL_FIELDS = {"type", "timestamp"}
+
+# Tokenization and BM25 parameters for ranked search
+_TOKEN_PATTERN = re.compile(r"\w+")
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+_TOPIC_NAME_WEIGHT = 3  # Topic-name tokens count as this many occurrences
+_MAX_PREFIX_EXPANSIONS = 20  # Vocabulary terms an unknown query token may expand to
 
 class SullyCodex:
     """
@@ -11,10 +27,33 @@ class SullyCodex:
     Functions as both a lexicon and a semantic network of interconnected meanings.
     """
 
-    def __init__(self):
+    def __init__(self, max_keyword_fanout: int = 100):
+        """
+        Initialize the codex.
+        
+        Args:
+            max_keyword_fanout: Keywords shared by more topics than this are
+                treated as too common to imply an association
+        """
         self.entries = {}
         self.terms = {}  # For word definitions
         self.associations = {}  # For tracking relationships between concepts
+        
+        # Inverted indices used to find association candidates
+        self.keyword_index = {}  # Keyword -> topics whose data mention it
+        self.topic_name_index = {}  # Word of a topic name -> topics
+        self.topic_keywords = {}  # Topic -> keywords currently indexed for it
+        self.max_keyword_fanout = max_keyword_fanout
+        
+        # Guards entries and indices when the codex is shared across threads
+        self._lock = threading.RLock()
+        
+        # Full-text index for ranked search
+        self.search_index = {}  # Token -> {topic: weighted term frequency}
+        self.doc_terms = {}  # Topic -> Counter of indexed tokens
+        self.doc_lengths = {}  # Topic -> total weighted term frequency
+        self._total_doc_length = 0
+        self._sorted_vocabulary = None  # Lazily rebuilt for prefix lookups
 
     def record(self, topic: str, data: Dict[str, Any]) -> None:
         """
@@ -24,51 +63,153 @@ class SullyCodex:
             topic: The symbolic topic or name
             data: Associated symbolic data or metadata
         """
-        normalized_topic = topic.lower()
-        self.entries[normalized_topic] = {
-            **data,
-            "timestamp": datetime.now().isoformat()
-        }
+        with self._lock:
+            normalized_topic = topic.lower()
+            self.entries[normalized_topic] = {
+                **data,
+                "timestamp": datetime.now().isoformat()
+            }
+        
+            # Create associations with existing concepts
+            self._create_associations(normalized_topic, data)
+        
+            # Make the entry searchable
+            self._index_document(normalized_topic)
+
+    def _extract_keywords(self, data: Dict[str, Any]) -> Set[str]:
+        """
+        Extracts association keywords from an entry's content fields.
+        
+        Args:
+            data: Entry data
+            
+        Returns:
+            Set of lowercased keywords
+        """
+        keywords = set()
+        for field, value in data.items():
+            if field in _STRUCTURAL_FIELDS:
+                continue
+            if isinstance(value, str):
+                # Split text into words, filter out very short words
+                keywords.update(w.lower() for w in value.split() if len(w) > 3)
+        return keywords
+
+    def _index_topic(self, topic: str, keywords: Set[str]) -> None:
+        """
+        Records a topic's name and keywords in the inverted indices.
+        
+        Args:
+            topic: The normalized topic
+            keywords: Keywords extracted from the topic's data
+        """
+        # Drop keywords from a previous version of this entry
+        for keyword in self.topic_keywords.get(topic, ()):
+            topics = self.keyword_index.get(keyword)
+            if topics:
+                topics.discard(topic)
+                
+        for keyword in keywords:
+            self.keyword_index.setdefault(keyword, set()).add(topic)
+        self.topic_keywords[topic] = keywords
         
-        # Create associations with existing concepts
-        self._create_associations(normalized_topic, data)
+        for word in topic.split():
+            self.topic_name_index.setdefault(word, set()).add(topic)
+
+    def _rebuild_indices(self) -> None:
+        """Rebuilds the inverted indices from the current entries and terms."""
+        self.keyword_index = {}
+        self.topic_name_index = {}
+        self.topic_keywords = {}
+        for topic, data in self.entries.items():
+            self._index_topic(topic, self._extract_keywords(data))
+            
+        self.search_index = {}
+        self.doc_terms = {}
+        self.doc_lengths = {}
+        self._total_doc_length = 0
+        self._sorted_vocabulary = None
+        for topic in set(self.entries) | set(self.terms):
+            self._index_document(topic)
+
+    def _index_document(self, topic: str) -> None:
+        """
+        (Re)indexes a topic's name, entry values and definition for ranked search.
+        
+        Args:
+            topic: The normalized topic
+        """
+        # Remove the previous version of this document
+        previous = self.doc_terms.pop(topic, None)
+        if previous:
+            for token in previous:
+                postings = self.search_index.get(token)
+                if postings:
+                    postings.pop(topic, None)
+                    if not postings:
+                        del self.search_index[token]
+            self._total_doc_length -= self.doc_lengths.pop(topic)
+        
+        terms = Counter()
+        for token in _TOKEN_PATTERN.findall(topic):
+            terms[token] += _TOPIC_NAME_WEIGHT
+            
+        for field, value in self.entries.get(topic, {}).items():
+            if field in _STRUCTURAL_FIELDS or value is None:
+                continue
+            terms.update(_TOKEN_PATTERN.findall(str(value).lower()))
+            
+        meaning = self.terms.get(topic, {}).get("meaning")
+        if meaning:
+            terms.update(_TOKEN_PATTERN.findall(meaning.lower()))
+            
+        for token, frequency in terms.items():
+            if token not in self.search_index:
+                self._sorted_vocabulary = None
+                self.search_index[token] = {}
+            self.search_index[token][topic] = frequency
+            
+        self.doc_terms[topic] = terms
+        self.doc_lengths[topic] = sum(terms.values())
+        self._total_doc_length += self.doc_lengths[topic]
 
     def _create_associations(self, topic: str, data: Dict[str, Any]) -> None:
         """
         Creates semantic associations between concepts based on shared attributes.
         
+        Only topics reachable through the new entry's own keywords are
+        considered, so recording is independent of the codex size.
+        
         Args:
             topic: The topic to create associations for
             data: The data containing potential association points
         """
         # Extract potential keywords from the data
-        keywords = set()
-        for value in data.values():
-            if isinstance(value, str):
-                # Split text into words, filter out very short words
-                words = [w.lower() for w in str(value).split() if len(w) > 3]
-                keywords.update(words)
+        keywords = self._extract_keywords(data)
         
-        # Look for matches in existing entries
-        for existing_topic in self.entries:
-            if existing_topic == topic:
-                continue  # Skip self-association
-                
-            # Check for keyword overlap in topic name
-            if any(keyword in existing_topic for keyword in keywords):
+        # Topics whose names contain one of the keywords
+        name_matches = set()
+        for keyword in keywords:
+            name_matches.update(self.topic_name_index.get(keyword, ()))
+        
+        # Topics whose data share keywords with this entry
+        shared = {}
+        for keyword in keywords:
+            topics = self.keyword_index.get(keyword)
+            if not topics or len(topics) > self.max_keyword_fanout:
+                continue
+            for existing_topic in topics:
+                shared.setdefault(existing_topic, []).append(keyword)
+        
+        for existing_topic in name_matches:
+            if existing_topic != topic and existing_topic not in shared:
                 self._add_association(topic, existing_topic, "keyword_match")
                 
-            # Check for keyword overlap in data values
-            existing_data = self.entries[existing_topic]
-            existing_keywords = set()
-            for value in existing_data.values():
-                if isinstance(value, str):
-                    words = [w.lower() for w in str(value).split() if len(w) > 3]
-                    existing_keywords.update(words)
-                    
-            common_keywords = keywords.intersection(existing_keywords)
-            if common_keywords:
-                self._add_association(topic, existing_topic, "shared_concepts", list(common_keywords))
+        for existing_topic, common_keywords in shared.items():
+            if existing_topic != topic:  # Skip self-association
+                self._add_association(topic, existing_topic, "shared_concepts", common_keywords)
+        
+        self._index_topic(topic, keywords)
 
     def _add_association(self, topic1: str, topic2: str, type_: str, details: Any = None) -> None:
         """
@@ -98,18 +239,19 @@ class SullyCodex:
             term: The word or concept to define
             meaning: The definition or meaning of the term
         """
-        normalized_term = term.lower()
-        self.terms[normalized_term] = {
-            "meaning": meaning,
-            "created": datetime.now().isoformat(),
-            "contexts": []  # Tracks different contexts where the term appears
-        }
+        with self._lock:
+            normalized_term = term.lower()
+            self.terms[normalized_term] = {
+                "meaning": meaning,
+                "created": datetime.now().isoformat(),
+                "contexts": []  # Tracks different contexts where the term appears
+            }
         
-        # Also add to entries for searchability
-        self.record(normalized_term, {
-            "type": "term",
-            "definition": meaning
-        })
+            # Also add to entries for searchability
+            self.record(normalized_term, {
+                "type": "term",
+                "definition": meaning
+            })
 
     def add_context(self, term: str, context: str) -> None:
         """
@@ -119,22 +261,162 @@ class SullyCodex:
             term: The term to add context for
             context: A sample sentence or context where the term is used
         """
-        normalized_term = term.lower()
-        if normalized_term in self.terms:
-            self.terms[normalized_term]["contexts"].append(context)
-            # Update the timestamp
-            self.terms[normalized_term]["updated"] = datetime.now().isoformat()
+        with self._lock:
+            normalized_term = term.lower()
+            if normalized_term in self.terms:
+                self.terms[normalized_term]["contexts"].append(context)
+                # Update the timestamp
+                self.terms[normalized_term]["updated"] = datetime.now().isoformat()
 
-    def search(self, phrase: str, case_sensitive: bool = False, semantic: bool = True) -> Dict[str, Any]:
+    def _expand_query_token(self, token: str) -> List[str]:
+        """
+        Maps a query token to indexed tokens, using prefix matches for
+        tokens that are not in the vocabulary (e.g. "infin" -> "infinity").
+        
+        Args:
+            token: Lowercased query token
+            
+        Returns:
+            List of indexed tokens
+        """
+        if token in self.search_index:
+            return [token]
+        if len(token) < 4:
+            return []
+            
+        if self._sorted_vocabulary is None:
+            self._sorted_vocabulary = sorted(self.search_index)
+            
+        expansions = []
+        position = bisect_left(self._sorted_vocabulary, token)
+        while (position < len(self._sorted_vocabulary) and 
+               len(expansions) < _MAX_PREFIX_EXPANSIONS and
+               self._sorted_vocabulary[position].startswith(token)):
+            expansions.append(self._sorted_vocabulary[position])
+            position += 1
+        return expansions
+
+    def search_ranked(self, phrase: str, limit: Optional[int] = 10) -> List[Tuple[str, float]]:
+        """
+        Ranks topics against a phrase with BM25 over topic names, entry values
+        and term definitions.
+        
+        Args:
+            phrase: The search phrase
+            limit: Maximum number of topics to return (None for all matches)
+            
+        Returns:
+            List of (topic, score) pairs, best first
+        """
+        with self._lock:
+            doc_count = len(self.doc_terms)
+            if not doc_count:
+                return []
+            average_length = self._total_doc_length / doc_count
+        
+            # Gather posting lists, rarest first
+            query_postings = []
+            for token in set(_TOKEN_PATTERN.findall(phrase.lower())):
+                for indexed_token in self._expand_query_token(token):
+                    query_postings.append(self.search_index[indexed_token])
+            query_postings.sort(key=len)
+        
+            scores = {}
+            for i, postings in enumerate(query_postings):
+                document_frequency = len(postings)
+                # Skip near-ubiquitous tokens once rarer ones have been scored
+                if i > 0 and document_frequency > doc_count / 2:
+                    break
+                
+                idf = math.log(1 + (doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
+                for topic, frequency in postings.items():
+                    length_norm = 1 - _BM25_B + _BM25_B * self.doc_lengths[topic] / average_length
+                    score = idf * frequency * (_BM25_K1 + 1) / (frequency + _BM25_K1 * length_norm)
+                    scores[topic] = scores.get(topic, 0.0) + score
+        
+            if limit is None:
+                return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def search(self, phrase: str, case_sensitive: bool = False, semantic: bool = True,
+               limit: Optional[int] = None, semantic_limit: int = 10) -> Dict[str, Any]:
         """
         Searches the codex for entries matching a phrase, with optional
         semantic expansion to related concepts.
 
         Args:
             phrase: The search keyword
-            case_sensitive: Match case when scanning
+            case_sensitive: Only keep results containing the phrase with exact case
             semantic: Whether to include semantically related results
+            limit: Maximum number of ranked matches (None for all matches)
+            semantic_limit: Maximum number of related topics added by expansion
 
+        Returns:
+            Dictionary of matching entries (topic -> data), best matches first
+        """
+        with self._lock:
+            if not _TOKEN_PATTERN.search(phrase):
+                # Nothing to rank on; fall back to a substring scan
+                results = self._scan_search(phrase, case_sensitive)
+                if limit is not None:
+                    results = dict(list(results.items())[:limit])
+            else:
+                results = {}
+                for topic, _ in self.search_ranked(phrase, None if case_sensitive else limit):
+                    data = self._search_result(topic)
+                    if case_sensitive and not self._contains_phrase(topic, data, phrase):
+                        continue
+                    results[topic] = data
+                    if limit is not None and len(results) >= limit:
+                        break
+
+            # Expand to semantically related topics if requested
+            if semantic and results:
+                semantic_results = {}
+                for topic in list(results.keys()):
+                    if len(semantic_results) >= semantic_limit:
+                        break
+                    for related_topic, relation in self.associations.get(topic, {}).items():
+                        if related_topic in results or related_topic in semantic_results:
+                            continue
+                        semantic_results[related_topic] = {
+                            **self.entries.get(related_topic, {}),
+                            "related_to": topic,
+                            "relation": relation
+                        }
+                        if len(semantic_results) >= semantic_limit:
+                            break
+            
+                # Add semantic results with a note about their relationship
+                results.update(semantic_results)
+
+            return results
+
+    def _search_result(self, topic: str) -> Dict[str, Any]:
+        """Returns the data reported for a topic in search results."""
+        if topic in self.entries:
+            return self.entries[topic]
+        data = self.terms.get(topic, {})
+        return {
+            "type": "term",
+            "definition": data.get("meaning", ""),
+            "contexts": data.get("contexts", [])
+        }
+
+    def _contains_phrase(self, topic: str, data: Dict[str, Any], phrase: str) -> bool:
+        """Checks whether a topic or any of its values contains a phrase verbatim."""
+        if phrase in topic:
+            return True
+        return any(phrase in str(v) for v in data.values() if v is not None)
+
+    def _scan_search(self, phrase: str, case_sensitive: bool) -> Dict[str, Any]:
+        """
+        Substring scan over every entry and term definition.
+        
+        Args:
+            phrase: The search phrase
+            case_sensitive: Match case when scanning
+            
         Returns:
             Dictionary of matching entries (topic -> data)
         """
@@ -157,27 +439,7 @@ class SullyCodex:
             
             if phrase_check in term_check or phrase_check in meaning_check:
                 if term not in results:  # Avoid duplication with entries
-                    results[term] = {
-                        "type": "term",
-                        "definition": meaning,
-                        "contexts": data.get("contexts", [])
-                    }
-
-        # Expand to semantically related topics if requested
-        if semantic and results:
-            semantic_results = {}
-            for topic in list(results.keys()):
-                if topic in self.associations:
-                    for related_topic, relation in self.associations[topic].items():
-                        if related_topic not in results:
-                            semantic_results[related_topic] = {
-                                **self.entries.get(related_topic, {}),
-                                "related_to": topic,
-                                "relation": relation
-                            }
-            
-            # Add semantic results with a note about their relationship
-            results.update(semantic_results)
+                    results[term] = self._search_result(term)
 
         return results
 
@@ -238,38 +500,70 @@ class SullyCodex:
         Returns:
             Dictionary of related concepts with their relationship paths
         """
-        normalized_topic = topic.lower()
-        if normalized_topic not in self.associations:
-            return {}
+        with self._lock:
+            normalized_topic = topic.lower()
+            if normalized_topic not in self.associations:
+                return {}
             
-        # Start with direct associations
-        related = {
-            related_topic: {"path": [normalized_topic], "relation": info}
-            for related_topic, info in self.associations[normalized_topic].items()
-        }
+            # Start with direct associations
+            related = {
+                related_topic: {"path": [normalized_topic], "relation": info}
+                for related_topic, info in self.associations[normalized_topic].items()
+            }
         
-        # For depth > 1, traverse the graph further
-        if max_depth > 1:
-            current_level = list(related.keys())
-            for depth in range(1, max_depth):
-                next_level = []
-                for current_topic in current_level:
-                    if current_topic in self.associations:
-                        for related_topic, info in self.associations[current_topic].items():
-                            # Skip if already encountered to prevent cycles
-                            if related_topic not in related and related_topic != normalized_topic:
-                                path = related[current_topic]["path"] + [current_topic]
-                                related[related_topic] = {
-                                    "path": path,
-                                    "relation": info,
-                                    "depth": depth + 1
-                                }
-                                next_level.append(related_topic)
-                current_level = next_level
-                if not current_level:
-                    break  # No more connections to explore
+            # For depth > 1, traverse the graph further
+            if max_depth > 1:
+                current_level = list(related.keys())
+                for depth in range(1, max_depth):
+                    next_level = []
+                    for current_topic in current_level:
+                        if current_topic in self.associations:
+                            for related_topic, info in self.associations[current_topic].items():
+                                # Skip if already encountered to prevent cycles
+                                if related_topic not in related and related_topic != normalized_topic:
+                                    path = related[current_topic]["path"] + [current_topic]
+                                    related[related_topic] = {
+                                        "path": path,
+                                        "relation": info,
+                                        "depth": depth + 1
+                                    }
+                                    next_level.append(related_topic)
+                    current_level = next_level
+                    if not current_level:
+                        break  # No more connections to explore
                     
-        return related
+            return related
+
+    def find_common_associations(self, *topics: str) -> List[str]:
+        """
+        Finds concepts associated with every one of the given topics.
+        
+        Args:
+            *topics: Topics whose associations should be intersected
+            
+        Returns:
+            Sorted list of commonly associated topics
+        """
+        with self._lock:
+            neighbor_sets = []
+            for topic in topics:
+                neighbors = self.associations.get(topic.lower())
+                if not neighbors:
+                    return []
+                neighbor_sets.append(neighbors)
+            
+            if not neighbor_sets:
+                return []
+            
+            # Probe the smallest neighborhood against the others
+            neighbor_sets.sort(key=len)
+            common = set(neighbor_sets[0])
+            for neighbors in neighbor_sets[1:]:
+                common = {topic for topic in common if topic in neighbors}
+                if not common:
+                    break
+                
+            return sorted(common - {topic.lower() for topic in topics})
 
     def export(self) -> Dict[str, Any]:
         """
@@ -278,11 +572,12 @@ class SullyCodex:
         Returns:
             Dictionary containing all codex data
         """
-        return {
-            "entries": self.entries,
-            "terms": self.terms,
-            "associations": self.associations
-        }
+        with self._lock:
+            return {
+                "entries": self.entries,
+                "terms": self.terms,
+                "associations": self.associations
+            }
 
     def import_data(self, data: Dict[str, Any]) -> None:
         """
@@ -291,12 +586,16 @@ class SullyCodex:
         Args:
             data: Dictionary containing codex data (entries, terms, associations)
         """
-        if "entries" in data:
-            self.entries.update(data["entries"])
-        if "terms" in data:
-            self.terms.update(data["terms"])
-        if "associations" in data:
-            self.associations.update(data["associations"])
+        with self._lock:
+            if "entries" in data:
+                self.entries.update(data["entries"])
+            if "terms" in data:
+                self.terms.update(data["terms"])
+            if "associations" in data:
+                self.associations.update(data["associations"])
+            
+            # Rebuild the inverted indices for the imported entries
+            self._rebuild_indices()
 
     def __len__(self) -> int:
         """
@@ -334,12 +633,23 @@ class SullyCodex:
         word_counts = Counter(words)
         important_words = [word for word, count in word_counts.most_common(10) if count > 1]
         
+        # Find the first complete sentence containing each word, scanning
+        # the text once instead of searching it again for every word
+        contexts = {}
+        pending = set(important_words)
+        for sentence in re.finditer(r'[^.!?]*[.!?]', text):
+            if not pending:
+                break
+            found = pending.intersection(re.findall(r'\w+', sentence.group(0)))
+            for word in found:
+                contexts[word] = sentence.group(0).strip()
+            pending -= found
+        
         # Record these as potential concepts
         new_concepts = []
         for word in important_words:
             # Extract a context for this word
-            context_match = re.search(r'[^.!?]*\b' + re.escape(word) + r'\b[^.!?]*[.!?]', text)
-            context = context_match.group(0).strip() if context_match else ""
+            context = contexts.get(word, "")
             
             # Create a basic definition based on context
             definition = f"Concept extracted from text context: '{context}'"
@@ -192,11 +192,9 @@ class ConversationEngine:
         # Get related topics from codex for potential exploration
         related_topics = self._get_related_topics(new_topics)
         
-        # Generate the core response using the reasoning node
-        core_response = self.reasoning.reason(message, tone)
-        
-        # Store this interaction in memory
-        self.memory.store_query(message, core_response)
+        # Generate the core response using the reasoning node; the turn is
+        # stored in memory once, with the full conversational response
+        mode, core_response = self.reasoning.think(message, tone)
         
         # If the response is a string, convert to a workable format
         response_text = core_response
@@ -214,6 +212,7 @@ class ConversationEngine:
             continue_conversation
         )
         
+        self.reasoning.record_turn(message, core_response, mode, full_response)
         return full_response
 
     def _extract_topics(self, message: str) -> List[str]:
@@ -304,7 +303,7 @@ class ConversationEngine:
         for topic in topics:
             # Check for directly related topics in codex
             try:
-                concept_data = self.codex.search(topic)
+                concept_data = self.codex.search(topic, limit=5, semantic_limit=5)
                 if concept_data:
                     # Extract related concepts from search results
                     for concept_name, concept_info in concept_data.items():
@@ -348,8 +347,8 @@ class ConversationEngine:
             topic = question.get("topic", "that")
             question_text = question.get("question", "")
             
-            # Generate answer to previous question
-            answer = self.reasoning.reason(question_text, tone)
+            # Generate answer to previous question (stored as part of this turn)
+            answer = self.reasoning.reason(question_text, tone, store=False)
             if isinstance(answer, dict) and "response" in answer:
                 answer = answer["response"]
                 
@@ -457,6 +456,8 @@ class ConversationEngine:
         Returns:
             Elaboration text
         """
+        related_topics = self._get_related_topics([topic])
+        
         elaboration_types = list(self.elaboration_patterns.keys())
         elab_type = random.choice(elaboration_types)
         
@@ -466,11 +467,11 @@ class ConversationEngine:
         # Select a pattern
         pattern = random.choice(patterns)
         
-        # Generate content based on elaboration type
+        # Generate content based on elaboration type; it is stored as part of the turn
         if elab_type == "example":
             # Generate an example related to the topic
             example_query = f"Give a concrete example of {topic}"
-            example = self.reasoning.reason(example_query, tone if tone != "emergent" else "analytical")
+            example = self.reasoning.reason(example_query, tone if tone != "emergent" else "analytical", store=False)
             if isinstance(example, dict) and "response" in example:
                 example = example["response"]
                 
@@ -479,7 +480,7 @@ class ConversationEngine:
         elif elab_type == "detail":
             # Generate additional detail about the topic
             detail_query = f"Provide specific details about {topic}"
-            detail = self.reasoning.reason(detail_query, tone)
+            detail = self.reasoning.reason(detail_query, tone, store=False)
             if isinstance(detail, dict) and "response" in detail:
                 detail = detail["response"]
                 
@@ -488,7 +489,7 @@ class ConversationEngine:
         elif elab_type == "implication":
             # Generate implications of the topic
             implication_query = f"What are the implications of {topic}?"
-            implication = self.reasoning.reason(implication_query, tone if tone != "emergent" else "analytical")
+            implication = self.reasoning.reason(implication_query, tone if tone != "emergent" else "analytical", store=False)
             if isinstance(implication, dict) and "response" in implication:
                 implication = implication["response"]
                 
@@ -498,7 +499,7 @@ class ConversationEngine:
             # Generate contextual understanding
             context = "contemporary understanding" if not related_topics else related_topics[0]
             meaning_query = f"Explain {topic} in the context of {context}"
-            meaning = self.reasoning.reason(meaning_query, tone)
+            meaning = self.reasoning.reason(meaning_query, tone, store=False)
             if isinstance(meaning, dict) and "response" in meaning:
                 meaning = meaning["response"]
                 
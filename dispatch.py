@@ -0,0 +1,138 @@
+# sully_engine/dispatch.py
+# 🚦 Bounded dispatch of blocking engine work off the event loop
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable
+
+
+class RouteSaturated(Exception):
+    """Raised when a route already has as many calls running and queued as it allows."""
+
+    def __init__(self, route: str):
+        super().__init__(f"Route '{route}' is saturated")
+        self.route = route
+
+
+class _RouteLimit:
+    """Concurrency and queue-depth limits for one route."""
+
+    def __init__(self, max_concurrent: int, max_queued: int):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.in_flight = 0  # Running plus queued calls
+        self._semaphore = None  # Created on first use, inside the event loop
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+
+class EngineDispatcher:
+    """
+    Runs synchronous engine calls on a bounded worker pool so that async
+    request handlers never block the event loop.
+
+    Each route may run a limited number of calls at once and queue a limited
+    number more; beyond that, calls are rejected immediately with
+    RouteSaturated so the API can shed load instead of building unbounded
+    backlogs.
+    """
+
+    def __init__(self, max_workers: int = 8, default_concurrent: int = 4, default_queued: int = 16):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_workers: Size of the shared worker pool
+            default_concurrent: Concurrent calls allowed for unconfigured routes
+            default_queued: Queued calls allowed for unconfigured routes
+        """
+        self.max_workers = max_workers
+        self.default_concurrent = default_concurrent
+        self.default_queued = default_queued
+        self.routes = {}  # Route name -> _RouteLimit
+        self._executor = None
+
+    def configure(self, route: str, max_concurrent: int, max_queued: int) -> None:
+        """
+        Sets the limits for a route.
+
+        Args:
+            route: Route name
+            max_concurrent: Calls allowed to run at once
+            max_queued: Calls allowed to wait for a slot before rejecting
+        """
+        self.routes[route] = _RouteLimit(max(1, max_concurrent), max(0, max_queued))
+
+    def _route_limit(self, route: str) -> _RouteLimit:
+        """Returns the limits for a route, creating defaults on first use."""
+        if route not in self.routes:
+            self.configure(route, self.default_concurrent, self.default_queued)
+        return self.routes[route]
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The shared worker pool, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="sully-engine")
+        return self._executor
+
+    async def run(self, route: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs a blocking call on the worker pool under the route's limits.
+
+        Args:
+            route: Route name the call is accounted against
+            func: Synchronous callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            RouteSaturated: If the route's running and queued calls are at capacity
+        """
+        limit = self._route_limit(route)
+        if limit.in_flight >= limit.max_concurrent + limit.max_queued:
+            raise RouteSaturated(route)
+
+        limit.in_flight += 1
+        try:
+            async with limit.semaphore:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+        finally:
+            limit.in_flight -= 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Reports per-route load.
+
+        Returns:
+            Dictionary of route -> limits and calls in flight
+        """
+        return {
+            route: {
+                "in_flight": limit.in_flight,
+                "max_concurrent": limit.max_concurrent,
+                "max_queued": limit.max_queued
+            }
+            for route, limit in self.routes.items()
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the worker pool.
+
+        Args:
+            wait: Whether to wait for running calls to finish
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -0,0 +1,297 @@
+# sully_engine/document_store.py
+# 📚 Indexed local store for ingested documents
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterator
+
+
+class DocumentStore:
+    """
+    SQLite-backed store of ingested document text.
+
+    Each document is one row, so adding a document costs O(document) rather
+    than rewriting every document ever ingested, and a crash can at worst lose
+    the write in progress. Documents can be looked up by path or by content
+    hash and iterated in batches without loading the whole store.
+    """
+
+    def __init__(self, db_path: str = "sully_documents.db", legacy_json: Optional[str] = None):
+        """
+        Open (or create) the store.
+
+        Args:
+            db_path: Path of the SQLite database
+            legacy_json: Optional path of a {path: content} JSON file to import once
+        """
+        self.db_path = db_path
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT NOT NULL UNIQUE,
+                    content_hash TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    ingested TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS documents_content_hash ON documents (content_hash);
+                CREATE TABLE IF NOT EXISTS chunks (
+                    path TEXT NOT NULL,
+                    chunk_index INTEGER NOT NULL,
+                    section TEXT,
+                    first_page INTEGER,
+                    last_page INTEGER,
+                    content TEXT NOT NULL,
+                    PRIMARY KEY (path, chunk_index)
+                );
+                CREATE TABLE IF NOT EXISTS migrations (
+                    source TEXT PRIMARY KEY,
+                    migrated TEXT NOT NULL,
+                    documents INTEGER NOT NULL
+                );
+            """)
+            self._conn.commit()
+
+        if legacy_json:
+            self.migrate_json(legacy_json)
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """Returns the hex SHA-256 of a document's text."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def put(self, path: str, content: str, content_hash: Optional[str] = None,
+            size: Optional[int] = None) -> int:
+        """
+        Stores a document, replacing any earlier version at the same path.
+
+        Args:
+            path: Source path of the document
+            content: Extracted document text ("" when stored as chunks)
+            content_hash: Hash of the full text, if computed by the caller
+            size: Length of the full text, if computed by the caller
+
+        Returns:
+            Row id of the stored document
+        """
+        if content_hash is None:
+            content_hash = self.content_hash(content)
+        if size is None:
+            size = len(content)
+
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO documents (path, content_hash, content, size, ingested)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    content = excluded.content,
+                    size = excluded.size,
+                    ingested = excluded.ingested
+                """,
+                (path, content_hash, content, size, datetime.now().isoformat())
+            )
+            self._conn.commit()
+            row = self._conn.execute("SELECT id FROM documents WHERE path = ?", (path,)).fetchone()
+            return row["id"] if row else cursor.lastrowid
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a document by path.
+
+        Args:
+            path: Source path of the document
+
+        Returns:
+            Document record, or None if absent
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM documents WHERE path = ?", (path,)).fetchone()
+        return dict(row) if row else None
+
+    def get_by_hash(self, content_hash: str) -> List[Dict[str, Any]]:
+        """
+        Looks up documents by content hash.
+
+        Args:
+            content_hash: Hex SHA-256 of the document text
+
+        Returns:
+            All documents with that content
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM documents WHERE content_hash = ? ORDER BY id", (content_hash,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_documents(self, batch_size: int = 100, include_content: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Streams documents in ingestion order, a batch at a time.
+
+        Args:
+            batch_size: Rows fetched per query
+            include_content: Whether to load document text
+
+        Returns:
+            Iterator of document records
+        """
+        columns = "*" if include_content else "id, path, content_hash, size, ingested"
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {columns} FROM documents WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+            last_id = rows[-1]["id"]
+
+    def put_chunks(self, path: str, chunks: List[Dict[str, Any]], first_index: int = 0) -> None:
+        """
+        Stores consecutive chunks of a document.
+
+        Args:
+            path: Source path of the document
+            chunks: Chunk dictionaries with text, section and page range
+            first_index: Index of the first chunk within the document
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO chunks (path, chunk_index, section, first_page, last_page, content) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (path, first_index + i, chunk.get("section"), chunk.get("first_page"),
+                         chunk.get("last_page"), chunk["text"])
+                        for i, chunk in enumerate(chunks)
+                    ]
+                )
+
+    def clear_chunks(self, path: str) -> None:
+        """
+        Removes the stored chunks of a document.
+
+        Args:
+            path: Source path of the document
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM chunks WHERE path = ?", (path,))
+
+    def iter_chunks(self, path: str, batch_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the chunks of a document in order.
+
+        Args:
+            path: Source path of the document
+            batch_size: Rows fetched per query
+
+        Returns:
+            Iterator of chunk records
+        """
+        last_index = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT * FROM chunks WHERE path = ? AND chunk_index > ? ORDER BY chunk_index LIMIT ?",
+                    (path, last_index, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+            last_index = rows[-1]["chunk_index"]
+
+    def delete(self, path: str) -> bool:
+        """
+        Removes a document.
+
+        Args:
+            path: Source path of the document
+
+        Returns:
+            Whether a document was removed
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM documents WHERE path = ?", (path,))
+            self._conn.execute("DELETE FROM chunks WHERE path = ?", (path,))
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def migrate_json(self, json_path: str) -> int:
+        """
+        Imports a legacy {path: content} JSON file once.
+
+        The JSON file is left in place; its import is recorded so it is not
+        repeated on later starts.
+
+        Args:
+            json_path: Path of the legacy JSON file
+
+        Returns:
+            Number of documents imported (0 if already migrated or absent)
+        """
+        source = os.path.abspath(json_path)
+        if not os.path.exists(json_path):
+            return 0
+
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM migrations WHERE source = ?", (source,)).fetchone():
+                return 0
+
+            try:
+                with open(json_path, "r", encoding="utf-8") as f:
+                    legacy = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Could not migrate {json_path}: {e}")
+                return 0
+
+            now = datetime.now().isoformat()
+            documents = [
+                (path, self.content_hash(content), content, len(content), now)
+                for path, content in legacy.items()
+                if isinstance(content, str)
+            ]
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO documents (path, content_hash, content, size, ingested) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    documents
+                )
+                self._conn.execute(
+                    "INSERT INTO migrations (source, migrated, documents) VALUES (?, ?, ?)",
+                    (source, now, len(documents))
+                )
+            return len(documents)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def __contains__(self, path: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM documents WHERE path = ?", (path,)).fetchone() is not None
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._conn.close()
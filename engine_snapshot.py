@@ -0,0 +1,155 @@
+# sully_engine/engine_snapshot.py
+# 🧊 Opt-in pre-warmed snapshot of the static engine tables
+
+import hashlib
+import importlib.util
+import os
+import pickle
+import sys
+from typing import Dict, Any, Optional
+
+from math_translator import SymbolicMathTranslator
+from dream import DreamCore
+from paradox import ParadoxLibrary
+from fusion import SymbolFusionEngine
+
+# Modules whose source defines the snapshotted tables
+SNAPSHOT_MODULES = ("math_translator", "dream", "paradox", "fusion")
+
+# Engines whose runtime state is journaled to a data path
+PERSISTENT_ENGINES = ("paradox", "fusion")
+
+
+def source_signature() -> str:
+    """
+    Fingerprints the code that builds the static tables.
+
+    A snapshot is only reused while the Python version and the source of
+    every snapshotted module are unchanged.
+
+    Returns:
+        Hex SHA-256 fingerprint
+    """
+    digest = hashlib.sha256(sys.version.encode("utf-8"))
+    for module in SNAPSHOT_MODULES:
+        with open(importlib.util.find_spec(module).origin, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def open_data_paths(engines: Dict[str, Any], data_paths: Optional[Dict[str, str]]) -> None:
+    """
+    Reloads journaled engine state and keeps journaling changes to it.
+
+    Args:
+        engines: Dictionary of engine name -> instance
+        data_paths: Optional dictionary of engine name -> snapshot path
+    """
+    for name, data_path in (data_paths or {}).items():
+        if data_path and name in PERSISTENT_ENGINES:
+            engines[name].open_record_log(data_path)
+
+
+def build_engines(warm: bool = False, data_paths: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Constructs the engines that hold large static tables.
+
+    Args:
+        warm: Whether to precompile the translator's phrase matchers for every domain
+        data_paths: Optional dictionary of engine name -> snapshot path for
+            the engines whose state is journaled
+
+    Returns:
+        Dictionary of engine name -> instance
+    """
+    engines = {
+        "translator": SymbolicMathTranslator(),
+        "dream_core": DreamCore(),
+        "paradox": ParadoxLibrary(),
+        "fusion": SymbolFusionEngine()
+    }
+
+    if warm:
+        translator = engines["translator"]
+        translator._get_compiled_mappings(None)
+        for domain in translator.domain_notations:
+            translator._get_compiled_mappings(domain)
+
+    open_data_paths(engines, data_paths)
+    return engines
+
+
+def load_engines(snapshot_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Loads engines from a snapshot written by save_engines().
+
+    Snapshots are pickles, so only load files this deployment wrote itself.
+
+    Args:
+        snapshot_path: Path of the snapshot file
+
+    Returns:
+        Dictionary of engine name -> instance, or None if the snapshot is
+        missing, unreadable or stale
+    """
+    if not os.path.exists(snapshot_path):
+        return None
+
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        print(f"Ignoring unreadable engine snapshot {snapshot_path}: {e}")
+        return None
+
+    if snapshot.get("signature") != source_signature():
+        return None
+    return snapshot["engines"]
+
+
+def save_engines(snapshot_path: str, engines: Dict[str, Any]) -> None:
+    """
+    Writes engines to a snapshot atomically.
+
+    Args:
+        snapshot_path: Path of the snapshot file
+        engines: Dictionary of engine name -> instance
+    """
+    temp_path = f"{snapshot_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(snapshot_path)), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            pickle.dump({"signature": source_signature(), "engines": engines}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, snapshot_path)
+    except Exception as e:
+        print(f"Could not write engine snapshot {snapshot_path}: {e}")
+
+
+def load_or_build_engines(snapshot_path: Optional[str] = None,
+                          data_paths: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Returns the static engines, from a snapshot when one is configured.
+
+    Without a snapshot path the engines are simply constructed. With one,
+    a valid snapshot is loaded; otherwise the engines are built, pre-warmed
+    and written to the snapshot for the next start. Journaled state is never
+    part of the snapshot: it is reloaded from the data paths afterwards.
+
+    Args:
+        snapshot_path: Optional path of the snapshot file
+        data_paths: Optional dictionary of engine name -> snapshot path for
+            the engines whose state is journaled
+
+    Returns:
+        Dictionary of engine name -> instance
+    """
+    if not snapshot_path:
+        return build_engines(data_paths=data_paths)
+
+    engines = load_engines(snapshot_path)
+    if engines is None:
+        engines = build_engines(warm=True)
+        save_engines(snapshot_path, engines)
+    open_data_paths(engines, data_paths)
+    return engines
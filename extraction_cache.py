@@ -0,0 +1,148 @@
+# sully_engine/extraction_cache.py
+# 🗃️ Content-addressed cache of extracted document text
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Any, Optional
+
+from journal import atomic_write_json
+
+
+class ExtractionCache:
+    """
+    Disk cache of document extraction results keyed by file content.
+
+    Keys combine a SHA-256 of the file's bytes with the extractor options
+    (DPI, OCR language, ...), so re-uploading identical bytes under any name
+    reuses the earlier extraction, while changed options extract afresh.
+    Entries are JSON files; once the cache exceeds its size budget, the least
+    recently used entries (by modification time, refreshed on every hit) are
+    evicted.
+    """
+
+    def __init__(self, cache_dir: str = ".sully_cache/extractions",
+                 max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Size budget for all entries combined
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes = sum(
+            entry.stat().st_size for entry in os.scandir(cache_dir)
+            if entry.name.endswith(".json")
+        )
+
+    @staticmethod
+    def file_digest(file_path: str) -> str:
+        """
+        Hashes a file's contents.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex SHA-256 digest of the file's bytes
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def key(self, file_path: str, options: Dict[str, Any]) -> str:
+        """
+        Builds the cache key for a file extracted with the given options.
+
+        Args:
+            file_path: Path to the file
+            options: Extractor options that affect the output
+
+        Returns:
+            Hex cache key
+        """
+        material = self.file_digest(file_path) + json.dumps(options, sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a cached extraction.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            The cached extraction, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)  # Mark as recently used
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Discarding unreadable extraction cache entry {key}: {e}")
+            self._remove(path)
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Stores an extraction, evicting old entries if over budget.
+
+        Args:
+            key: Cache key from key()
+            value: JSON-serializable extraction result
+        """
+        path = self._entry_path(key)
+        try:
+            previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+            atomic_write_json(path, value)
+            size = os.path.getsize(path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Failed to cache extraction {key}: {e}")
+            return
+
+        with self._lock:
+            self.total_bytes += size - previous_size
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Removes least recently used entries until the cache fits its budget."""
+        entries = sorted(
+            (entry for entry in os.scandir(self.cache_dir) if entry.name.endswith(".json")),
+            key=lambda entry: entry.stat().st_mtime
+        )
+        self.total_bytes = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if self.total_bytes <= self.max_bytes:
+                break
+            self.total_bytes -= entry.stat().st_size
+            self._remove(entry.path)
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Removes every cache entry."""
+        with self._lock:
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".json"):
+                    self._remove(entry.path)
+            self.total_bytes = 0
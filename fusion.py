@@ -1,12 +1,60 @@
 # sully_engine/kernel_modules/fusion.py
 # 🔗 Symbol Fusion Engine — Synthesize new meaning from multiple concepts
 
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterator, Iterable
+from collections import deque, OrderedDict
+import copy
+import heapq
 import random
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 import re
+import threading
+
+from journal import RecordLog
+from versioned import VersionedDict, VersionedList
+
+# Heuristics for concepts missing from the category tables
+_ABSTRACT_SUFFIXES = ("ness", "ity", "ion", "ism", "dom")
+_ABSTRACT_STEMS = ("truth", "idea", "concept", "theory")
+
+
+class _CategoryIndex:
+    """
+    Hash lookups compiled from the concept category tables: concept sets per
+    category and order-insensitive concept pairs.
+    """
+    def __init__(self, categories: VersionedDict, overrides: VersionedDict):
+        """
+        Compile the category tables.
+        
+        Args:
+            categories: The engine's concept_categories tables
+            overrides: The engine's category overrides, whose edits also
+                invalidate cached categorizations
+        """
+        self.sources = (categories, overrides)
+        self.versions = self._versions(categories, overrides)
+        self.abstract = frozenset(concept.lower() for concept in categories.get("abstract", []))
+        self.concrete = frozenset(concept.lower() for concept in categories.get("concrete", []))
+        self.opposing_pairs = frozenset(
+            frozenset(concept.lower() for concept in pair) for pair in categories.get("opposing_pairs", [])
+        )
+        self.complementary_pairs = frozenset(
+            frozenset(concept.lower() for concept in pair) for pair in categories.get("complementary_pairs", [])
+        )
+        
+    @staticmethod
+    def _versions(categories: VersionedDict, overrides: VersionedDict) -> Tuple[int, ...]:
+        """Edit counts of the tables, their lists and the overrides."""
+        return (categories.version, overrides.version) + tuple(values.version for values in categories.values())
+        
+    def is_current(self, categories: VersionedDict, overrides: VersionedDict) -> bool:
+        """Whether the given tables are the compiled ones, unedited since."""
+        return (self.sources[0] is categories and self.sources[1] is overrides and
+                self.versions == self._versions(categories, overrides))
+
 
 class SymbolFusionEngine:
     """
@@ -16,12 +64,23 @@ class SymbolFusionEngine:
     network tracking, and different cognitive modes for concept integration.
     """
 
-    def __init__(self, fusion_library_path: Optional[str] = None):
+    def __init__(self, fusion_library_path: Optional[str] = None, max_history: int = 10000,
+                 history_archive_path: Optional[str] = None, max_history_age: Optional[float] = None,
+                 data_path: Optional[str] = None, compact_every: int = 1000,
+                 category_cache_size: int = 4096):
         """
         Initialize the fusion engine with configurable options.
         
         Args:
             fusion_library_path: Optional path to a JSON file with additional fusion patterns
+            max_history: Fusion records retained in memory
+            history_archive_path: Optional JSON-lines file that receives records
+                leaving memory (they are discarded otherwise)
+            max_history_age: Optional age in seconds after which records leave memory
+            data_path: Optional snapshot path; when set, every fusion and added
+                style is journaled as it happens and the state is reloaded from it
+            compact_every: Journaled changes that trigger snapshot compaction
+            category_cache_size: Concept categorizations kept in the LRU cache
         """
         # Default fusion style
         self.default_style = "entanglement"
@@ -198,10 +257,36 @@ class SymbolFusionEngine:
                 ("cause", "effect"), ("form", "function"), ("structure", "process")
             ]
         }
+        # The tables count their edits, so the compiled index knows when to rebuild
+        self.concept_categories = VersionedDict(
+            (name, VersionedList(values)) for name, values in self.concept_categories.items()
+        )
+        
+        # Guards the history, concept network and caches against concurrent fusions
+        self._lock = threading.RLock()
         
-        # For tracking concept networks and fusion history
-        self.fusion_history = []
-        self.concept_network = {}
+        # Categories set explicitly with set_concept_category(), and a bounded
+        # cache of recent categorizations. The tables are compiled into hash
+        # sets on first use; anything else is categorized by heuristics.
+        self.category_overrides = VersionedDict()
+        self.category_cache_size = category_cache_size
+        self._category_cache = OrderedDict()
+        self._compiled_categories = None
+        
+        # For tracking fusion history: each fusion is recorded once, with a
+        # sequential id. Only recent records stay in memory; older ones are
+        # appended to the archive, if configured, in batches.
+        self.max_history = max(1, max_history)
+        self.max_history_age = max_history_age
+        self.history_archive_path = history_archive_path
+        self.fusion_history = deque()
+        self._archived_through = self._last_archived_id()
+        self.next_fusion_id = self._archived_through + 1
+        
+        # For tracking the concept network: concepts are interned to integer
+        # ids and connections keep counts plus the ids of recent fusions
+        self.max_edge_events = 5
+        self._reset_concept_network()
         
         # Load additional fusion patterns if provided
         self.custom_patterns = {}
@@ -215,6 +300,39 @@ class SymbolFusionEngine:
                         self.fusion_styles.update(custom_data["styles"])
             except Exception as e:
                 print(f"Error loading fusion library: {e}")
+                
+        # Incremental persistence: a snapshot plus a journal of changes since
+        self.record_log = None
+        if data_path:
+            self.open_record_log(data_path, compact_every)
+
+    def open_record_log(self, data_path: str, compact_every: int = 1000) -> None:
+        """
+        Reloads the engine's state from a snapshot path and journals every
+        later fusion and added style to it. Call on a freshly built engine.
+        
+        Args:
+            data_path: Snapshot path (its journal sits beside it)
+            compact_every: Journaled changes that trigger snapshot compaction
+        """
+        with self._lock:
+            self.record_log = RecordLog(data_path, compact_every=compact_every)
+            self._load_records()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickles the engine without its lock or record log; a restored engine
+        journals again only once open_record_log() is called.
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["record_log"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores a pickled engine with a fresh lock."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
 
     def fuse(self, *symbols: str) -> Union[Dict[str, Any], str]:
         """
@@ -263,8 +381,9 @@ class SymbolFusionEngine:
         style_connectors = style_info["connectors"]
         
         # Categorize concepts for appropriate fusion patterns
-        concept_types = self._categorize_concepts(symbols)
-        pattern_key = self._determine_pattern_key(concept_types)
+        with self._lock:
+            concept_types = self._categorize_concepts(symbols)
+            pattern_key = self._determine_pattern_key(concept_types, symbols)
         
         # Select appropriate patterns
         if cognitive_mode and cognitive_mode in self.cognitive_modes:
@@ -304,19 +423,24 @@ class SymbolFusionEngine:
         formal_fusion = f"{' ' + style_operator + ' '.join(symbols)}"
         
         # Add to fusion history and concept network
-        fusion_record = {
-            "timestamp": datetime.now().isoformat(),
-            "inputs": list(symbols),
-            "style": fusion_style,
-            "cognitive_mode": cognitive_mode,
-            "result": fusion_result,
-            "formatted_result": formatted_result,
-            "formal_representation": formal_fusion
-        }
-        self.fusion_history.append(fusion_record)
-        
-        # Update concept network
-        self._update_concept_network(symbols, fusion_result, fusion_style)
+        with self._lock:
+            fusion_record = {
+                "id": self.next_fusion_id,
+                "timestamp": datetime.now().isoformat(),
+                "inputs": list(symbols),
+                "style": fusion_style,
+                "cognitive_mode": cognitive_mode,
+                "result": fusion_result,
+                "formatted_result": formatted_result,
+                "formal_representation": formal_fusion
+            }
+            self.fusion_history.append(fusion_record)
+            self.next_fusion_id += 1
+            self._enforce_history_retention()
+            
+            # Update concept network
+            self._update_concept_network(symbols, fusion_record["id"], fusion_record["timestamp"])
+            self._log_change({"op": "fusion", "record": fusion_record})
         
         # Return appropriate format
         if output_format == "string":
@@ -354,60 +478,175 @@ class SymbolFusionEngine:
             "comment": result["comment"]
         }
 
-    def _categorize_concepts(self, concepts: Tuple[str, ...]) -> List[str]:
+    def _category_index(self) -> _CategoryIndex:
         """
-        Categorizes input concepts as abstract, concrete, etc.
+        Returns the category tables compiled into hash sets.
+        
+        Returns:
+            Compiled category index, rebuilt (and the cache cleared) if the
+            tables or the overrides changed
+        """
+        # Tables assigned from outside are wrapped so their edits are counted
+        if not isinstance(self.concept_categories, VersionedDict):
+            self.concept_categories = VersionedDict(self.concept_categories)
+        for name, values in list(self.concept_categories.items()):
+            if not isinstance(values, VersionedList):
+                self.concept_categories[name] = VersionedList(values)
+        if not isinstance(self.category_overrides, VersionedDict):
+            self.category_overrides = VersionedDict(self.category_overrides)
+            
+        compiled = self._compiled_categories
+        if compiled is None or not compiled.is_current(self.concept_categories, self.category_overrides):
+            self._compiled_categories = _CategoryIndex(self.concept_categories, self.category_overrides)
+            self._category_cache.clear()
+        return self._compiled_categories
+
+    @staticmethod
+    def _guess_category(concept_lower: str) -> str:
+        """Guesses the category of a concept missing from the tables."""
+        if concept_lower.endswith(_ABSTRACT_SUFFIXES):
+            return "abstract"
+            
+        # Default categorization heuristic
+        abstract_score = 0
+        if len(concept_lower) >= 6:
+            abstract_score += 1  # Longer words tend to be more abstract
+        if any(stem in concept_lower for stem in _ABSTRACT_STEMS):
+            abstract_score += 2
+            
+        return "abstract" if abstract_score >= 1 else "concrete"
+
+    def _lookup_category(self, concept_lower: str, index: _CategoryIndex) -> str:
+        """Categorizes a lowercased concept without the cache."""
+        override = self.category_overrides.get(concept_lower)
+        if override:
+            return override
+            
+        # Check for known categories
+        if concept_lower in index.abstract:
+            return "abstract"
+        if concept_lower in index.concrete:
+            return "concrete"
+        return self._guess_category(concept_lower)
+
+    def categorize_concept(self, concept: str) -> str:
+        """
+        Categorizes a concept as abstract or concrete.
+        
+        Answers are memoized in a bounded least-recently-used cache.
+        
+        Args:
+            concept: The concept to categorize
+            
+        Returns:
+            "abstract" or "concrete"
+        """
+        with self._lock:
+            index = self._category_index()
+            key = concept.lower()
+            
+            category = self._category_cache.get(key)
+            if category is not None:
+                self._category_cache.move_to_end(key)
+                return category
+                
+            category = self._lookup_category(key, index)
+            self._category_cache[key] = category
+            if len(self._category_cache) > self.category_cache_size:
+                self._category_cache.popitem(last=False)
+            return category
+
+    def categorize_batch(self, concepts: Iterable[str]) -> Dict[str, str]:
+        """
+        Categorizes many concepts at once.
+        
+        The category index is resolved once, and the cache is read but not
+        filled, so a bulk pass does not evict recently fused concepts.
         
         Args:
             concepts: The concepts to categorize
             
         Returns:
-            List of category labels for each concept
+            Dictionary of concept -> "abstract" or "concrete"
         """
-        categories = []
+        with self._lock:
+            index = self._category_index()
+            categories = {}
+            
+            for concept in concepts:
+                if concept in categories:
+                    continue
+                key = concept.lower()
+                category = self._category_cache.get(key)
+                if category is None:
+                    category = self._lookup_category(key, index)
+                categories[concept] = category
+                
+            return categories
+
+    def categorize_codex(self, codex: Any) -> Dict[str, str]:
+        """
+        Categorizes every topic in a codex.
         
-        for concept in concepts:
-            concept_lower = concept.lower()
+        Args:
+            codex: A SullyCodex (or anything with list_topics())
             
-            # Check for known categories
-            if concept_lower in self.concept_categories["abstract"]:
-                categories.append("abstract")
-            elif concept_lower in self.concept_categories["concrete"]:
-                categories.append("concrete")
-            else:
-                # Attempt to guess based on characteristics
-                if any(concept_lower.endswith(suffix) for suffix in ["ness", "ity", "ion", "ism", "dom"]):
-                    categories.append("abstract")
-                elif len(concept_lower) > 3 and concept_lower[0].isupper():
-                    categories.append("concrete")  # Proper nouns often concrete
-                else:
-                    # Default categorization heuristic
-                    abstract_score = 0
-                    if len(concept_lower) >= 6:
-                        abstract_score += 1  # Longer words tend to be more abstract
-                    if any(a in concept_lower for a in ["truth", "idea", "concept", "theory"]):
-                        abstract_score += 2
-                    
-                    categories.append("abstract" if abstract_score >= 1 else "concrete")
+        Returns:
+            Dictionary of topic -> "abstract" or "concrete"
+        """
+        return self.categorize_batch(codex.list_topics())
+
+    def set_concept_category(self, concept: str, category: str) -> str:
+        """
+        Overrides the category of a concept. Overrides are persisted with the
+        engine's data; other concepts are categorized on demand.
+        
+        Args:
+            concept: The concept
+            category: "abstract" or "concrete"
+            
+        Returns:
+            Confirmation message
+        """
+        with self._lock:
+            if category not in ("abstract", "concrete"):
+                return f"Unknown concept category '{category}'."
+                
+            key = concept.lower()
+            self.category_overrides[key] = category
+            self._log_change({"op": "category", "concept": key, "category": category})
+            return f"Concept '{concept}' categorized as {category}."
+
+    def _categorize_concepts(self, concepts: Tuple[str, ...]) -> List[str]:
+        """
+        Categorizes input concepts as abstract, concrete, etc.
         
-        return categories
+        Args:
+            concepts: The concepts to categorize
+            
+        Returns:
+            List of category labels for each concept
+        """
+        return [self.categorize_concept(concept) for concept in concepts]
 
-    def _determine_pattern_key(self, categories: List[str]) -> str:
+    def _determine_pattern_key(self, categories: List[str], concepts: Optional[Tuple[str, ...]] = None) -> str:
         """
         Determines the appropriate pattern key based on concept categories.
         
         Args:
             categories: List of concept categories
+            concepts: The concepts themselves, checked against the known pairs
             
         Returns:
             Pattern key for fusion
         """
-        # Check for opposing concepts
-        if len(categories) == 2:
-            concept_pair = tuple(categories)
-            if concept_pair in self.concept_categories["opposing_pairs"]:
+        # Check for opposing or complementary concepts, in either order
+        if concepts is not None and len(concepts) == 2:
+            index = self._category_index()
+            concept_pair = frozenset(concept.lower() for concept in concepts)
+            if concept_pair in index.opposing_pairs:
                 return "opposing_concepts"
-            if concept_pair in self.concept_categories["complementary_pairs"]:
+            if concept_pair in index.complementary_pairs:
                 return "complementary_concepts"
                 
         # Check category combinations
@@ -453,48 +692,188 @@ class SymbolFusionEngine:
         else:
             return f"{property_description} born from the interaction of diverse elements"
 
-    def _update_concept_network(self, symbols: Tuple[str, ...], result: str, style: str) -> None:
+    def _reset_concept_network(self) -> None:
+        """Clears the concept network."""
+        self.concept_ids = {}              # Concept -> id
+        self.concept_names = []            # Id -> concept
+        self.concept_fusion_counts = []    # Id -> fusions involving the concept
+        self.concept_first_seen = []       # Id -> when the concept was first fused
+        self.concept_edges = []            # Id -> {connected id: fusions together}
+        self.edge_events = {}              # (lower id, higher id) -> recent fusion ids
+
+    def _intern_concept(self, concept: str, first_seen: Optional[str] = None) -> int:
+        """
+        Returns a concept's id, adding the concept to the network if needed.
+        
+        Args:
+            concept: The concept
+            first_seen: When the concept was first fused (defaults to now)
+            
+        Returns:
+            The concept's integer id
+        """
+        concept_id = self.concept_ids.get(concept)
+        if concept_id is None:
+            concept_id = len(self.concept_names)
+            self.concept_ids[concept] = concept_id
+            self.concept_names.append(concept)
+            self.concept_fusion_counts.append(0)
+            self.concept_first_seen.append(first_seen or datetime.now().isoformat())
+            self.concept_edges.append({})
+        return concept_id
+
+    def _update_concept_network(self, symbols: Tuple[str, ...], fusion_id: int,
+                                timestamp: Optional[str] = None) -> None:
         """
         Updates the internal concept network with new relationships.
         
         Args:
             symbols: The concepts being fused
-            result: The fusion result
-            style: The fusion style
+            fusion_id: Id of the fusion record in the history
+            timestamp: When the fusion happened (defaults to now)
         """
         # Add all concepts to the network if not present
+        concept_ids = []
         for symbol in symbols:
-            if symbol not in self.concept_network:
-                self.concept_network[symbol] = {
-                    "connections": {},
-                    "fusion_count": 0,
-                    "first_seen": datetime.now().isoformat()
-                }
+            concept_id = self._intern_concept(symbol, timestamp)
             
             # Increment fusion count
-            self.concept_network[symbol]["fusion_count"] += 1
+            self.concept_fusion_counts[concept_id] += 1
+            if concept_id not in concept_ids:
+                concept_ids.append(concept_id)
         
         # Add connections between all pairs
-        for i, symbol1 in enumerate(symbols):
-            for symbol2 in symbols[i+1:]:
-                # Add relationship in both directions
-                if symbol2 not in self.concept_network[symbol1]["connections"]:
-                    self.concept_network[symbol1]["connections"][symbol2] = []
-                if symbol1 not in self.concept_network[symbol2]["connections"]:
-                    self.concept_network[symbol2]["connections"][symbol1] = []
+        for i, id1 in enumerate(concept_ids):
+            for id2 in concept_ids[i+1:]:
+                # Count the connection in both directions
+                self.concept_edges[id1][id2] = self.concept_edges[id1].get(id2, 0) + 1
+                self.concept_edges[id2][id1] = self.concept_edges[id2].get(id1, 0) + 1
                 
-                # Record this fusion
-                fusion_info = {
-                    "style": style,
-                    "result": result,
-                    "timestamp": datetime.now().isoformat()
-                }
-                self.concept_network[symbol1]["connections"][symbol2].append(fusion_info)
-                self.concept_network[symbol2]["connections"][symbol1].append(fusion_info)
+                # Reference this fusion once per pair
+                events = self.edge_events.setdefault((min(id1, id2), max(id1, id2)), [])
+                events.append(fusion_id)
+                if len(events) > self.max_edge_events:
+                    del events[0]
+
+    def _get_fusion_record(self, fusion_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a fusion record by id.
+        
+        Args:
+            fusion_id: Id of the fusion
+            
+        Returns:
+            The fusion record, or None if it has left the history
+        """
+        if not self.fusion_history:
+            return None
+        position = fusion_id - self.fusion_history[0]["id"]
+        if 0 <= position < len(self.fusion_history):
+            return self.fusion_history[position]
+        return None
+
+    def _enforce_history_retention(self) -> None:
+        """Moves records beyond the history's capacity or age out of memory."""
+        expired = 0
+        if self.max_history_age is not None:
+            cutoff = (datetime.now() - timedelta(seconds=self.max_history_age)).isoformat()
+            for record in self.fusion_history:
+                if record["timestamp"] >= cutoff:
+                    break
+                expired += 1
+                
+        overflow = len(self.fusion_history) - self.max_history
+        if overflow > 0:
+            # Spill a tenth of the capacity at once so the archive is written in batches
+            overflow = max(overflow, min(len(self.fusion_history), self.max_history // 10))
+            
+        count = max(expired, overflow)
+        if count > 0:
+            self._archive_history([self.fusion_history.popleft() for _ in range(count)])
+
+    def _archive_history(self, records: List[Dict[str, Any]]) -> None:
+        """Appends records leaving memory to the history archive, if configured."""
+        # Records replayed from the journal may already be archived
+        records = [record for record in records if record["id"] > self._archived_through]
+        if not self.history_archive_path or not records:
+            return
+        try:
+            with open(self.history_archive_path, 'a', encoding='utf-8') as f:
+                f.write("".join(json.dumps(record) + "\n" for record in records))
+            self._archived_through = records[-1]["id"]
+        except Exception as e:
+            print(f"Error archiving fusion history: {e}")
+
+    def _last_archived_id(self) -> int:
+        """Returns the id of the newest archived record, or -1 if there is none."""
+        if not self.history_archive_path or not os.path.exists(self.history_archive_path):
+            return -1
+        try:
+            with open(self.history_archive_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 65536))
+                lines = [line for line in f.read().splitlines() if line.strip()]
+            return json.loads(lines[-1])["id"] if lines else -1
+        except Exception as e:
+            print(f"Error reading fusion history archive: {e}")
+            return -1
+
+    def iter_fusion_history(self, start: Optional[Union[datetime, str]] = None,
+                            end: Optional[Union[datetime, str]] = None,
+                            concept: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Streams fusion records, oldest first, from the archive and then memory.
+        
+        The archive is read line by line, so queries never load it whole.
+        
+        Args:
+            start: Optional earliest timestamp (inclusive)
+            end: Optional latest timestamp (inclusive)
+            concept: Optional concept that must be among the fusion inputs
+            
+        Returns:
+            Iterator of matching fusion records
+        """
+        start = start.isoformat() if isinstance(start, datetime) else start
+        end = end.isoformat() if isinstance(end, datetime) else end
+        
+        def matches(record):
+            if start and record["timestamp"] < start:
+                return False
+            if end and record["timestamp"] > end:
+                return False
+            return not concept or concept in record["inputs"]
+        
+        with self._lock:
+            in_memory = list(self.fusion_history)
+            first_in_memory = in_memory[0]["id"] if in_memory else self.next_fusion_id
+        
+        if self.history_archive_path and os.path.exists(self.history_archive_path):
+            # Skip decoding lines that cannot mention the concept
+            needle = json.dumps(concept)[1:-1] if concept else None
+            with open(self.history_archive_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip() or (needle and needle not in line):
+                        continue
+                    record = json.loads(line)
+                    if record["id"] >= first_in_memory:
+                        break
+                    if end and record["timestamp"] > end:
+                        return
+                    if matches(record):
+                        yield record
+                        
+        for record in in_memory:
+            if end and record["timestamp"] > end:
+                return
+            if matches(record):
+                yield record
 
     def get_fusion_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Returns the history of fusion operations.
+        Returns the history of fusion operations held in memory.
+        
+        Use iter_fusion_history() to include archived records.
         
         Args:
             limit: Optional limit on number of records to return
@@ -502,20 +881,42 @@ class SymbolFusionEngine:
         Returns:
             List of fusion records
         """
-        if limit:
-            return self.fusion_history[-limit:]
-        return self.fusion_history
+        with self._lock:
+            history = list(self.fusion_history)
+            if limit:
+                return history[-limit:]
+            return history
 
-    def get_concept_network(self) -> Dict[str, Any]:
+    def get_concept_network(self, include_events: bool = False) -> Dict[str, Any]:
         """
         Returns the current concept network.
         
+        Concepts are listed once; connections refer to them by position.
+        
+        Args:
+            include_events: Whether to include the recent fusion ids of each connection
+        
         Returns:
-            Dictionary representing the concept network
+            Dictionary with concepts, their fusion counts and first-seen times,
+            and [id1, id2, count] connections (each pair listed once)
         """
-        return self.concept_network
+        with self._lock:
+            network = {
+                "concepts": list(self.concept_names),
+                "fusion_counts": list(self.concept_fusion_counts),
+                "first_seen": list(self.concept_first_seen),
+                "edges": [
+                    [id1, id2, count]
+                    for id1, connections in enumerate(self.concept_edges)
+                    for id2, count in connections.items()
+                    if id1 < id2
+                ]
+            }
+            if include_events:
+                network["edge_events"] = [[id1, id2, events] for (id1, id2), events in self.edge_events.items()]
+            return network
 
-    def get_concept_connections(self, concept: str) -> Dict[str, List[Dict[str, Any]]]:
+    def get_concept_connections(self, concept: str) -> Dict[str, Dict[str, Any]]:
         """
         Gets all connections for a specific concept.
         
@@ -523,59 +924,259 @@ class SymbolFusionEngine:
             concept: The concept to find connections for
             
         Returns:
-            Dictionary of connected concepts and their relationship details
+            Dictionary of connected concepts, each with its fusion count and
+            the recent fusions still in the history
         """
-        if concept in self.concept_network:
-            return self.concept_network[concept]["connections"]
-        return {}
+        with self._lock:
+            concept_id = self.concept_ids.get(concept)
+            if concept_id is None:
+                return {}
+                
+            connections = {}
+            for connected_id, count in self.concept_edges[concept_id].items():
+                events = self.edge_events.get((min(concept_id, connected_id), max(concept_id, connected_id)), [])
+                recent = [self._get_fusion_record(fusion_id) for fusion_id in events]
+                connections[self.concept_names[connected_id]] = {
+                    "count": count,
+                    "recent": [
+                        {"style": record["style"], "result": record["result"], "timestamp": record["timestamp"]}
+                        for record in recent if record is not None
+                    ]
+                }
+            return connections
 
-    def find_path_between_concepts(self, concept1: str, concept2: str, max_depth: int = 3) -> List[List[str]]:
+    def find_path_between_concepts(self, concept1: str, concept2: str, max_depth: Optional[int] = 3,
+                                   max_paths: int = 5, weighted: bool = False) -> List[List[str]]:
         """
         Finds connection paths between two concepts in the network.
         
+        Returns the shortest simple paths first (Yen's algorithm). Unweighted
+        searches count hops and use bidirectional breadth-first search;
+        weighted searches treat frequently fused connections as shorter
+        (each step costs 1 / fusion count).
+        
         Args:
             concept1: First concept
             concept2: Second concept
-            max_depth: Maximum path length to search
+            max_depth: Maximum path length to search, in concepts (None for no limit)
+            max_paths: Maximum number of paths to return
+            weighted: Whether to prefer paths through frequently fused connections
             
         Returns:
-            List of possible paths between the concepts
+            List of possible paths between the concepts, best first
         """
-        if concept1 not in self.concept_network or concept2 not in self.concept_network:
-            return []
+        with self._lock:
+            if concept1 not in self.concept_ids or concept2 not in self.concept_ids or max_paths < 1:
+                return []
+            if concept1 == concept2:
+                return [[concept1]]
+                
+            start, target = self.concept_ids[concept1], self.concept_ids[concept2]
+            max_hops = None if max_depth is None else max_depth - 1
             
-        # Simple breadth-first search
-        paths = []
-        visited = set()
-        queue = [[concept1]]
-        
-        while queue:
-            path = queue.pop(0)
-            node = path[-1]
+            found = self._shortest_path_ids(start, target, max_hops, weighted)
+            if found is None:
+                return []
+                
+            paths = [found]
+            candidates = []  # Heap of (cost, path) spur paths not yet accepted
+            seen = {tuple(found[1])}
             
-            # Skip if we've visited this node already
-            if node in visited:
-                continue
+            while len(paths) < max_paths:
+                previous = paths[-1][1]
+                for i in range(len(previous) - 1):
+                    root = previous[:i + 1]
+                    
+                    # Leave the root path, and every known path's next step from it, out of the search
+                    blocked_nodes = set(root[:-1])
+                    blocked_edges = {
+                        (path[i], path[i + 1]) for _, path in paths
+                        if len(path) > i + 1 and path[:i + 1] == root
+                    }
+                    spur = self._shortest_path_ids(root[-1], target, None if max_hops is None else max_hops - i,
+                                                   weighted, blocked_nodes, blocked_edges)
+                    if spur is None:
+                        continue
+                        
+                    path = root[:-1] + spur[1]
+                    if tuple(path) not in seen:
+                        seen.add(tuple(path))
+                        heapq.heappush(candidates, (self._path_cost(root, weighted) + spur[0], path))
+                        
+                if not candidates:
+                    break
+                paths.append(heapq.heappop(candidates))
                 
-            # Mark as visited
-            visited.add(node)
+            return [[self.concept_names[concept_id] for concept_id in path] for _, path in paths]
+
+    def _edge_cost(self, id1: int, id2: int, weighted: bool) -> float:
+        """Cost of stepping between two connected concepts."""
+        return 1.0 / self.concept_edges[id1][id2] if weighted else 1.0
+
+    def _path_cost(self, path: List[int], weighted: bool) -> float:
+        """Total cost of a path of concept ids."""
+        return sum(self._edge_cost(id1, id2, weighted) for id1, id2 in zip(path, path[1:]))
+
+    def _shortest_path_ids(self, start: int, target: int, max_hops: Optional[int], weighted: bool,
+                           blocked_nodes: frozenset = frozenset(),
+                           blocked_edges: frozenset = frozenset()) -> Optional[Tuple[float, List[int]]]:
+        """
+        Finds the cheapest path of at most max_hops steps (None for no limit),
+        avoiding blocked nodes and edges.
+        
+        Returns:
+            Tuple of (cost, path of concept ids), or None if there is no such path
+        """
+        if max_hops is None or max_hops >= len(self.concept_names) - 1:
+            # No simple path can exceed the limit
+            if weighted:
+                return self._bidirectional_dijkstra(start, target, blocked_nodes, blocked_edges)
+            return self._bidirectional_bfs(start, target, len(self.concept_names), blocked_nodes, blocked_edges)
+        if weighted:
+            return self._bounded_dijkstra(start, target, max_hops, blocked_nodes, blocked_edges)
+        return self._bidirectional_bfs(start, target, max_hops, blocked_nodes, blocked_edges)
+
+    def _bidirectional_bfs(self, start: int, target: int, max_hops: int,
+                           blocked_nodes: frozenset, blocked_edges: frozenset) -> Optional[Tuple[float, List[int]]]:
+        """Fewest-hops path, searching from both ends and always growing the smaller frontier."""
+        if start == target:
+            return 0.0, [start]
             
-            # Check if we've reached the destination
-            if node == concept2:
-                paths.append(path)
-                continue
+        # Parent and depth of every node reached from each end
+        forward = {start: (None, 0)}
+        backward = {target: (None, 0)}
+        forward_frontier, backward_frontier = [start], [target]
+        forward_depth = backward_depth = 0
+        
+        while forward_frontier and backward_frontier and forward_depth + backward_depth < max_hops:
+            expand_forward = len(forward_frontier) <= len(backward_frontier)
+            frontier = forward_frontier if expand_forward else backward_frontier
+            reached, other = (forward, backward) if expand_forward else (backward, forward)
+            depth = (forward_depth if expand_forward else backward_depth) + 1
+            
+            next_frontier = []
+            best = None  # (total hops, meeting node)
+            for node in frontier:
+                for connected in self.concept_edges[node]:
+                    if connected in reached or connected in blocked_nodes:
+                        continue
+                    edge = (node, connected) if expand_forward else (connected, node)
+                    if edge in blocked_edges:
+                        continue
+                    reached[connected] = (node, depth)
+                    next_frontier.append(connected)
+                    if connected in other:
+                        total = depth + other[connected][1]
+                        if best is None or total < best[0]:
+                            best = (total, connected)
+                            
+            if expand_forward:
+                forward_frontier, forward_depth = next_frontier, depth
+            else:
+                backward_frontier, backward_depth = next_frontier, depth
                 
-            # Stop if we've reached max depth
-            if len(path) >= max_depth:
+            if best is not None:
+                if best[0] > max_hops:
+                    return None
+                meeting = best[1]
+                path = []
+                node = meeting
+                while node is not None:
+                    path.append(node)
+                    node = forward[node][0]
+                path.reverse()
+                node = backward[meeting][0]
+                while node is not None:
+                    path.append(node)
+                    node = backward[node][0]
+                return float(len(path) - 1), path
+                
+        return None
+
+    def _bounded_dijkstra(self, start: int, target: int, max_hops: int,
+                          blocked_nodes: frozenset, blocked_edges: frozenset) -> Optional[Tuple[float, List[int]]]:
+        """Cheapest path by 1 / fusion count, limited to max_hops steps."""
+        # Heap of (cost, hops, node, trail), where trail links back to the start.
+        # A node reached again with at least as many hops is dominated by its
+        # earlier, cheaper visit.
+        heap = [(0.0, 0, start, (start, None))]
+        settled_hops = {}
+        
+        while heap:
+            cost, hops, node, trail = heapq.heappop(heap)
+            if node == target:
+                path = []
+                while trail is not None:
+                    path.append(trail[0])
+                    trail = trail[1]
+                return cost, path[::-1]
+            if settled_hops.get(node, max_hops + 1) <= hops:
                 continue
+            settled_hops[node] = hops
+            if hops >= max_hops:
+                continue
+                
+            for connected, count in self.concept_edges[node].items():
+                if connected in blocked_nodes or (node, connected) in blocked_edges:
+                    continue
+                if settled_hops.get(connected, max_hops + 1) <= hops + 1:
+                    continue
+                heapq.heappush(heap, (cost + 1.0 / count, hops + 1, connected, (connected, trail)))
                 
-            # Add all connected nodes to the queue
-            if node in self.concept_network:
-                for connected in self.concept_network[node]["connections"]:
-                    if connected not in visited:
-                        queue.append(path + [connected])
+        return None
+
+    def _bidirectional_dijkstra(self, start: int, target: int, blocked_nodes: frozenset,
+                                blocked_edges: frozenset) -> Optional[Tuple[float, List[int]]]:
+        """Cheapest path by 1 / fusion count with no hop limit, searching from both ends."""
+        if start == target:
+            return 0.0, [start]
+            
+        # Per direction: tentative costs, parents, settled nodes and a heap of (cost, node)
+        costs = ({start: 0.0}, {target: 0.0})
+        parents = ({start: None}, {target: None})
+        settled = (set(), set())
+        heaps = ([(0.0, start)], [(0.0, target)])
+        best_cost, meeting = float("inf"), None
+        
+        while heaps[0] and heaps[1]:
+            # Stop once no unexplored path can beat the best meeting found
+            if heaps[0][0][0] + heaps[1][0][0] >= best_cost:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            cost, node = heapq.heappop(heaps[side])
+            if node in settled[side]:
+                continue
+            settled[side].add(node)
+            
+            for connected, count in self.concept_edges[node].items():
+                if connected in blocked_nodes:
+                    continue
+                if (node, connected) in blocked_edges if side == 0 else (connected, node) in blocked_edges:
+                    continue
+                new_cost = cost + 1.0 / count
+                if new_cost < costs[side].get(connected, float("inf")):
+                    costs[side][connected] = new_cost
+                    parents[side][connected] = node
+                    heapq.heappush(heaps[side], (new_cost, connected))
+                if connected in costs[1 - side]:
+                    total = costs[side][connected] + costs[1 - side][connected]
+                    if total < best_cost:
+                        best_cost, meeting = total, connected
                         
-        return paths
+        if meeting is None:
+            return None
+            
+        path = []
+        node = meeting
+        while node is not None:
+            path.append(node)
+            node = parents[0][node]
+        path.reverse()
+        node = parents[1][meeting]
+        while node is not None:
+            path.append(node)
+            node = parents[1][node]
+        return best_cost, path
 
     def add_fusion_style(self, name: str, description: str, operator: str, 
                         connectors: List[str]) -> str:
@@ -591,13 +1192,111 @@ class SymbolFusionEngine:
         Returns:
             Confirmation message
         """
-        name = name.lower()
-        self.fusion_styles[name] = {
-            "description": description,
-            "operator": operator,
-            "connectors": connectors
-        }
-        return f"Fusion style '{name}' added."
+        with self._lock:
+            name = name.lower()
+            self.fusion_styles[name] = {
+                "description": description,
+                "operator": operator,
+                "connectors": connectors
+            }
+            self._log_change({"op": "style", "name": name, "style": self.fusion_styles[name]})
+            return f"Fusion style '{name}' added."
+
+    def _log_change(self, record: Dict[str, Any]) -> None:
+        """Journals one change, compacting once enough have accumulated."""
+        if not self.record_log:
+            return
+        try:
+            self.record_log.append(record)
+        except Exception as e:
+            print(f"Error journaling fusion data: {e}")
+            return
+            
+        if self.record_log.needs_compaction():
+            self.compact()
+
+    def compact(self, background: bool = True) -> None:
+        """
+        Folds the change journal into a fresh snapshot (journaled engines only).
+        
+        Args:
+            background: Whether to write the snapshot on a background thread
+        """
+        with self._lock:
+            if self.record_log:
+                self.record_log.compact(self._capture_records, background)
+
+    def _capture_records(self) -> List[Dict[str, Any]]:
+        """Captures the engine state as snapshot records."""
+        records = [{
+            "op": "meta",
+            "next_fusion_id": self.next_fusion_id,
+            "fusion_styles": copy.deepcopy(self.fusion_styles),
+            "custom_patterns": copy.deepcopy(self.custom_patterns)
+        }]
+        records.extend(
+            {"op": "category", "concept": concept, "category": category}
+            for concept, category in self.category_overrides.items()
+        )
+        records.extend(
+            {"op": "concept", "name": name, "count": count, "first_seen": first_seen}
+            for name, count, first_seen in zip(self.concept_names, self.concept_fusion_counts,
+                                               self.concept_first_seen)
+        )
+        records.extend(
+            {"op": "edge", "ids": [id1, id2], "count": count,
+             "events": list(self.edge_events.get((id1, id2), []))}
+            for id1, connections in enumerate(self.concept_edges)
+            for id2, count in connections.items()
+            if id1 < id2
+        )
+        records.extend({"op": "history", "record": record} for record in self.fusion_history)
+        return records
+
+    def _load_records(self) -> None:
+        """Rebuilds the engine state by streaming its snapshot and journal."""
+        archived_next_id = self.next_fusion_id
+        self.next_fusion_id = 0
+        try:
+            for record in self.record_log.load():
+                self._apply_record(record)
+        except Exception as e:
+            print(f"Error loading fusion data: {e}")
+        self.next_fusion_id = max(self.next_fusion_id, archived_next_id)
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Applies one snapshot or journal record to the engine state."""
+        op = record.get("op")
+        if op == "fusion":
+            fusion_record = record["record"]
+            # Skip fusions already folded into the snapshot
+            if fusion_record["id"] < self.next_fusion_id:
+                return
+            self.fusion_history.append(fusion_record)
+            self.next_fusion_id = fusion_record["id"] + 1
+            self._update_concept_network(tuple(fusion_record["inputs"]), fusion_record["id"],
+                                         fusion_record["timestamp"])
+            self._enforce_history_retention()
+        elif op == "history":
+            self.fusion_history.append(record["record"])
+            self._enforce_history_retention()
+        elif op == "concept":
+            concept_id = self._intern_concept(record["name"], record["first_seen"])
+            self.concept_fusion_counts[concept_id] = record["count"]
+        elif op == "edge":
+            id1, id2 = record["ids"]
+            self.concept_edges[id1][id2] = record["count"]
+            self.concept_edges[id2][id1] = record["count"]
+            if record.get("events"):
+                self.edge_events[(id1, id2)] = list(record["events"])
+        elif op == "style":
+            self.fusion_styles[record["name"]] = record["style"]
+        elif op == "category":
+            self.category_overrides[record["concept"]] = record["category"]
+        elif op == "meta":
+            self.next_fusion_id = max(self.next_fusion_id, record["next_fusion_id"])
+            self.fusion_styles.update(record["fusion_styles"])
+            self.custom_patterns.update(record["custom_patterns"])
 
     def save_fusion_data(self, filepath: str) -> str:
         """
@@ -609,19 +1308,22 @@ class SymbolFusionEngine:
         Returns:
             Confirmation message
         """
-        data = {
-            "fusion_history": self.fusion_history,
-            "concept_network": self.concept_network,
-            "fusion_styles": self.fusion_styles,
-            "custom_patterns": self.custom_patterns
-        }
-        
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            return f"Fusion data saved to {filepath}"
-        except Exception as e:
-            return f"Error saving fusion data: {e}"
+        with self._lock:
+            data = {
+                "fusion_history": list(self.fusion_history),
+                "next_fusion_id": self.next_fusion_id,
+                "concept_network": self.get_concept_network(include_events=True),
+                "fusion_styles": self.fusion_styles,
+                "custom_patterns": self.custom_patterns,
+                "category_overrides": self.category_overrides
+            }
+            
+            try:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, separators=(",", ":"))
+                return f"Fusion data saved to {filepath}"
+            except Exception as e:
+                return f"Error saving fusion data: {e}"
 
     def load_fusion_data(self, filepath: str) -> str:
         """
@@ -633,22 +1335,76 @@ class SymbolFusionEngine:
         Returns:
             Confirmation message
         """
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            if "fusion_history" in data:
-                self.fusion_history = data["fusion_history"]
-            if "concept_network" in data:
-                self.concept_network = data["concept_network"]
-            if "fusion_styles" in data:
-                self.fusion_styles.update(data["fusion_styles"])
-            if "custom_patterns" in data:
-                self.custom_patterns.update(data["custom_patterns"])
+        with self._lock:
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    
+                if "fusion_history" in data:
+                    self._load_fusion_history(data["fusion_history"], data.get("next_fusion_id"))
+                if "concept_network" in data:
+                    self._load_concept_network(data["concept_network"])
+                if "fusion_styles" in data:
+                    self.fusion_styles.update(data["fusion_styles"])
+                if "custom_patterns" in data:
+                    self.custom_patterns.update(data["custom_patterns"])
+                if "category_overrides" in data:
+                    self.category_overrides.update(data["category_overrides"])
+                    
+                return f"Fusion data loaded from {filepath}"
+            except Exception as e:
+                return f"Error loading fusion data: {e}"
+
+    def _load_fusion_history(self, records: List[Dict[str, Any]], next_fusion_id: Optional[int] = None) -> None:
+        """
+        Replaces the fusion history, numbering records saved without ids.
+        
+        Args:
+            records: Saved fusion records, oldest first
+            next_fusion_id: Id for the next fusion, if saved
+        """
+        if any("id" not in record for record in records):
+            for fusion_id, record in enumerate(records):
+                record["id"] = fusion_id
                 
-            return f"Fusion data loaded from {filepath}"
-        except Exception as e:
-            return f"Error loading fusion data: {e}"
+        self.fusion_history = deque(records)
+        last_id = records[-1]["id"] if records else -1
+        self.next_fusion_id = max(next_fusion_id or 0, last_id + 1, self.next_fusion_id)
+        self._enforce_history_retention()
+
+    def _load_concept_network(self, network: Dict[str, Any]) -> None:
+        """
+        Replaces the concept network with a saved one.
+        
+        Accepts both the compact format written by save_fusion_data and the
+        older format that mapped each concept to per-fusion connection lists.
+        
+        Args:
+            network: Saved concept network
+        """
+        self._reset_concept_network()
+        
+        if "concepts" in network and "edges" in network:
+            for concept, count, first_seen in zip(network["concepts"], network["fusion_counts"],
+                                                  network["first_seen"]):
+                self.concept_fusion_counts[self._intern_concept(concept, first_seen)] = count
+            for id1, id2, count in network["edges"]:
+                self.concept_edges[id1][id2] = count
+                self.concept_edges[id2][id1] = count
+            for id1, id2, events in network.get("edge_events", []):
+                self.edge_events[(min(id1, id2), max(id1, id2))] = list(events)
+            return
+            
+        # Older format: {concept: {"connections": {concept: [fusion info]}, ...}}
+        for concept, node in network.items():
+            concept_id = self._intern_concept(concept, node.get("first_seen"))
+            self.concept_fusion_counts[concept_id] = node.get("fusion_count", 0)
+        for concept, node in network.items():
+            concept_id = self.concept_ids[concept]
+            for connected, fusions in node.get("connections", {}).items():
+                connected_id = self._intern_concept(connected)
+                if connected_id != concept_id:
+                    self.concept_edges[concept_id][connected_id] = len(fusions)
 
 
 if __name__ == "__main__":
@@ -689,4 +1445,4 @@ if __name__ == "__main__":
     connections = fusion_engine.get_concept_connections(test_concept)
     print(f"\nConnections for '{test_concept}':")
     for connected, details in connections.items():
-        print(f"  - Connected to '{connected}' with {len(details)} fusions")
\ No newline at end of file
+        print(f"  - Connected to '{connected}' with {details['count']} fusions")
\ No newline at end of file
@@ -0,0 +1,323 @@
+# sully_engine/ingestion.py
+# 📖 Document text extraction and chunking for ingestion pipelines
+
+import os
+import re
+import time
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
+
+from extraction_cache import ExtractionCache
+from pdf_reader import PDFReader
+
+# Formats offered to folder ingestion (those extract_document_text can read)
+SUPPORTED_FORMATS = [".pdf", ".txt", ".md", ".docx"]
+
+# Default upper bound on the size of a text chunk, in characters
+DEFAULT_CHUNK_SIZE = 4000
+
+
+def _read_text_file(file_path: str) -> str:
+    """Read a plain text or Markdown document."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _read_docx_file(file_path: str) -> str:
+    """Read the paragraphs of a Word document."""
+    import docx
+    doc = docx.Document(file_path)
+    return "\n".join(p.text for p in doc.paragraphs)
+
+
+def _cached_extraction(file_path: str, extractor: str, extract, cache: Optional[ExtractionCache]) -> str:
+    """Extract a document's text, reusing an earlier extraction of identical bytes."""
+    if cache is None:
+        return extract(file_path)
+
+    cache_key = cache.key(file_path, {"extractor": extractor})
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached["text"]
+
+    content = extract(file_path)
+    if content:
+        cache.put(cache_key, {"text": content})
+    return content
+
+
+def extract_document_text(file_path: str, pdf_reader: PDFReader,
+                          cache: Optional[ExtractionCache] = None,
+                          verbose: bool = True) -> Tuple[str, Optional[str]]:
+    """
+    Extract the text of a document based on its file type.
+
+    Args:
+        file_path: Path to the document
+        pdf_reader: Reader used for PDF files
+        cache: Optional extraction cache for non-PDF formats
+        verbose: Whether the PDF reader logs progress
+
+    Returns:
+        Tuple of (extracted text, error message or None)
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+
+    if ext == ".pdf":
+        # Use PDFReader for PDF files
+        result = pdf_reader.extract_text(file_path, verbose=verbose)
+        if result["success"]:
+            return result["text"], None
+        return "", f"[Extraction Failed: {result.get('error', 'Unknown error')}]"
+    elif ext in [".txt", ".md"]:
+        # Simple text file reading
+        try:
+            return _cached_extraction(file_path, "text", _read_text_file, cache), None
+        except Exception as e:
+            return "", f"[Text Extraction Error: {str(e)}]"
+    elif ext == ".docx":
+        # Handle Word documents
+        try:
+            return _cached_extraction(file_path, "docx", _read_docx_file, cache), None
+        except ImportError:
+            return "", "[Missing `python-docx`. Install it with `pip install python-docx`]"
+        except Exception as e:
+            return "", f"[DOCX Error: {str(e)}]"
+
+    return "", f"[Unsupported file type: {ext}]"
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize extracted text: unify line endings, drop trailing spaces and
+    collapse runs of blank lines.
+
+    Args:
+        text: Raw extracted text
+
+    Returns:
+        Normalized text
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = re.sub(r"[ \t]+\n", "\n", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+def chunk_text(text: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[str]:
+    """
+    Split text into chunks of at most chunk_size characters, preferring
+    paragraph boundaries and splitting oversized paragraphs on whitespace.
+
+    Args:
+        text: Normalized text
+        chunk_size: Maximum characters per chunk
+
+    Returns:
+        List of chunks, in document order
+    """
+    chunks = []
+    current = []
+    current_length = 0
+
+    for paragraph in text.split("\n\n"):
+        # Break oversized paragraphs into pieces first
+        while len(paragraph) > chunk_size:
+            cut = paragraph.rfind(" ", 0, chunk_size)
+            if cut <= 0:
+                cut = chunk_size
+            pieces = paragraph[:cut].strip()
+            paragraph = paragraph[cut:].strip()
+            if current:
+                chunks.append("\n\n".join(current))
+                current, current_length = [], 0
+            if pieces:
+                chunks.append(pieces)
+
+        if not paragraph:
+            continue
+        if current and current_length + len(paragraph) + 2 > chunk_size:
+            chunks.append("\n\n".join(current))
+            current, current_length = [], 0
+        current.append(paragraph)
+        current_length += len(paragraph) + 2
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _pack_chunks(blocks: Iterable[Tuple[str, Optional[str], Optional[int]]],
+                 chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """
+    Pack a stream of text blocks into bounded chunks that never span sections.
+
+    Args:
+        blocks: (text, section title, page number) triples in document order
+        chunk_size: Maximum characters per chunk
+
+    Returns:
+        Iterator of chunk dictionaries with text, section and page range
+    """
+    current = []
+    current_length = 0
+    section = None
+    pages = []
+
+    def flush():
+        chunk = {
+            "text": "\n\n".join(current),
+            "section": section,
+            "first_page": pages[0] if pages else None,
+            "last_page": pages[-1] if pages else None
+        }
+        current.clear()
+        pages.clear()
+        return chunk
+
+    for text, block_section, page in blocks:
+        text = normalize_text(text)
+        if not text:
+            continue
+
+        # Close the chunk at section boundaries and when it would overflow
+        if current and (block_section != section or current_length + len(text) + 2 > chunk_size):
+            yield flush()
+            current_length = 0
+        section = block_section
+
+        for piece in (chunk_text(text, chunk_size) if len(text) > chunk_size else [text]):
+            if current and current_length + len(piece) + 2 > chunk_size:
+                yield flush()
+                current_length = 0
+            current.append(piece)
+            current_length += len(piece) + 2
+            if page is not None and (not pages or pages[-1] != page):
+                pages.append(page)
+
+    if current:
+        yield flush()
+
+
+def _iter_pdf_blocks(file_path: str, pdf_reader: PDFReader) -> Iterator[Tuple[str, Optional[str], Optional[int]]]:
+    """Stream PDF pages as blocks labelled with their top-level section."""
+    structure = pdf_reader.extract_structure(file_path)
+    section_starts = sorted(
+        (section["start_page"], section["title"]) for section in structure.get("sections", [])
+    )
+
+    position = -1
+    for page in pdf_reader.iter_pages(file_path):
+        while position + 1 < len(section_starts) and section_starts[position + 1][0] <= page["number"]:
+            position += 1
+        section = section_starts[position][1] if position >= 0 else None
+        yield page["text"], section, page["number"]
+
+
+def _iter_text_blocks(file_path: str) -> Iterator[Tuple[str, Optional[str], Optional[int]]]:
+    """Stream a text file's paragraphs, treating Markdown headings as sections."""
+    section = None
+    paragraph = []
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith("#") and stripped.lstrip("#").startswith(" "):
+                if paragraph:
+                    yield "".join(paragraph), section, None
+                    paragraph = []
+                section = stripped.lstrip("#").strip()
+            elif not stripped:
+                if paragraph:
+                    yield "".join(paragraph), section, None
+                    paragraph = []
+            else:
+                paragraph.append(line)
+    if paragraph:
+        yield "".join(paragraph), section, None
+
+
+def _iter_docx_blocks(file_path: str) -> Iterator[Tuple[str, Optional[str], Optional[int]]]:
+    """Stream a Word document's paragraphs, treating headings as sections."""
+    import docx
+    section = None
+    for p in docx.Document(file_path).paragraphs:
+        if p.style is not None and p.style.name.startswith("Heading"):
+            section = p.text.strip() or section
+        else:
+            yield p.text, section, None
+
+
+def iter_document_chunks(file_path: str, pdf_reader: PDFReader,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Stream a document as bounded chunks split along pages and sections.
+
+    Only the chunk being built is held in memory, whatever the document's size.
+
+    Args:
+        file_path: Path to the document
+        pdf_reader: Reader used for PDF files
+        chunk_size: Maximum characters per chunk
+
+    Returns:
+        Iterator of chunk dictionaries with text, section and page range
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == ".pdf":
+        blocks = _iter_pdf_blocks(file_path, pdf_reader)
+    elif ext in [".txt", ".md"]:
+        blocks = _iter_text_blocks(file_path)
+    elif ext == ".docx":
+        blocks = _iter_docx_blocks(file_path)
+    else:
+        raise ValueError(f"[Unsupported file type: {ext}]")
+
+    return _pack_chunks(blocks, chunk_size)
+
+
+# Per-process readers for pipeline workers, one per (dpi, cache directory),
+# created on first use
+_worker_readers = {}
+
+
+def extract_and_chunk(file_path: str, dpi: int = 300, cache_dir: Optional[str] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Pipeline worker: extract a document, then normalize and chunk its text.
+
+    Runs in a worker process. OCR inside the worker is single-process, since
+    parallelism comes from extracting many files at once.
+
+    Args:
+        file_path: Path to the document
+        dpi: OCR resolution for scanned PDFs
+        cache_dir: Extraction cache directory shared with the parent, if any
+        chunk_size: Maximum characters per chunk
+
+    Returns:
+        Dictionary with the file path, text, chunks, error and stage timings
+    """
+    reader = _worker_readers.get((dpi, cache_dir))
+    if reader is None:
+        cache = ExtractionCache(cache_dir) if cache_dir else None
+        reader = PDFReader(ocr_enabled=True, dpi=dpi, ocr_workers=1, cache=cache)
+        _worker_readers[(dpi, cache_dir)] = reader
+
+    started = time.perf_counter()
+    content, error = extract_document_text(file_path, reader, reader.cache, verbose=False)
+    extracted = time.perf_counter()
+
+    text = normalize_text(content) if content else ""
+    chunks = chunk_text(text, chunk_size) if text else []
+    chunked = time.perf_counter()
+
+    return {
+        "file": file_path,
+        "text": text,
+        "chunks": chunks,
+        "error": error,
+        "extract_seconds": round(extracted - started, 4),
+        "chunk_seconds": round(chunked - extracted, 4)
+    }
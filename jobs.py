@@ -0,0 +1,175 @@
+# sully_engine/jobs.py
+# 📥 Background ingestion jobs with per-file progress
+
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+
+class QueueFull(Exception):
+    """Raised when accepting a job would exceed the queue's pending-file limit."""
+
+
+class IngestionJobQueue:
+    """
+    Runs document ingestion in the background and tracks each job's progress.
+
+    Submitting a job returns its id immediately; the files are ingested by a
+    worker pool and each file's status, timings and result are recorded so
+    clients can poll for progress instead of holding a request open.
+    """
+
+    def __init__(self, ingest: Callable[[str], Any], max_workers: int = 2,
+                 max_pending_files: int = 256, max_finished_jobs: int = 1000):
+        """
+        Initialize the job queue.
+
+        Args:
+            ingest: Callable that ingests one file path and returns a summary;
+                it receives the file's display name as document_key, and a
+                failure is either raised or reported as a summary "error"
+            max_workers: Files ingested concurrently
+            max_pending_files: Files allowed to wait before new jobs are refused
+            max_finished_jobs: Finished jobs kept for status queries
+        """
+        self.ingest = ingest
+        self.max_workers = max_workers
+        self.max_pending_files = max_pending_files
+        self.max_finished_jobs = max_finished_jobs
+
+        self.jobs = OrderedDict()  # Job id -> job record, oldest first
+        self.pending_files = 0
+        self._lock = threading.Lock()
+        self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The ingestion worker pool, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="sully-ingest")
+        return self._executor
+
+    def submit(self, files: List[Tuple[str, str]], cleanup: bool = True) -> str:
+        """
+        Queues files for ingestion.
+
+        Args:
+            files: (display name, path on disk) pairs; documents are stored
+                under their display name
+            cleanup: Whether to delete each file once it has been ingested
+
+        Returns:
+            The new job's id
+
+        Raises:
+            QueueFull: If the files would exceed the pending-file limit
+        """
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "status": "queued",
+            "created": datetime.now().isoformat(),
+            "started": None,
+            "finished": None,
+            "total": len(files),
+            "completed": 0,
+            "failed": 0,
+            "files": [
+                {"file": name, "status": "queued", "summary": None, "error": None,
+                 "started": None, "finished": None}
+                for name, _ in files
+            ]
+        }
+
+        with self._lock:
+            if self.pending_files + len(files) > self.max_pending_files:
+                raise QueueFull(f"Ingestion queue is full ({self.pending_files} files pending)")
+            self.pending_files += len(files)
+            self.jobs[job_id] = job
+            self._evict_finished()
+
+        if not files:
+            self._finish_job(job)
+        for position, (name, path) in enumerate(files):
+            self.executor.submit(self._run_file, job, position, name, path, cleanup)
+
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns a snapshot of a job's progress.
+
+        Args:
+            job_id: Job id returned by submit()
+
+        Returns:
+            Copy of the job record, or None if the job is unknown or expired
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            return {**job, "files": [dict(file) for file in job["files"]]}
+
+    def _run_file(self, job: Dict[str, Any], position: int, name: str, path: str, cleanup: bool) -> None:
+        """Ingests one file of a job and records the outcome."""
+        file = job["files"][position]
+        with self._lock:
+            file["status"] = "running"
+            file["started"] = datetime.now().isoformat()
+            if job["status"] == "queued":
+                job["status"] = "running"
+                job["started"] = file["started"]
+
+        try:
+            summary = self.ingest(path, document_key=name)
+            error = summary.get("error") if isinstance(summary, dict) else None
+        except Exception as e:
+            summary = None
+            error = str(e)
+        finally:
+            if cleanup and os.path.exists(path):
+                os.remove(path)
+
+        with self._lock:
+            file["finished"] = datetime.now().isoformat()
+            file["summary"] = summary
+            file["error"] = error
+            file["status"] = "failed" if error else "ingested"
+            job["completed" if not error else "failed"] += 1
+            self.pending_files -= 1
+            done = job["completed"] + job["failed"] == job["total"]
+
+        if done:
+            self._finish_job(job)
+
+    def _finish_job(self, job: Dict[str, Any]) -> None:
+        """Marks a job as finished once all of its files are done."""
+        with self._lock:
+            job["status"] = "completed" if not job["failed"] else (
+                "failed" if not job["completed"] else "completed_with_errors"
+            )
+            job["finished"] = datetime.now().isoformat()
+            self._evict_finished()
+
+    def _evict_finished(self) -> None:
+        """Drops the oldest finished jobs beyond the retention limit."""
+        finished = [job_id for job_id, job in self.jobs.items() if job["finished"]]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self.jobs[job_id]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the worker pool.
+
+        Args:
+            wait: Whether to wait for queued files to finish
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -0,0 +1,278 @@
+# sully_engine/journal.py
+# 📓 Append-only change journal with snapshot compaction
+
+import json
+import os
+import threading
+from typing import Dict, List, Any, Optional, Callable, Iterator, Iterable
+
+
+def atomic_write_json(filepath: str, data: Any) -> None:
+    """
+    Writes JSON to a file atomically, so a crash never leaves a torn file.
+
+    Args:
+        filepath: Destination path
+        data: JSON-serializable data
+    """
+    temp_path = f"{filepath}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, filepath)
+
+
+def atomic_write_jsonl(filepath: str, records: Iterable[Dict[str, Any]]) -> None:
+    """
+    Writes records as JSON lines atomically, one record per line.
+
+    Args:
+        filepath: Destination path
+        records: JSON-serializable records
+    """
+    temp_path = f"{filepath}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, filepath)
+
+
+def read_jsonl(filepath: str) -> Iterator[Dict[str, Any]]:
+    """
+    Streams the records of a JSON-lines file, stopping at a torn final line.
+
+    Args:
+        filepath: Path of the file
+
+    Returns:
+        Iterator of records
+    """
+    if not os.path.exists(filepath):
+        return
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-append
+                break
+
+
+class Journal:
+    """
+    An append-only JSON-lines change log kept beside a snapshot file.
+
+    Every change is written as a single line, so persisting a change costs
+    O(change) instead of O(state). Once enough changes accumulate, the owner
+    compacts the journal: the log is rotated aside, a copy of the current state
+    is captured, and the snapshot is rewritten on a background thread. Loading
+    reads the snapshot and then replays any journal records on top of it.
+    """
+
+    def __init__(self, path: str, compact_every: int = 1000):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Path of the journal file
+            compact_every: Number of appended records that triggers compaction
+                (0 disables automatic compaction)
+        """
+        self.path = path
+        self.rotated_path = f"{path}.compacting"
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+        self._compaction = None  # Active background compaction thread
+
+        # Records written since the last compaction
+        self.pending = sum(1 for _ in self.replay())
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Appends one change record to the journal.
+
+        Args:
+            record: JSON-serializable change record
+        """
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+            self.pending += 1
+
+    def append_many(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Appends several change records with a single write.
+
+        Args:
+            records: JSON-serializable change records
+        """
+        if not records:
+            return
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+            self.pending += len(records)
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        Streams journal records in the order they were written, including
+        records from an interrupted compaction.
+
+        Returns:
+            Iterator of change records
+        """
+        for path in (self.rotated_path, self.path):
+            yield from read_jsonl(path)
+
+    def needs_compaction(self) -> bool:
+        """Returns whether enough records have accumulated to compact."""
+        return self.compact_every > 0 and self.pending >= self.compact_every
+
+    def compact(self, capture: Callable[[], Any], write_snapshot: Callable[[Any], None],
+                background: bool = True) -> Optional[threading.Thread]:
+        """
+        Folds the journal into a fresh snapshot.
+
+        The caller must hold whatever lock guards its state, since capture()
+        is invoked synchronously right after the journal is rotated.
+
+        Args:
+            capture: Returns a consistent copy of the state to snapshot
+            write_snapshot: Persists a captured state
+            background: Whether to write the snapshot on a background thread
+
+        Returns:
+            The compaction thread when running in the background, otherwise None
+        """
+        with self._lock:
+            if self._compaction and self._compaction.is_alive():
+                return self._compaction
+
+            self._rotate()
+            self.pending = 0
+            state = capture()
+
+            if not background:
+                self._finish_compaction(state, write_snapshot)
+                return None
+
+            self._compaction = threading.Thread(
+                target=self._finish_compaction,
+                args=(state, write_snapshot),
+                daemon=True
+            )
+            self._compaction.start()
+            return self._compaction
+
+    def wait(self) -> None:
+        """Blocks until any running compaction has finished."""
+        thread = self._compaction
+        if thread:
+            thread.join()
+
+    def clear(self) -> None:
+        """Removes all journal files."""
+        self.wait()
+        with self._lock:
+            for path in (self.path, self.rotated_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.pending = 0
+
+    def _rotate(self) -> None:
+        """Moves the live journal aside so new appends start a fresh file."""
+        if not os.path.exists(self.path):
+            return
+
+        if os.path.exists(self.rotated_path):
+            # A previous compaction failed; carry its records forward
+            with open(self.path, 'r', encoding='utf-8') as src, \
+                 open(self.rotated_path, 'a', encoding='utf-8') as dst:
+                for line in src:
+                    dst.write(line)
+            os.remove(self.path)
+        else:
+            os.replace(self.path, self.rotated_path)
+
+    def _finish_compaction(self, state: Any, write_snapshot: Callable[[Any], None]) -> None:
+        """Writes the snapshot and discards the rotated journal."""
+        try:
+            write_snapshot(state)
+            if os.path.exists(self.rotated_path):
+                os.remove(self.rotated_path)
+        except Exception as e:
+            # The rotated journal is kept and replayed on the next load
+            print(f"Journal compaction failed: {e}")
+
+
+class RecordLog:
+    """
+    Incremental persistence for engines whose state is a stream of records.
+
+    State lives in a JSON-lines snapshot plus a Journal of the changes made
+    since. Recording a change appends one line; compaction rewrites the
+    snapshot from records captured by the owner; loading streams the
+    snapshot and then the journal, one record at a time, so the owner can
+    rebuild its state without reading either file whole.
+    """
+
+    def __init__(self, snapshot_path: str, compact_every: int = 1000):
+        """
+        Initialize the record log.
+
+        Args:
+            snapshot_path: Path of the JSON-lines snapshot
+            compact_every: Journal records that trigger compaction
+                (0 disables automatic compaction)
+        """
+        self.snapshot_path = snapshot_path
+        self.journal = Journal(f"{snapshot_path}.journal", compact_every=compact_every)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Records one change.
+
+        Args:
+            record: JSON-serializable change record
+        """
+        self.journal.append(record)
+
+    def needs_compaction(self) -> bool:
+        """Returns whether enough changes have accumulated to compact."""
+        return self.journal.needs_compaction()
+
+    def load(self) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the snapshot records followed by the journaled changes.
+
+        Returns:
+            Iterator of records, oldest first
+        """
+        yield from read_jsonl(self.snapshot_path)
+        yield from self.journal.replay()
+
+    def compact(self, capture: Callable[[], List[Dict[str, Any]]], background: bool = True) -> None:
+        """
+        Folds the journal into a fresh snapshot.
+
+        The caller must hold whatever lock guards its state while capture()
+        runs.
+
+        Args:
+            capture: Returns the records that reproduce the current state
+            background: Whether to write the snapshot on a background thread
+        """
+        self.journal.compact(capture, lambda records: atomic_write_jsonl(self.snapshot_path, records),
+                             background)
+
+    def wait(self) -> None:
+        """Blocks until any running compaction has finished."""
+        self.journal.wait()
@@ -0,0 +1,233 @@
+# sully_engine/knowledge_store.py
+# 🧠 Bounded knowledge store that spills cold items to a memory-mapped segment
+
+import mmap
+import os
+import re
+import heapq
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Iterator
+
+# Each record is a little-endian length prefix followed by UTF-8 text
+_HEADER = struct.Struct("<I")
+
+
+class KnowledgeStore:
+    """
+    Append-only store of knowledge items with a bounded in-memory footprint.
+
+    Every item is written once to an on-disk segment file. Recently used
+    items are also kept in memory up to a byte budget; colder items are
+    dropped from memory and read back through a memory map of the segment on
+    demand. Only two integers per item (offset and length) stay resident, so
+    the store can grow far beyond RAM. Items survive restarts: the offset
+    index is rebuilt from the segment when it is opened.
+    """
+
+    def __init__(self, segment_path: str = "sully_knowledge.seg",
+                 max_memory_bytes: int = 64 * 1024 * 1024):
+        """
+        Open (or create) the store.
+
+        Args:
+            segment_path: Path of the on-disk segment file
+            max_memory_bytes: Budget for item text held in memory
+        """
+        self.segment_path = segment_path
+        self.max_memory_bytes = max_memory_bytes
+
+        self._offsets = array("q")  # Item index -> byte offset of its text
+        self._lengths = array("q")  # Item index -> byte length of its text
+        self._hot = OrderedDict()   # Item index -> text, least recently used first
+        self._hot_bytes = 0
+        self._map = None
+        self._lock = threading.RLock()
+
+        directory = os.path.dirname(os.path.abspath(segment_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._load_index()
+        self._file = open(segment_path, "ab")
+
+    def _load_index(self) -> None:
+        """Rebuilds the offset index from the segment, dropping a torn final record."""
+        if not os.path.exists(self.segment_path):
+            return
+
+        valid_end = 0
+        with open(self.segment_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            while valid_end + _HEADER.size <= size:
+                f.seek(valid_end)
+                (length,) = _HEADER.unpack(f.read(_HEADER.size))
+                offset = valid_end + _HEADER.size
+                if offset + length > size:
+                    break
+                self._offsets.append(offset)
+                self._lengths.append(length)
+                valid_end = offset + length
+
+        if valid_end < size:
+            print(f"Discarding incomplete knowledge record at the end of {self.segment_path}")
+            with open(self.segment_path, "r+b") as f:
+                f.truncate(valid_end)
+
+    def append(self, text: str) -> int:
+        """
+        Adds an item.
+
+        Args:
+            text: Knowledge text
+
+        Returns:
+            Index of the new item
+        """
+        data = text.encode("utf-8")
+        with self._lock:
+            offset = self._file.seek(0, os.SEEK_END) + _HEADER.size
+            self._file.write(_HEADER.pack(len(data)) + data)
+            self._file.flush()
+
+            index = len(self._offsets)
+            self._offsets.append(offset)
+            self._lengths.append(len(data))
+            self._cache(index, text, len(data))
+            return index
+
+    def _cache(self, index: int, text: str, size: int) -> None:
+        """Keeps an item in memory, spilling the coldest items beyond the budget."""
+        if size > self.max_memory_bytes:
+            return
+        self._hot[index] = text
+        self._hot_bytes += size
+        while self._hot_bytes > self.max_memory_bytes:
+            cold_index, _ = self._hot.popitem(last=False)
+            self._hot_bytes -= self._lengths[cold_index]
+
+    def _read(self, index: int) -> str:
+        """Reads an item from the segment through the memory map."""
+        offset, length = self._offsets[index], self._lengths[index]
+        if length == 0:
+            return ""
+        if self._map is None or offset + length > len(self._map):
+            # The segment has grown since it was mapped
+            if self._map is not None:
+                self._map.close()
+            with open(self.segment_path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + length].decode("utf-8")
+
+    def get(self, index: int) -> str:
+        """
+        Looks up an item.
+
+        Args:
+            index: Item index (negative indices count from the end)
+
+        Returns:
+            The item's text
+
+        Raises:
+            IndexError: If there is no such item
+        """
+        with self._lock:
+            if index < 0:
+                index += len(self._offsets)
+            if not 0 <= index < len(self._offsets):
+                raise IndexError("knowledge index out of range")
+
+            text = self._hot.get(index)
+            if text is not None:
+                self._hot.move_to_end(index)
+                return text
+
+            text = self._read(index)
+            self._cache(index, text, self._lengths[index])
+            return text
+
+    def __getitem__(self, index: int) -> str:
+        return self.get(index)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Streams every item in insertion order.
+
+        Cold items are read from disk without being pulled into memory, so
+        a full pass does not evict the working set.
+        """
+        for index in range(len(self._offsets)):
+            with self._lock:
+                text = self._hot.get(index)
+                if text is None:
+                    text = self._read(index)
+            yield text
+
+    def search(self, query: str, limit: int = 10, snippet_chars: int = 200) -> List[Dict[str, Any]]:
+        """
+        Finds the items that contain the most query terms.
+
+        Items are scanned one at a time, so only the best matches are held.
+
+        Args:
+            query: Search terms
+            limit: Maximum results
+            snippet_chars: Characters of context returned around the first hit
+
+        Returns:
+            List of {"index", "score", "snippet"} dictionaries, best first
+        """
+        terms = set(re.findall(r"\w+", query.lower()))
+        if not terms or limit <= 0:
+            return []
+
+        best = []  # Min-heap of (score, -index, snippet)
+        for index, text in enumerate(self):
+            lowered = text.lower()
+            positions = [position for position in (lowered.find(term) for term in terms) if position >= 0]
+            if not positions:
+                continue
+            score = len(positions) / len(terms)
+            if len(best) == limit and (score, -index) <= best[0][:2]:
+                continue
+
+            start = max(0, min(positions) - snippet_chars // 4)
+            entry = (score, -index, text[start:start + snippet_chars])
+            if len(best) < limit:
+                heapq.heappush(best, entry)
+            else:
+                heapq.heapreplace(best, entry)
+
+        return [
+            {"index": -neg_index, "score": round(score, 3), "snippet": snippet}
+            for score, neg_index, snippet in sorted(best, reverse=True)
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Reports the store's footprint.
+
+        Returns:
+            Item counts and memory/disk usage in bytes
+        """
+        with self._lock:
+            return {
+                "items": len(self._offsets),
+                "hot_items": len(self._hot),
+                "hot_bytes": self._hot_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "segment_bytes": self._offsets[-1] + self._lengths[-1] if self._offsets else 0
+            }
+
+    def close(self) -> None:
+        """Closes the segment file and its memory map."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
@@ -5,48 +5,101 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any, Union
 import os
+import asyncio
 import json
+import shutil
 import random
 import datetime
+import functools
+import uuid
 from pathlib import Path
 
 # Import modules
 from conversation_engine import ConversationEngine
-from reasoning import SymbolicReasoningNode
-from Codex import SullyCodex
-from math_translator import SymbolicMathTranslator
-from memory import SullySearchMemory
-from dream import DreamCore
 from sully import Sully
-from fusion import SymbolFusionEngine
-from paradox import ParadoxLibrary
-
-# Initialize the Codex
-codex = SullyCodex()
-
-# Initialize the math translator
-translator = SymbolicMathTranslator()
-
-# Initialize the memory system
-memory_system = SullySearchMemory()
-
-# Initialize the reasoning node
-reasoning_node = SymbolicReasoningNode(codex, translator, memory_system)
+from dispatch import EngineDispatcher, RouteSaturated
+from jobs import IngestionJobQueue, QueueFull
+from pdf_reader import shutdown_ocr_pool
+
+# Initialize the Sully system; SULLY_SNAPSHOT optionally names a pre-warmed
+# snapshot of the static engine tables for faster cold starts
+sully_system = Sully(snapshot_path=os.environ.get("SULLY_SNAPSHOT"))
+
+# Every route shares Sully's single engine graph
+codex = sully_system.codex
+translator = sully_system.translator
+memory_system = sully_system.memory
+reasoning_node = sully_system.reasoning_node
+dream_core = sully_system.dream_core
+fusion_engine = sully_system.fusion
+paradox_library = sully_system.paradox
 
 # Initialize the conversation engine
 conversation_engine = ConversationEngine(reasoning_node, memory_system, codex)
 
-# Initialize the dream core
-dream_core = DreamCore()
-
-# Initialize the Sully system
-sully_system = Sully()
-
-# Initialize the symbol fusion engine
-fusion_engine = SymbolFusionEngine()
+# Engine calls are synchronous, so routes run them on a bounded worker pool.
+# Per-route limits: (calls running at once, calls queued before answering 429).
+# Routes may only run concurrently on engines that lock their own state:
+# memory and fusion do, while the conversation engine's per-session state
+# does not, so chat turns run one at a time.
+ROUTE_LIMITS = {
+    "chat": (1, 32),
+    "remember": (2, 32),
+    "dream": (2, 16),
+    "evaluate": (2, 16),
+    "translate": (4, 32),
+    "fuse": (2, 16),
+    "paradox": (2, 16)
+}
+dispatcher = EngineDispatcher(max_workers=int(os.environ.get("SULLY_ENGINE_WORKERS", "8")))
+for route, (max_concurrent, max_queued) in ROUTE_LIMITS.items():
+    dispatcher.configure(route, max_concurrent, max_queued)
+
+async def run_engine(route: str, func, *args, **kwargs):
+    """Run a blocking engine call off the event loop, shedding load when the route is saturated"""
+    try:
+        return await dispatcher.run(route, func, *args, **kwargs)
+    except RouteSaturated:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Too many concurrent {route} requests, please retry shortly",
+            headers={"Retry-After": "1"}
+        )
+
+# Document ingestion runs as background jobs that clients poll for progress;
+# documents are streamed in chunks so large files do not spike memory
+ingestion_jobs = IngestionJobQueue(
+    functools.partial(sully_system.ingest_document, streaming=True),
+    max_workers=int(os.environ.get("SULLY_INGEST_WORKERS", "2"))
+)
 
-# Initialize the paradox library
-paradox_library = ParadoxLibrary()
+def _write_upload(source, file_location: str) -> None:
+    """Copy an upload's spooled body to disk (blocking; runs in a thread)"""
+    os.makedirs("temp", exist_ok=True)
+    source.seek(0)
+    with open(file_location, "wb") as f:
+        shutil.copyfileobj(source, f, 1024 * 1024)
+
+async def save_upload(file: UploadFile) -> tuple:
+    """
+    Save an upload to a uniquely named temp file, keeping its extension.
+    Returns (document name, temp path); the document is stored under the
+    uploaded file's name, so re-uploading a file replaces it.
+    """
+    name = os.path.basename(file.filename or "")
+    extension = os.path.splitext(name)[1]
+    file_location = os.path.join("temp", f"{uuid.uuid4().hex}{extension}")
+    await asyncio.to_thread(_write_upload, file.file, file_location)
+    return name or file_location, file_location
+
+def submit_ingestion(files: List[tuple]) -> str:
+    """Queue saved (document name, temp path) uploads, answering 429 when the queue is full"""
+    try:
+        return ingestion_jobs.submit(files)
+    except QueueFull as e:
+        for _, file_location in files:
+            os.remove(file_location)
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
 
 # Create FastAPI app
 app = FastAPI(
@@ -55,6 +108,12 @@ app = FastAPI(
     version="1.0.0"
 )
 
+@app.on_event("shutdown")
+def shutdown_dispatcher():
+    dispatcher.shutdown(wait=False)
+    ingestion_jobs.shutdown(wait=False)
+    shutdown_ocr_pool(wait=False)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -82,11 +141,18 @@ class EvaluateRequest(BaseModel):
 class FuseRequest(BaseModel):
     inputs: List[str]
 
+class TranslateBatchRequest(BaseModel):
+    phrases: List[str]
+    style: str = "formal"
+    domain: Optional[str] = None
+
 # API Routes
 @app.post("/api/sully/chat")
 async def chat(request: ChatRequest):
     """Engage with Sully using different cognitive modes"""
-    response = conversation_engine.process_message(
+    response = await run_engine(
+        "chat",
+        conversation_engine.process_message,
         request.message,
         tone=request.mode,
         continue_conversation=request.continue_conversation
@@ -100,7 +166,9 @@ async def chat(request: ChatRequest):
 
 @app.post("/api/sully/remember")
 async def remember(request: RememberRequest):
-    memory_index = memory_system.store_experience(
+    memory_index = await run_engine(
+        "remember",
+        memory_system.store_experience,
         content=request.content,
         source=request.source,
         concepts=request.concepts,
@@ -116,7 +184,7 @@ async def remember(request: RememberRequest):
 async def dream(
     seed: str = Query(...)
 ):
-    dream_result = sully_system.dream(seed=seed)
+    dream_result = await run_engine("dream", sully_system.dream, seed=seed)
     
     return {
         "dream": dream_result,
@@ -126,7 +194,7 @@ async def dream(
 
 @app.post("/api/sully/evaluate")
 async def evaluate(request: EvaluateRequest):
-    result = sully_system.evaluate_claim(request.text)
+    result = await run_engine("evaluate", sully_system.evaluate_claim, request.text)
     return {
         "claim": request.text,
         "evaluation": result.get("evaluation") if isinstance(result, dict) else result,
@@ -136,18 +204,37 @@ async def evaluate(request: EvaluateRequest):
 
 @app.get("/api/sully/translate")
 async def translate(phrase: str = Query(...)):
-    translation = sully_system.translate_math(phrase)
+    translation = await run_engine("translate", sully_system.translate_math, phrase)
     return {
         "original": phrase,
         "translation": translation
     }
 
+@app.post("/api/sully/translate_batch")
+async def translate_batch(request: TranslateBatchRequest):
+    """Translate many phrases in one call, sharing the compiled mappings"""
+    translations = await run_engine(
+        "translate",
+        translator.translate_batch,
+        request.phrases,
+        style=request.style,
+        domain=request.domain
+    )
+    return {
+        "translations": [
+            {"original": phrase, "translation": translation}
+            for phrase, translation in zip(request.phrases, translations)
+        ],
+        "count": len(translations),
+        "timestamp": datetime.datetime.now().isoformat()
+    }
+
 @app.post("/api/sully/fuse")
 async def fuse(request: FuseRequest):
     inputs = request.inputs
 
     # Use the SymbolFusionEngine to perform the fusion using the basic fuse function
-    fusion_result = sully_system.fuse(*inputs)
+    fusion_result = await run_engine("fuse", sully_system.fuse, *inputs)
 
     # Return the full response that includes all information from fuse_with_options
     if isinstance(fusion_result, dict):
@@ -170,7 +257,7 @@ async def fuse(request: FuseRequest):
 @app.get("/api/sully/paradox")
 async def paradox(topic: str = Query(...)):
     # Retrieve the paradox using the get function
-    paradox_result = sully_system.reveal_paradox(topic)
+    paradox_result = await run_engine("paradox", sully_system.reveal_paradox, topic)
     
     # Include the perspective and topic in the response
     response = {
@@ -197,39 +284,31 @@ async def paradox(topic: str = Query(...)):
 
 @app.post("/api/sully/ingest")
 async def ingest(file: UploadFile = File(...)):
-    os.makedirs("temp", exist_ok=True)
-    
-    file_location = f"temp/{file.filename}"
-    
-    with open(file_location, "wb") as f:
-        f.write(await file.read())
-    
-    result = sully_system.ingest_document(file_location)
-    
-    os.remove(file_location)
+    """Queue a document for ingestion; poll /api/sully/jobs/{job_id} for progress"""
+    job_id = submit_ingestion([await save_upload(file)])
     
-    return {"status": "ingested", "summary": result}
+    return {"status": "queued", "job_id": job_id, "files": 1}
 
 @app.post("/api/sully/ingest_folder")
 async def ingest_folder(files: List[UploadFile] = File(...)):
-    os.makedirs("temp", exist_ok=True)
-    results = []
+    """Queue a batch of documents for ingestion as a single job"""
+    saved = []
     
-    # Process each uploaded file
+    # Save each uploaded file
     for file in files:
-        file_location = f"temp/{file.filename}"
-        
-        with open(file_location, "wb") as f:
-            f.write(await file.read())
-        
-        result = sully_system.ingest_document(file_location)
-        
-        os.remove(file_location)
-        
-        results.append({"file": file.filename, "status": "ingested", "summary": result})
+        saved.append(await save_upload(file))
     
-    return {"status": "batch_ingested", "results": results}
-
+    job_id = submit_ingestion(saved)
+    
+    return {"status": "queued", "job_id": job_id, "files": len(saved)}
+
+@app.get("/api/sully/jobs/{job_id}")
+async def ingestion_job(job_id: str):
+    """Report an ingestion job's per-file progress and results"""
+    job = ingestion_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
 
 
 if __name__ == "__main__":
@@ -1,12 +1,137 @@
 # sully_engine/kernel_modules/math_translator.py
 # 🔢 Symbolic-to-Mathematical Expression Translator
 
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Set, Iterable
+from collections import deque
 import re
 import json
 import os
 import random
 
+from versioned import VersionedDict
+
+
+class _PhraseMatcher:
+    """
+    Aho-Corasick automaton that finds every pattern occurring in a text
+    in a single pass, regardless of how many patterns it holds.
+    """
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Compile the automaton.
+        
+        Args:
+            patterns: Substrings to search for
+        """
+        self.transitions = [{}]  # State -> {character: next state}
+        self.failure = [0]  # State -> longest proper suffix state
+        self.outputs = [[]]  # State -> patterns ending at this state
+        self.always = []  # Empty patterns match every text
+        
+        # Step 1: Build the trie of patterns
+        for pattern in dict.fromkeys(patterns):
+            if not pattern:
+                self.always.append(pattern)
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self.transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(self.transitions)
+                    self.transitions[state][char] = next_state
+                    self.transitions.append({})
+                    self.failure.append(0)
+                    self.outputs.append([])
+                state = next_state
+            self.outputs[state].append(pattern)
+        
+        # Step 2: Link failure transitions breadth-first
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fallback = self.failure[state]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.failure[fallback]
+                self.failure[next_state] = self.transitions[fallback].get(char, 0)
+                self.outputs[next_state].extend(self.outputs[self.failure[next_state]])
+    
+    def find(self, text: str) -> Set[str]:
+        """
+        Finds the patterns that occur in a text.
+        
+        Args:
+            text: The text to scan
+            
+        Returns:
+            Set of patterns found
+        """
+        found = set(self.always)
+        transitions = self.transitions
+        failure = self.failure
+        outputs = self.outputs
+        state = 0
+        for char in text:
+            while state and char not in transitions[state]:
+                state = failure[state]
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+class _MappingTable(VersionedDict):
+    """
+    Phrase -> notation table that counts its mutations, so compiled
+    matchers can tell when they are stale.
+    """
+
+
+class _CompiledMappings:
+    """
+    Matchers compiled for one set of active mappings (the core mappings
+    plus an optional domain overlay).
+    """
+    def __init__(self, words: List[str], core: _MappingTable, overlay: Optional[_MappingTable]):
+        """
+        Compile full-phrase and partial-match automata for the mapped phrases.
+        
+        Args:
+            words: Mapped phrases in active mapping order
+            core: The core mapping table the phrases came from
+            overlay: The domain overlay table, if any
+        """
+        self.sources = (core, overlay)
+        self.versions = (core.version, overlay.version if overlay is not None else 0)
+        self.position = {word: i for i, word in enumerate(words)}
+        self.matcher = _PhraseMatcher(words)
+        
+        # Fragments used by the partial-match pass: the component words of
+        # multi-word phrases and the 4-character stem of longer single words
+        self.fragment_owners = {}
+        for word in words:
+            parts = word.split()
+            if len(parts) > 1:
+                fragments = parts
+            elif len(word) >= 5:
+                fragments = [word[:4]]
+            else:
+                continue
+            for fragment in set(fragments):
+                self.fragment_owners.setdefault(fragment, []).append(word)
+        self.fragment_matcher = _PhraseMatcher(self.fragment_owners)
+    
+    def is_current(self, core: _MappingTable, overlay: Optional[_MappingTable]) -> bool:
+        """Whether the given tables are the compiled ones, unedited since."""
+        return (self.sources[0] is core and self.sources[1] is overlay and
+                self.versions == (core.version, overlay.version if overlay is not None else 0))
+    
+    def ordered(self, words: Iterable[str]) -> List[str]:
+        """Sorts mapped phrases into active mapping order."""
+        return sorted(words, key=self.position.__getitem__)
+
+
 class SymbolicMathTranslator:
     """
     Translates between symbolic/linguistic expressions and mathematical representations.
@@ -315,8 +440,18 @@ class SymbolicMathTranslator:
                     self.math_mappings.update(additional_mappings)
             except Exception as e:
                 print(f"Error loading additional mappings: {e}")
+        
+        # Mapping tables count their edits, so compiled matchers can tell
+        # when they need rebuilding
+        self.math_mappings = _MappingTable(self.math_mappings)
+        for domain, notations in self.domain_notations.items():
+            self.domain_notations[domain] = _MappingTable(notations)
+        
+        # Compiled phrase matchers per domain overlay, built on first use
+        self._compiled = {}
 
-    def translate(self, phrase: str, style: str = "formal", domain: Optional[str] = None) -> Union[Dict[str, Any], str]:
+    def translate(self, phrase: str, style: str = "formal", domain: Optional[str] = None,
+                  rng: Optional[random.Random] = None) -> Union[Dict[str, Any], str]:
         """
         Translates natural language into mathematical notation.
         
@@ -324,52 +459,102 @@ class SymbolicMathTranslator:
             phrase: The text to translate
             style: Translation style (formal, intuitive, poetic, philosophical, pedagogical)
             domain: Optional domain focus (physics, calculus, set_theory, etc.)
+            rng: Random generator for connector and reflection choices
+                (defaults to the global random module)
             
         Returns:
             Either a dictionary with translation details or a formatted string
         """
         # Normalize inputs
-        phrase_lower = phrase.lower()
+        style, domain = self._normalize_options(style, domain)
+        
+        # Use domain-specific notation if requested
+        compiled = self._get_compiled_mappings(domain)
+        
+        return self._translate_compiled(phrase, style, domain, compiled, rng)
+
+    def translate_batch(self, phrases: Iterable[str], style: str = "formal", 
+                        domain: Optional[str] = None,
+                        rng: Optional[random.Random] = None) -> List[Union[Dict[str, Any], str]]:
+        """
+        Translates many phrases with the same style and domain.
+        
+        The options are normalized and the phrase matchers resolved once,
+        then shared by every input.
+        
+        Args:
+            phrases: The texts to translate
+            style: Translation style (formal, intuitive, poetic, philosophical, pedagogical)
+            domain: Optional domain focus (physics, calculus, set_theory, etc.)
+            rng: Random generator for connector and reflection choices
+                (defaults to the global random module)
+            
+        Returns:
+            List of translations, in input order
+        """
+        style, domain = self._normalize_options(style, domain)
+        compiled = self._get_compiled_mappings(domain)
+        
+        return [self._translate_compiled(phrase, style, domain, compiled, rng) for phrase in phrases]
+
+    def _normalize_options(self, style: Optional[str], domain: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Lowercases the style and domain, dropping unknown domains."""
         style = style.lower() if style else "formal"
         domain = domain.lower() if domain else None
+        if domain not in self.domain_notations:
+            domain = None
+        return style, domain
+
+    def _translate_compiled(self, phrase: str, style: str, domain: Optional[str],
+                            compiled: _CompiledMappings,
+                            rng: Optional[random.Random] = None) -> Union[Dict[str, Any], str]:
+        """
+        Translates a phrase against already-compiled mappings.
         
-        # Use domain-specific notation if requested
-        active_mappings = self.math_mappings.copy()
-        if domain and domain in self.domain_notations:
-            active_mappings.update(self.domain_notations[domain])
+        Args:
+            phrase: The text to translate
+            style: Normalized translation style
+            domain: Normalized domain, or None
+            compiled: Matchers for the active mappings
+            rng: Random generator for phrasing choices (defaults to the random module)
+            
+        Returns:
+            Dictionary with translation details
+        """
+        rng = rng or random
+        phrase_lower = phrase.lower()
         
         # Find matches in phrase
         matches = {}
-        for word, symbol in active_mappings.items():
-            if word in phrase_lower:
-                matches[word] = symbol
+        for word in compiled.ordered(compiled.matcher.find(phrase_lower)):
+            matches[word] = self._mapped_symbol(word, domain)
         
         # If no direct matches, try to find related concepts
         if not matches:
-            # Look for partial matches
-            for word, symbol in active_mappings.items():
+            # Look for partial matches among phrases sharing a fragment with the input
+            fragments = compiled.fragment_matcher.find(phrase_lower)
+            candidates = {word for fragment in fragments for word in compiled.fragment_owners[fragment]}
+            for word in compiled.ordered(candidates):
                 words = word.split()
                 if len(words) > 1:  # For multi-word concepts
                     # Check if at least half the words match
-                    matching_words = sum(1 for w in words if w in phrase_lower)
+                    matching_words = sum(1 for w in words if w in fragments)
                     if matching_words >= len(words) / 2:
-                        matches[word] = symbol
-                elif len(word) >= 5:  # For single longer words, check partial matches
-                    # If the word is at least 5 chars, check if a substantial part appears
-                    if word[:4] in phrase_lower:
-                        matches[word] = symbol
+                        matches[word] = self._mapped_symbol(word, domain)
+                else:  # For single longer words, a substantial part appears
+                    matches[word] = self._mapped_symbol(word, domain)
         
         # Prepare the response
         if not matches:
             # Create a symbolic response even when no direct match
-            explanation = self._generate_symbolic_reflection(phrase)
+            explanation = self._generate_symbolic_reflection(phrase, rng)
             return {
                 "matches": {},
                 "explanation": explanation
             }
         
         # Format the explanation based on the requested style
-        explanation = self._format_translation(matches, style)
+        explanation = self._format_translation(matches, style, rng)
         
         # Return detailed or simple response
         return {
@@ -377,6 +562,42 @@ class SymbolicMathTranslator:
             "explanation": explanation
         }
 
+    def _get_compiled_mappings(self, domain: Optional[str]) -> _CompiledMappings:
+        """
+        Returns the compiled matchers for the core mappings plus a domain overlay.
+        
+        Args:
+            domain: Domain whose notation overlays the core mappings, if any
+            
+        Returns:
+            Compiled matchers, rebuilt if the mappings changed
+        """
+        # Tables assigned from outside are wrapped so their edits are counted
+        if not isinstance(self.math_mappings, _MappingTable):
+            self.math_mappings = _MappingTable(self.math_mappings)
+        core = self.math_mappings
+        overlay = None
+        if domain:
+            overlay = self.domain_notations[domain]
+            if not isinstance(overlay, _MappingTable):
+                overlay = self.domain_notations[domain] = _MappingTable(overlay)
+        
+        compiled = self._compiled.get(domain)
+        if compiled is None or not compiled.is_current(core, overlay):
+            # Overlay keys keep their core position; new keys follow in order
+            words = list(core)
+            if overlay is not None:
+                words.extend(word for word in overlay if word not in core)
+            compiled = _CompiledMappings(words, core, overlay)
+            self._compiled[domain] = compiled
+        return compiled
+
+    def _mapped_symbol(self, word: str, domain: Optional[str]) -> str:
+        """Returns the notation for a mapped phrase, preferring the domain overlay."""
+        if domain and word in self.domain_notations[domain]:
+            return self.domain_notations[domain][word]
+        return self.math_mappings[word]
+
     def translate_to_text(self, math_expression: str, style: str = "formal") -> str:
         """
         Translates mathematical notation into natural language explanation.
@@ -430,17 +651,21 @@ class SymbolicMathTranslator:
         else:
             return f"{math_expression}: {base_explanation}"
 
-    def _format_translation(self, matches: Dict[str, str], style: str) -> str:
+    def _format_translation(self, matches: Dict[str, str], style: str,
+                            rng: Optional[random.Random] = None) -> str:
         """
         Formats the translation results according to the requested style.
         
         Args:
             matches: Dictionary of concept to symbol matches
             style: Translation style
+            rng: Random generator for connector choices (defaults to the random module)
             
         Returns:
             Formatted explanation string
         """
+        rng = rng or random
+        
         # Get style configuration
         style_config = self.translation_styles.get(style, self.translation_styles["formal"])
         template = style_config["template"]
@@ -459,17 +684,18 @@ class SymbolicMathTranslator:
         # Use connectors for multiple matches
         result = [formatted_matches[0]]
         for i in range(1, len(formatted_matches)):
-            connector = random.choice(connectors)
+            connector = rng.choice(connectors)
             result.append(f"This {connector} {formatted_matches[i].lower()}")
         
         return " ".join(result)
 
-    def _generate_symbolic_reflection(self, phrase: str) -> str:
+    def _generate_symbolic_reflection(self, phrase: str, rng: Optional[random.Random] = None) -> str:
         """
         Generates a symbolic reflection for phrases without direct matches.
         
         Args:
             phrase: The input phrase
+            rng: Random generator for the choice of reflection (defaults to the random module)
             
         Returns:
             A symbolic reflection
@@ -481,7 +707,7 @@ class SymbolicMathTranslator:
             f"In considering '{phrase}', we approach the boundary where language meets formalism, suggesting potential for new notation.",
             f"Though lacking a standardized notation, '{phrase}' invites us to consider how mathematical language might evolve to capture such concepts."
         ]
-        return random.choice(reflections)
+        return (rng or random).choice(reflections)
 
     def add_mapping(self, symbol_phrase: str, math_form: str, domain: Optional[str] = None) -> str:
         """
@@ -565,7 +791,7 @@ class SymbolicMathTranslator:
                     if domain in self.domain_notations:
                         self.domain_notations[domain].update(mappings)
                     else:
-                        self.domain_notations[domain] = mappings
+                        self.domain_notations[domain] = _MappingTable(mappings)
                         
             return f"Mappings loaded from {filepath}"
         except Exception as e:
@@ -628,13 +854,24 @@ class SymbolicMathTranslator:
         }
 
 
+# Shared translator for the legacy function, built on first use
+_default_translator = None
+
+
+def _get_default_translator() -> SymbolicMathTranslator:
+    """Returns the translator shared by module-level calls."""
+    global _default_translator
+    if _default_translator is None:
+        _default_translator = SymbolicMathTranslator()
+    return _default_translator
+
+
 # Legacy method for backward compatibility
 def translate(phrase):
     """
     Simple translation function for backward compatibility.
     """
-    translator = SymbolicMathTranslator()
-    result = translator.translate(phrase)
+    result = _get_default_translator().translate(phrase)
     return result["explanation"]
 
 
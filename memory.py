@@ -1,10 +1,98 @@
 # sully_engine/memory.py
 # 🧠 Sully's Expansive Memory System with Associative Retrieval
 
+from array import array
+from bisect import bisect_left
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterable
+import heapq
 import json
 import os
+import re
+import threading
+
+from journal import Journal, atomic_write_json
+
+# Tokens used by the full-text index (lowercased word characters)
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Posting lists are compact sorted arrays of unsigned memory indices
+_POSTING_TYPECODE = "I"
+
+# Length of the vocabulary n-grams used to find tokens containing a fragment
+_GRAM_SIZE = 3
+
+
+def _new_postings(indices: Iterable[int] = ()) -> array:
+    """Create a sorted, de-duplicated posting list."""
+    return array(_POSTING_TYPECODE, sorted(set(indices)))
+
+
+def _add_posting(postings: array, memory_index: int) -> None:
+    """
+    Insert a memory index into a sorted posting list.
+    
+    Appending a new largest index is O(1); anything else is placed by bisection.
+    """
+    if not postings or postings[-1] < memory_index:
+        postings.append(memory_index)
+        return
+        
+    position = bisect_left(postings, memory_index)
+    if position == len(postings) or postings[position] != memory_index:
+        postings.insert(position, memory_index)
+
+
+def intersect_postings(posting_lists: List[array]) -> List[int]:
+    """
+    Intersect sorted posting lists.
+    
+    Walks the shortest list and gallops through the others with bisection,
+    so the cost is driven by the rarest concept rather than the most popular.
+    
+    Args:
+        posting_lists: Sorted posting lists
+        
+    Returns:
+        Sorted indices present in every list
+    """
+    if not posting_lists:
+        return []
+        
+    ordered = sorted(posting_lists, key=len)
+    smallest, others = ordered[0], ordered[1:]
+    positions = [0] * len(others)
+    result = []
+    
+    for value in smallest:
+        for i, postings in enumerate(others):
+            position = bisect_left(postings, value, positions[i])
+            positions[i] = position
+            if position == len(postings):
+                return result  # Exhausted a list; nothing further can match
+            if postings[position] != value:
+                break
+        else:
+            result.append(value)
+            
+    return result
+
+
+def union_postings(posting_lists: List[array]) -> List[int]:
+    """
+    Merge sorted posting lists.
+    
+    Args:
+        posting_lists: Sorted posting lists
+        
+    Returns:
+        Sorted indices present in any list
+    """
+    result = []
+    for value in heapq.merge(*posting_lists):
+        if not result or result[-1] != value:
+            result.append(value)
+    return result
 
 class SullySearchMemory:
     """
@@ -12,20 +100,38 @@ class SullySearchMemory:
     queries, and knowledge with associative retrieval capabilities.
     """
     
-    def __init__(self, memory_file: Optional[str] = None):
+    def __init__(self, memory_file: Optional[str] = None, journal: bool = False,
+                 compact_every: int = 1000):
         """
         Initialize the memory system with optional persistent storage.
         
         Args:
             memory_file: Optional file path for persisting memory
+            journal: Append each new memory to a write-ahead journal instead of
+                rewriting the whole memory file on every store
+            compact_every: Journal records that trigger background compaction
+                into the memory file (journal mode only)
         """
         self.storage = []
         self.associations = {}  # Maps concepts to relevant memory indices
         self.temporal_index = {}  # Organizes memories by time periods
+        self.token_index = {}  # Maps lowercased tokens to memory indices (full-text index)
+        self._reset_vocabulary()
         self.memory_file = memory_file
+        self._lock = threading.RLock()
+        
+        # Whole-file saves are written outside the memory lock, one at a time
+        self._save_lock = threading.Lock()
+        self._save_generation = 0  # Captures taken for saving
+        self._saved_generation = 0  # Newest capture written to the file
+        
+        # Write-ahead journal kept beside the memory file snapshot
+        self.journal = None
+        if memory_file and journal:
+            self.journal = Journal(f"{memory_file}.journal", compact_every=compact_every)
         
         # Load from file if provided and exists
-        if memory_file and os.path.exists(memory_file):
+        if memory_file and (os.path.exists(memory_file) or self.journal):
             try:
                 self._load_from_file()
             except Exception as e:
@@ -57,24 +163,10 @@ class SullySearchMemory:
         if metadata:
             entry["metadata"] = metadata
             
-        # Store in main memory
-        memory_index = len(self.storage)
-        self.storage.append(entry)
-        
-        # Index by time period for temporal associations
-        time_key = timestamp.strftime("%Y-%m-%d")
-        if time_key not in self.temporal_index:
-            self.temporal_index[time_key] = []
-        self.temporal_index[time_key].append(memory_index)
-        
-        # Extract and index key concepts to build associations
-        self._index_concepts(memory_index, query, result)
+        # Extract key concepts to build associations
+        concepts = self._query_concepts(query, result)
         
-        # Save to persistent storage if configured
-        if self.memory_file:
-            self._save_to_file()
-            
-        return memory_index
+        return self._commit_entry(entry, concepts)
 
     def store_experience(self, content: str, source: str, 
                         concepts: Optional[List[str]] = None,
@@ -91,6 +183,59 @@ class SullySearchMemory:
         Returns:
             Index of the stored memory
         """
+        entry, concepts = self._experience_entry(content, source, concepts, importance)
+        return self._commit_entry(entry, concepts)
+
+    def store_experience_batch(self, experiences: Iterable[Dict[str, Any]]) -> List[int]:
+        """
+        Stores many experiences at once, persisting them with a single write.
+        
+        Args:
+            experiences: Dictionaries with "content" and "source", and optionally
+                "concepts" and "importance"
+            
+        Returns:
+            Indices of the stored memories, in input order
+        """
+        prepared = [
+            self._experience_entry(
+                experience["content"],
+                experience["source"],
+                experience.get("concepts"),
+                experience.get("importance", 0.5)
+            )
+            for experience in experiences
+        ]
+        
+        with self._lock:
+            indices = [self._commit_entry(entry, concepts, persist=False) for entry, concepts in prepared]
+            
+            # Journal to persistent storage if configured
+            if indices and self.memory_file and self.journal:
+                self._append_batch_to_journal(
+                    [(index, entry, concepts) for index, (entry, concepts) in zip(indices, prepared)]
+                )
+                
+        # Without a journal, rewrite the memory file outside the lock
+        if indices and self.memory_file and not self.journal:
+            self._save_to_file()
+                    
+        return indices
+
+    def _experience_entry(self, content: str, source: str, concepts: Optional[List[str]],
+                          importance: float) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Builds an experience entry and the concepts to associate with it.
+        
+        Args:
+            content: The main content to remember
+            source: Where the experience/knowledge came from
+            concepts: Key concepts related to this memory, if known
+            importance: How important this memory is (0.0-1.0)
+            
+        Returns:
+            Tuple of (entry, concepts)
+        """
         timestamp = datetime.now()
         
         # Create memory entry
@@ -104,31 +249,52 @@ class SullySearchMemory:
         
         if concepts:
             entry["concepts"] = concepts
+        else:
+            # Auto-extract concepts if none provided
+            concepts = self._extract_key_concepts(content)
             
-        # Store in main memory
-        memory_index = len(self.storage)
-        self.storage.append(entry)
-        
-        # Index by time period
-        time_key = timestamp.strftime("%Y-%m-%d")
-        if time_key not in self.temporal_index:
-            self.temporal_index[time_key] = []
-        self.temporal_index[time_key].append(memory_index)
+        return entry, concepts
+
+    def _commit_entry(self, entry: Dict[str, Any], concepts: List[str], 
+                      persist: bool = True) -> int:
+        """
+        Adds an entry to storage, updates every index, and persists the change.
         
-        # Index by concepts
-        if concepts:
+        Args:
+            entry: The memory entry to store
+            concepts: Concepts to associate with the entry
+            persist: Whether to write the change to persistent storage
+            
+        Returns:
+            Index of the stored memory
+        """
+        with self._lock:
+            # Store in main memory
+            memory_index = len(self.storage)
+            self.storage.append(entry)
+            
+            # Index by time period for temporal associations
+            time_key = entry["timestamp"][:10]
+            if time_key not in self.temporal_index:
+                self.temporal_index[time_key] = []
+            self.temporal_index[time_key].append(memory_index)
+            
+            # Index by concepts
             for concept in concepts:
                 self._add_association(concept, memory_index)
-        else:
-            # Auto-extract concepts if none provided
-            extracted_concepts = self._extract_key_concepts(content)
-            for concept in extracted_concepts:
-                self._add_association(concept, memory_index)
-        
-        # Save to persistent storage if configured
-        if self.memory_file:
-            self._save_to_file()
             
+            # Index searchable text for fast keyword lookup
+            self._index_text(memory_index, entry)
+            
+            # Journal to persistent storage if configured
+            if persist and self.memory_file and self.journal:
+                self._append_to_journal(memory_index, entry, concepts)
+                
+        # Without a journal, rewrite the memory file outside the lock so
+        # concurrent stores are not held up by the disk write
+        if persist and self.memory_file and not self.journal:
+            self._save_to_file()
+                
         return memory_index
 
     def _extract_key_concepts(self, text: str) -> List[str]:
@@ -166,19 +332,20 @@ class SullySearchMemory:
         """
         concept_lower = concept.lower()
         if concept_lower not in self.associations:
-            self.associations[concept_lower] = []
+            self.associations[concept_lower] = _new_postings()
         
-        if memory_index not in self.associations[concept_lower]:
-            self.associations[concept_lower].append(memory_index)
+        _add_posting(self.associations[concept_lower], memory_index)
 
-    def _index_concepts(self, memory_index: int, query: str, result: Any) -> None:
+    def _query_concepts(self, query: str, result: Any) -> List[str]:
         """
-        Extract and index concepts from a query-result pair.
+        Extract concepts from a query-result pair.
         
         Args:
-            memory_index: Index of the memory to associate concepts with
             query: The query text
             result: The result data
+            
+        Returns:
+            List of unique concepts to index
         """
         # Extract concepts from query
         query_concepts = self._extract_key_concepts(query)
@@ -192,11 +359,156 @@ class SullySearchMemory:
                 result_concepts = self._extract_key_concepts(result["response"])
         
         # Combine unique concepts
-        all_concepts = set(query_concepts + result_concepts)
+        return list(set(query_concepts + result_concepts))
+
+    def _searchable_text(self, entry: Dict[str, Any]) -> List[str]:
+        """
+        Get the text fields of an entry that keyword search matches against.
+        
+        Args:
+            entry: A memory entry
+            
+        Returns:
+            List of searchable text values (query, string result, content)
+        """
+        texts = []
+        for field in ("query", "result", "content"):
+            value = entry.get(field)
+            if isinstance(value, str):
+                texts.append(value)
+        return texts
+
+    def _index_text(self, memory_index: int, entry: Dict[str, Any]) -> None:
+        """
+        Add an entry's searchable text to the token index.
         
-        # Index all concepts
-        for concept in all_concepts:
-            self._add_association(concept, memory_index)
+        Args:
+            memory_index: Index of the memory being indexed
+            entry: The memory entry
+        """
+        tokens = set()
+        for text in self._searchable_text(entry):
+            tokens.update(_TOKEN_PATTERN.findall(text.lower()))
+            
+        for token in tokens:
+            if token not in self.token_index:
+                self.token_index[token] = _new_postings()
+                self._add_vocabulary(token)
+            _add_posting(self.token_index[token], memory_index)
+
+    def _reset_vocabulary(self) -> None:
+        """Clear the lookup structures over the token index's vocabulary."""
+        self._sorted_vocabulary = []  # Tokens, sorted for prefix lookups
+        self._reversed_vocabulary = []  # Reversed tokens, sorted for suffix lookups
+        self._pending_vocabulary = []  # New tokens not yet merged into the sorted lists
+        self._vocabulary_grams = {}  # N-gram -> tokens containing it, for infix lookups
+
+    def _add_vocabulary(self, token: str) -> None:
+        """Register a token that is new to the token index."""
+        self._pending_vocabulary.append(token)
+        for i in range(len(token) - _GRAM_SIZE + 1):
+            gram = token[i:i + _GRAM_SIZE]
+            if gram not in self._vocabulary_grams:
+                self._vocabulary_grams[gram] = set()
+            self._vocabulary_grams[gram].add(token)
+
+    def _merge_vocabulary(self) -> None:
+        """Merge new tokens into the sorted vocabularies (two sorted runs, so cheap)."""
+        if not self._pending_vocabulary:
+            return
+        self._sorted_vocabulary.extend(self._pending_vocabulary)
+        self._sorted_vocabulary.sort()
+        self._reversed_vocabulary.extend(token[::-1] for token in self._pending_vocabulary)
+        self._reversed_vocabulary.sort()
+        self._pending_vocabulary = []
+
+    @staticmethod
+    def _tokens_with_prefix(vocabulary: List[str], prefix: str) -> List[str]:
+        """Find the tokens of a sorted vocabulary that start with a prefix."""
+        matches = []
+        position = bisect_left(vocabulary, prefix)
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            matches.append(vocabulary[position])
+            position += 1
+        return matches
+
+    def _tokens_containing(self, fragment: str) -> Iterable[str]:
+        """
+        Find the indexed tokens that contain a fragment.
+        
+        Fragments of at least _GRAM_SIZE characters are narrowed with the
+        vocabulary n-grams; only shorter fragments scan the whole vocabulary.
+        """
+        if len(fragment) < _GRAM_SIZE:
+            return [token for token in self.token_index if fragment in token]
+            
+        grams = []
+        for i in range(len(fragment) - _GRAM_SIZE + 1):
+            tokens = self._vocabulary_grams.get(fragment[i:i + _GRAM_SIZE])
+            if not tokens:
+                return []
+            grams.append(tokens)
+        grams.sort(key=len)
+        return [token for token in grams[0] if fragment in token]
+
+    def _rebuild_token_index(self) -> None:
+        """Rebuild the token index from the stored memories."""
+        self.token_index = {}
+        self._reset_vocabulary()
+        for memory_index, entry in enumerate(self.storage):
+            self._index_text(memory_index, entry)
+
+    def _candidate_indices(self, keyword: str) -> Optional[List[int]]:
+        """
+        Use the token index to find entries that may contain a keyword.
+        
+        Tokens inside the keyword must match indexed tokens exactly, while
+        tokens at its edges may be fragments of longer indexed tokens: a
+        leading token may end one, a trailing token may start one, and a
+        lone token may occur anywhere inside one. Prefixes and suffixes are
+        found by bisecting sorted vocabularies, and inner fragments through
+        vocabulary n-grams, so no lookup walks the whole vocabulary unless
+        the fragment is shorter than an n-gram.
+        
+        Args:
+            keyword: The search keyword
+            
+        Returns:
+            Sorted candidate indices, or None if the keyword has no tokens
+        """
+        needle = keyword.lower()
+        token_matches = list(_TOKEN_PATTERN.finditer(needle))
+        if not token_matches:
+            return None
+            
+        self._merge_vocabulary()
+        posting_lists = []
+        for match in token_matches:
+            token = match.group(0)
+            open_left = match.start() == 0
+            open_right = match.end() == len(needle)
+            
+            if not open_left and not open_right:
+                postings = self.token_index.get(token)
+                if postings is None:
+                    return []
+                posting_lists.append(postings)
+                continue
+                
+            # Edge tokens may be part of a longer indexed token
+            if open_left and open_right:
+                matching_tokens = self._tokens_containing(token)
+            elif open_left:
+                matching_tokens = [
+                    reversed_token[::-1]
+                    for reversed_token in self._tokens_with_prefix(self._reversed_vocabulary, token[::-1])
+                ]
+            else:
+                matching_tokens = self._tokens_with_prefix(self._sorted_vocabulary, token)
+                
+            posting_lists.append(union_postings([self.token_index[t] for t in matching_tokens]))
+        
+        return intersect_postings(posting_lists)
 
     def search(self, keyword: str, case_sensitive: bool = False, 
               limit: Optional[int] = None, include_associations: bool = True) -> Dict[int, Dict[str, Any]]:
@@ -212,74 +524,62 @@ class SullySearchMemory:
         Returns:
             Dictionary of indexed matches from memory
         """
-        direct_matches = {}
-        
-        # Direct search in storage
-        for i, entry in enumerate(self.storage):
-            entry_matched = False
-            
-            # Check query field if it exists
-            if "query" in entry:
-                haystack = entry["query"] if case_sensitive else entry["query"].lower()
-                needle = keyword if case_sensitive else keyword.lower()
-                if needle in haystack:
-                    direct_matches[i] = entry
-                    entry_matched = True
-            
-            # Check result field if it exists and is a string
-            if not entry_matched and "result" in entry:
-                if isinstance(entry["result"], str):
-                    haystack = entry["result"] if case_sensitive else entry["result"].lower()
-                    needle = keyword if case_sensitive else keyword.lower()
+        with self._lock:
+            direct_matches = {}
+            needle = keyword if case_sensitive else keyword.lower()
+        
+            # Narrow the scan to entries sharing the keyword's tokens, falling back
+            # to a full scan only when the keyword has no indexable tokens
+            candidates = self._candidate_indices(keyword)
+            if candidates is None:
+                candidates = range(len(self.storage))
+        
+            # Verify candidates with the original substring semantics
+            for i in candidates:
+                entry = self.storage[i]
+                for text in self._searchable_text(entry):
+                    haystack = text if case_sensitive else text.lower()
                     if needle in haystack:
                         direct_matches[i] = entry
-                        entry_matched = True
-            
-            # Check content field if it exists (for experience type memories)
-            if not entry_matched and "content" in entry:
-                haystack = entry["content"] if case_sensitive else entry["content"].lower()
-                needle = keyword if case_sensitive else keyword.lower()
-                if needle in haystack:
-                    direct_matches[i] = entry
-                    entry_matched = True
-                    
-            # Stop if we've reached the limit
-            if limit and len(direct_matches) >= limit:
-                break
-        
-        # If we don't need to include associations or have reached the limit, return
-        if not include_associations or (limit and len(direct_matches) >= limit):
-            return direct_matches
-        
-        # Search for associated memories
-        matches = dict(direct_matches)  # Copy direct matches
-        
-        # Normalize keyword for association lookup
-        needle = keyword.lower()
-        
-        # Look for exact concept matches in associations
-        if needle in self.associations:
-            # Add all associated memories, respecting the limit
-            for memory_index in self.associations[needle]:
-                if memory_index not in matches:
-                    matches[memory_index] = self.storage[memory_index]
-                    if limit and len(matches) >= limit:
-                        break
-        
-        # Look for partial concept matches in associations
-        if len(matches) < (limit or float('inf')):
-            for concept, indices in self.associations.items():
-                if needle in concept and concept != needle:
-                    # Add associated memories, respecting the limit
-                    for memory_index in indices:
-                        if memory_index not in matches:
-                            matches[memory_index] = self.storage[memory_index]
-                            if limit and len(matches) >= limit:
-                                break
-                    if limit and len(matches) >= limit:
                         break
-        
-        return matches
+                    
+                # Stop if we've reached the limit
+                if limit and len(direct_matches) >= limit:
+                    break
+        
+            # If we don't need to include associations or have reached the limit, return
+            if not include_associations or (limit and len(direct_matches) >= limit):
+                return direct_matches
+        
+            # Search for associated memories
+            matches = dict(direct_matches)  # Copy direct matches
+        
+            # Normalize keyword for association lookup
+            needle = keyword.lower()
+        
+            # Look for exact concept matches in associations
+            if needle in self.associations:
+                # Add all associated memories, respecting the limit
+                for memory_index in self.associations[needle]:
+                    if memory_index not in matches:
+                        matches[memory_index] = self.storage[memory_index]
+                        if limit and len(matches) >= limit:
+                            break
+        
+            # Look for partial concept matches in associations
+            if len(matches) < (limit or float('inf')):
+                for concept, indices in self.associations.items():
+                    if needle in concept and concept != needle:
+                        # Add associated memories, respecting the limit
+                        for memory_index in indices:
+                            if memory_index not in matches:
+                                matches[memory_index] = self.storage[memory_index]
+                                if limit and len(matches) >= limit:
+                                    break
+                        if limit and len(matches) >= limit:
+                            break
+        
+            return matches
 
     def get_temporal_context(self, timestamp_or_date: Union[str, datetime],
                            window_days: int = 1, limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -349,31 +649,53 @@ class SullySearchMemory:
         
         return [self.storage[idx] for idx in indices]
 
-    def find_connections(self, concept1: str, concept2: str) -> List[Dict[str, Any]]:
+    def _concept_postings(self, concepts: Iterable[str]) -> List[array]:
+        """Look up the posting lists for concepts, skipping unknown ones."""
+        postings = []
+        for concept in concepts:
+            indices = self.associations.get(concept.lower())
+            if indices is not None:
+                postings.append(indices)
+        return postings
+
+    def intersect_concepts(self, concepts: List[str]) -> List[int]:
         """
-        Find memories that connect two concepts.
+        Find the indices of memories associated with every given concept.
         
         Args:
-            concept1: First concept
-            concept2: Second concept
+            concepts: Concepts that must all be associated
             
         Returns:
-            List of memories that reference both concepts
+            Sorted memory indices
         """
-        concept1_lower = concept1.lower()
-        concept2_lower = concept2.lower()
-        
-        # Check if concepts exist in associations
-        if concept1_lower not in self.associations or concept2_lower not in self.associations:
-            return []
+        postings = self._concept_postings(concepts)
+        if not concepts or len(postings) < len(concepts):
+            return []  # An unknown concept has no memories in common
+        return intersect_postings(postings)
+
+    def union_concepts(self, concepts: List[str]) -> List[int]:
+        """
+        Find the indices of memories associated with any given concept.
         
-        # Find intersection of memory indices
-        indices1 = set(self.associations[concept1_lower])
-        indices2 = set(self.associations[concept2_lower])
-        common_indices = indices1.intersection(indices2)
+        Args:
+            concepts: Concepts to combine
+            
+        Returns:
+            Sorted memory indices
+        """
+        return union_postings(self._concept_postings(concepts))
+
+    def find_connections(self, *concepts: str) -> List[Dict[str, Any]]:
+        """
+        Find memories that connect several concepts.
         
-        # Return connected memories
-        return [self.storage[idx] for idx in common_indices]
+        Args:
+            *concepts: Two or more concepts
+            
+        Returns:
+            List of memories that reference every concept
+        """
+        return [self.storage[idx] for idx in self.intersect_concepts(list(concepts))]
 
     def export_memory(self) -> List[Dict[str, Any]]:
         """
@@ -393,7 +715,7 @@ class SullySearchMemory:
         """
         return {
             "storage": self.storage,
-            "associations": self.associations,
+            "associations": {concept: list(indices) for concept, indices in self.associations.items()},
             "temporal_index": self.temporal_index
         }
 
@@ -404,46 +726,154 @@ class SullySearchMemory:
         Returns:
             Confirmation message
         """
-        self.storage = []
-        self.associations = {}
-        self.temporal_index = {}
-        
-        # Clear persistent storage if configured
-        if self.memory_file and os.path.exists(self.memory_file):
-            try:
-                os.remove(self.memory_file)
-            except Exception as e:
-                print(f"Could not remove memory file: {e}")
+        with self._lock:
+            self.storage = []
+            self.associations = {}
+            self.temporal_index = {}
+            self.token_index = {}
+            self._reset_vocabulary()
+            
+            # Clear persistent storage if configured
+            if self.journal:
+                try:
+                    self.journal.clear()
+                except Exception as e:
+                    print(f"Could not remove memory journal: {e}")
+            if self.memory_file and os.path.exists(self.memory_file):
+                try:
+                    os.remove(self.memory_file)
+                except Exception as e:
+                    print(f"Could not remove memory file: {e}")
         
         return "[Memory system cleared]"
 
     def _save_to_file(self) -> None:
-        """Save the memory system to a file."""
+        """
+        Save the memory system to a file.
+        
+        The memory is copied under the lock but written outside it. Writes
+        are serialized, and a copy older than one already written is dropped.
+        """
         if not self.memory_file:
             return
             
+        with self._lock:
+            data = self._capture_snapshot()
+            self._save_generation += 1
+            generation = self._save_generation
+            
+        with self._save_lock:
+            if generation <= self._saved_generation:
+                return
+            try:
+                with open(self.memory_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+                self._saved_generation = generation
+            except Exception as e:
+                print(f"Could not save memory to file: {e}")
+
+    def _append_to_journal(self, memory_index: int, entry: Dict[str, Any], 
+                           concepts: List[str]) -> None:
+        """
+        Append a new memory and its association deltas to the journal.
+        
+        Args:
+            memory_index: Index of the stored memory
+            entry: The stored entry
+            concepts: Concepts associated with the entry
+        """
+        try:
+            self.journal.append({
+                "index": memory_index,
+                "entry": entry,
+                "concepts": list(concepts)
+            })
+        except Exception as e:
+            print(f"Could not append memory to journal: {e}")
+            return
+            
+        if self.journal.needs_compaction():
+            self.compact()
+
+    def _append_batch_to_journal(self, stored: List[Tuple[int, Dict[str, Any], List[str]]]) -> None:
+        """
+        Append several new memories to the journal with a single write.
+        
+        Args:
+            stored: (memory index, entry, concepts) for each stored memory
+        """
         try:
-            with open(self.memory_file, 'w', encoding='utf-8') as f:
-                json.dump(self.export_full_system(), f, indent=2)
+            self.journal.append_many([
+                {"index": memory_index, "entry": entry, "concepts": list(concepts)}
+                for memory_index, entry, concepts in stored
+            ])
         except Exception as e:
-            print(f"Could not save memory to file: {e}")
+            print(f"Could not append memories to journal: {e}")
+            return
+            
+        if self.journal.needs_compaction():
+            self.compact()
+
+    def compact(self, background: bool = True) -> None:
+        """
+        Fold the journal into the memory file snapshot.
+        
+        Args:
+            background: Whether to write the snapshot on a background thread
+        """
+        if not self.memory_file:
+            return
+            
+        if not self.journal:
+            self._save_to_file()
+            return
+            
+        with self._lock:
+            self.journal.compact(self._capture_snapshot, self._write_snapshot, background)
+
+    def _capture_snapshot(self) -> Dict[str, Any]:
+        """Copy the memory system so it can be serialized off the write path."""
+        return {
+            "storage": list(self.storage),
+            "associations": {concept: list(indices) for concept, indices in self.associations.items()},
+            "temporal_index": {key: list(indices) for key, indices in self.temporal_index.items()}
+        }
+
+    def _write_snapshot(self, data: Dict[str, Any]) -> None:
+        """Atomically write a captured snapshot to the memory file."""
+        atomic_write_json(self.memory_file, data)
 
     def _load_from_file(self) -> None:
-        """Load the memory system from a file."""
-        if not self.memory_file or not os.path.exists(self.memory_file):
+        """Load the memory system from its snapshot file and replay the journal."""
+        if not self.memory_file:
             return
             
         try:
-            with open(self.memory_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if os.path.exists(self.memory_file):
+                with open(self.memory_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    
+                # Restore memory components
+                if "storage" in data:
+                    self.storage = data["storage"]
+                if "associations" in data:
+                    self.associations = {
+                        concept: _new_postings(indices)
+                        for concept, indices in data["associations"].items()
+                    }
+                if "temporal_index" in data:
+                    self.temporal_index = data["temporal_index"]
                 
-            # Restore memory components
-            if "storage" in data:
-                self.storage = data["storage"]
-            if "associations" in data:
-                self.associations = data["associations"]
-            if "temporal_index" in data:
-                self.temporal_index = data["temporal_index"]
+            # Rebuild derived indices
+            self._rebuild_token_index()
+            
+            # Replay memories written since the last snapshot
+            if self.journal:
+                for record in self.journal.replay():
+                    # Skip records already folded into the snapshot
+                    if record.get("index") != len(self.storage):
+                        continue
+                    self._commit_entry(record["entry"], record.get("concepts", []), persist=False)
         except Exception as e:
             print(f"Could not load memory from file: {e}")
 
@@ -2,11 +2,14 @@
 # ♾️ Sully's Advanced Paradox Library — Exploring recursive contradictions and conceptual boundaries
 
 from typing import Dict, List, Any, Optional, Union, Tuple
+import copy
 import random
 import json
 import os
 from datetime import datetime
 
+from journal import RecordLog
+
 class ParadoxLibrary:
     """
     An advanced system for exploring, generating, and understanding paradoxes.
@@ -16,12 +19,16 @@ class ParadoxLibrary:
     of the tensions that exist at the boundaries of coherent thought.
     """
 
-    def __init__(self, paradox_library_path: Optional[str] = None):
+    def __init__(self, paradox_library_path: Optional[str] = None, data_path: Optional[str] = None,
+                 compact_every: int = 1000):
         """
         Initialize the paradox library with configurable options.
         
         Args:
             paradox_library_path: Optional path to a JSON file with additional paradoxes
+            data_path: Optional snapshot path; when set, every added paradox is
+                journaled as it happens and the library is reloaded from it
+            compact_every: Journaled changes that trigger snapshot compaction
         """
         # Core paradox collection
         self.paradoxes = {
@@ -250,6 +257,32 @@ class ParadoxLibrary:
                         self._build_concept_index()  # Rebuild the index
             except Exception as e:
                 print(f"Error loading paradox library: {e}")
+                
+        # Incremental persistence: a snapshot plus a journal of changes since
+        self.record_log = None
+        if data_path:
+            self.open_record_log(data_path, compact_every)
+
+    def open_record_log(self, data_path: str, compact_every: int = 1000) -> None:
+        """
+        Reloads the library from a snapshot path and journals every later
+        addition to it.
+        
+        Args:
+            data_path: Snapshot path (its journal sits beside it)
+            compact_every: Journaled changes that trigger snapshot compaction
+        """
+        self.record_log = RecordLog(data_path, compact_every=compact_every)
+        self._load_records()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickles the library without its record log; a restored library
+        journals again only once open_record_log() is called.
+        """
+        state = self.__dict__.copy()
+        state["record_log"] = None
+        return state
 
     def get(self, topic: str) -> Dict[str, Any]:
         """
@@ -538,6 +571,7 @@ class ParadoxLibrary:
                 "resolution_approaches": ["reframe_perspective", "embrace_contradiction"],
                 "examples": [topic]
             }
+            self._log_change({"op": "type", "name": type_, "data": self.paradox_types[type_]})
             
         # Default resolution strategies if none provided
         if not resolution_strategies:
@@ -550,6 +584,7 @@ class ParadoxLibrary:
             related_concepts = [word for word in words if len(word) > 3 and word not in ["this", "that", "with", "from"]][:5]
             
         # Create the paradox entry
+        replaced = topic in self.paradoxes
         self.paradoxes[topic] = {
             "type": type_,
             "description": description,
@@ -560,7 +595,12 @@ class ParadoxLibrary:
         }
         
         # Update the concept index
-        self._build_concept_index()
+        if replaced:
+            self._build_concept_index()
+        else:
+            self._index_paradox(topic, self.paradoxes[topic])
+            
+        self._log_change({"op": "paradox", "topic": topic, "data": self.paradoxes[topic]})
         
         return f"Paradox '{topic}' added to the library."
 
@@ -801,6 +841,59 @@ class ParadoxLibrary:
                 
         return patterns
 
+    def _log_change(self, record: Dict[str, Any]) -> None:
+        """Journals one change, compacting once enough have accumulated."""
+        if not self.record_log:
+            return
+        try:
+            self.record_log.append(record)
+        except Exception as e:
+            print(f"Error journaling paradox library: {e}")
+            return
+            
+        if self.record_log.needs_compaction():
+            self.compact()
+
+    def compact(self, background: bool = True) -> None:
+        """
+        Folds the change journal into a fresh snapshot (journaled libraries only).
+        
+        Args:
+            background: Whether to write the snapshot on a background thread
+        """
+        if self.record_log:
+            self.record_log.compact(self._capture_records, background)
+
+    def _capture_records(self) -> List[Dict[str, Any]]:
+        """
+        Captures the library as snapshot records.
+        
+        The records are deep copies, since they are written on a background
+        thread while the library keeps changing.
+        """
+        records = [{"op": "paradox", "topic": topic, "data": data} for topic, data in self.paradoxes.items()]
+        records.extend({"op": "type", "name": name, "data": data} for name, data in self.paradox_types.items())
+        records.extend(
+            {"op": "strategy", "name": name, "data": data}
+            for name, data in self.resolution_strategies.items()
+        )
+        return copy.deepcopy(records)
+
+    def _load_records(self) -> None:
+        """Rebuilds the library by streaming its snapshot and journal."""
+        try:
+            for record in self.record_log.load():
+                op = record.get("op")
+                if op == "paradox":
+                    self.paradoxes[record["topic"]] = record["data"]
+                elif op == "type":
+                    self.paradox_types[record["name"]] = record["data"]
+                elif op == "strategy":
+                    self.resolution_strategies[record["name"]] = record["data"]
+        except Exception as e:
+            print(f"Error loading paradox library: {e}")
+        self._build_concept_index()
+
     def save_library(self, filepath: str) -> str:
         """
         Saves the paradox library to a JSON file.
@@ -871,13 +964,17 @@ class ParadoxLibrary:
         self.concept_to_paradox = {}
         
         for paradox_name, paradox_data in self.paradoxes.items():
-            if "related_concepts" in paradox_data:
-                for concept in paradox_data["related_concepts"]:
-                    concept_lower = concept.lower()
-                    if concept_lower not in self.concept_to_paradox:
-                        self.concept_to_paradox[concept_lower] = []
-                    if paradox_name not in self.concept_to_paradox[concept_lower]:
-                        self.concept_to_paradox[concept_lower].append(paradox_name)
+            self._index_paradox(paradox_name, paradox_data)
+
+    def _index_paradox(self, paradox_name: str, paradox_data: Dict[str, Any]) -> None:
+        """Adds one paradox's related concepts to the concept index."""
+        if "related_concepts" in paradox_data:
+            for concept in paradox_data["related_concepts"]:
+                concept_lower = concept.lower()
+                if concept_lower not in self.concept_to_paradox:
+                    self.concept_to_paradox[concept_lower] = []
+                if paradox_name not in self.concept_to_paradox[concept_lower]:
+                    self.concept_to_paradox[concept_lower].append(paradox_name)
 
 
 if __name__ == "__main__":
@@ -2,27 +2,104 @@
 Advanced PDF text extraction with OCR capabilities and content structuring.
 Supports multiple extraction strategies and content organization.
 """
-from pdf2image import convert_from_path
-from PIL import Image
-import pytesseract
 import os
-import PyPDF2
-import fitz  # PyMuPDF
 import logging
-from typing import List, Dict, Any, Optional, Union, Tuple
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional, Union, Tuple, Callable, Iterator
 import json
 import re
 
+from extraction_cache import ExtractionCache
+
+# The PDF/OCR stack (PyMuPDF, PyPDF2, pdf2image, PIL, pytesseract) is imported
+# inside the methods that use it, so importing this module stays cheap and the
+# libraries are only loaded once a PDF is actually processed.
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _ocr_page_range(pdf_path: str, first_page: int, last_page: int,
+                    dpi: int, language: str) -> List[str]:
+    """
+    Rasterize and OCR a range of pages (1-based, inclusive).
+    
+    Runs in a worker process, so only this range's page images are in
+    memory at any time.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        first_page: First page to OCR
+        last_page: Last page to OCR
+        dpi: Resolution for PDF-to-image conversion
+        language: OCR language for pytesseract
+        
+    Returns:
+        List of page texts for the range
+    """
+    from pdf2image import convert_from_path
+    import pytesseract
+    
+    images = convert_from_path(pdf_path, dpi=dpi, first_page=first_page, last_page=last_page)
+    text_by_page = []
+    for img in images:
+        text_by_page.append(pytesseract.image_to_string(img, lang=language).strip())
+        img.close()
+    return text_by_page
+
+
+# One OCR process pool shared by every reader, created on first use and
+# sized by the first reader that needs it. Workers are spawned rather than
+# forked, since readers run on ingestion threads.
+_ocr_pool = None
+_ocr_pool_lock = threading.Lock()
+
+
+def _get_ocr_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Returns the shared OCR process pool, creating it if needed."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ProcessPoolExecutor(max_workers=max_workers,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        return _ocr_pool
+
+
+def _discard_ocr_pool(pool: ProcessPoolExecutor) -> None:
+    """Drops a broken shared pool so the next OCR call starts a fresh one."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is pool:
+            _ocr_pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_ocr_pool(wait: bool = True) -> None:
+    """
+    Stops the shared OCR process pool.
+    
+    Args:
+        wait: Whether to wait for running OCR tasks to finish
+    """
+    global _ocr_pool
+    with _ocr_pool_lock:
+        pool, _ocr_pool = _ocr_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
 class PDFReader:
     """
     Enhanced PDF text extraction with multiple strategies and content structuring.
     Implements fallback mechanisms and content organization.
     """
-    def __init__(self, ocr_enabled: bool = True, dpi: int = 300, language: str = 'eng'):
+    def __init__(self, ocr_enabled: bool = True, dpi: int = 300, language: str = 'eng',
+                 ocr_workers: Optional[int] = None, ocr_pages_per_task: int = 1,
+                 min_text_density: int = 25, cache: Optional[ExtractionCache] = None):
         """
         Initialize the PDF reader with configurable options.
         
@@ -30,16 +107,29 @@ class PDFReader:
             ocr_enabled: Whether to use OCR for text extraction
             dpi: Resolution for PDF-to-image conversion when using OCR
             language: OCR language for pytesseract
+            ocr_workers: Processes used for OCR (defaults to the CPU count; 1 runs
+                inline). The process pool is shared by all readers and sized by
+                the first one to start it.
+            ocr_pages_per_task: Pages rasterized and OCR'd per worker task
+            min_text_density: Non-whitespace characters below which a page's
+                native text is treated as missing and the page is re-extracted
+            cache: Optional cache of extraction results keyed by file content
         """
         self.ocr_enabled = ocr_enabled
         self.dpi = dpi
         self.language = language
+        self.ocr_workers = ocr_workers or os.cpu_count() or 1
+        self.ocr_pages_per_task = max(1, ocr_pages_per_task)
+        self.min_text_density = min_text_density
+        self.cache = cache
         self.last_error = None
         
     def extract_text(self, pdf_path: str, verbose: bool = True, 
                     use_ocr_fallback: bool = True, 
                     extract_structure: bool = True,
-                    extract_metadata: bool = True) -> Dict[str, Any]:
+                    extract_metadata: bool = True,
+                    progress_callback: Optional[Callable[[int, int], None]] = None,
+                    hybrid: bool = True) -> Dict[str, Any]:
         """
         Extract text from a PDF using multiple strategies with fallback.
         
@@ -49,6 +139,9 @@ class PDFReader:
             use_ocr_fallback: Whether to use OCR as a fallback if native extraction fails
             extract_structure: Whether to attempt extracting document structure
             extract_metadata: Whether to extract PDF metadata
+            progress_callback: Called with (pages done, page count) as OCR progresses
+            hybrid: Whether to choose the extraction method per page, re-extracting
+                only sparse pages, instead of retrying whole documents
             
         Returns:
             Dictionary containing extracted text, metadata, and structure
@@ -58,6 +151,46 @@ class PDFReader:
             logger.error(error_msg)
             return {"error": error_msg}
             
+        if self.cache is None:
+            return self._extract_text(pdf_path, verbose, use_ocr_fallback, extract_structure,
+                                      extract_metadata, progress_callback, hybrid)
+        
+        # Reuse an earlier extraction of identical bytes with the same options
+        cache_key = self.cache.key(pdf_path, {
+            "extractor": "pdf",
+            "ocr": self.ocr_enabled and use_ocr_fallback,
+            "dpi": self.dpi,
+            "language": self.language,
+            "min_text_density": self.min_text_density,
+            "structure": extract_structure,
+            "metadata": extract_metadata,
+            "hybrid": hybrid
+        })
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            if verbose:
+                logger.info(f"Using cached extraction for {pdf_path}")
+            return {
+                **cached,
+                "path": pdf_path,
+                "filename": os.path.basename(pdf_path),
+                "text": "\n\n".join(page["text"] for page in cached["pages"]),
+                "cached": True
+            }
+        
+        result = self._extract_text(pdf_path, verbose, use_ocr_fallback, extract_structure,
+                                    extract_metadata, progress_callback, hybrid)
+        
+        # Only successful extractions are cached; the joined text is rebuilt from pages
+        if result.get("success"):
+            self.cache.put(cache_key, {k: v for k, v in result.items() if k != "text"})
+        return result
+    
+    def _extract_text(self, pdf_path: str, verbose: bool, use_ocr_fallback: bool,
+                      extract_structure: bool, extract_metadata: bool,
+                      progress_callback: Optional[Callable[[int, int], None]],
+                      hybrid: bool) -> Dict[str, Any]:
+        """Runs the extraction strategies; see extract_text for the arguments."""
         result = {
             "path": pdf_path,
             "filename": os.path.basename(pdf_path),
@@ -71,6 +204,10 @@ class PDFReader:
         # Add metadata if requested
         if extract_metadata:
             result["metadata"] = self._extract_metadata(pdf_path)
+            
+        if hybrid:
+            return self._extract_hybrid(pdf_path, result, verbose, use_ocr_fallback,
+                                        extract_structure, progress_callback)
         
         # Try PyMuPDF first (usually best quality)
         try:
@@ -118,7 +255,7 @@ class PDFReader:
                 if verbose:
                     logger.info(f"Attempting OCR extraction for {pdf_path}")
                     
-                text_by_page, page_count = self._extract_with_ocr(pdf_path, verbose)
+                text_by_page, page_count = self._extract_with_ocr(pdf_path, verbose, progress_callback)
                 
                 if text_by_page:
                     result["success"] = True
@@ -135,6 +272,130 @@ class PDFReader:
         result["error"] = f"Text extraction failed with all methods. Last error: {self.last_error}"
         return result
     
+    def _extract_hybrid(self, pdf_path: str, result: Dict[str, Any], verbose: bool,
+                        use_ocr_fallback: bool, extract_structure: bool,
+                        progress_callback: Optional[Callable[[int, int], None]]) -> Dict[str, Any]:
+        """
+        Extract text choosing the method per page.
+        
+        Native text is kept for every page dense enough to trust; only sparse
+        pages are retried with PyPDF2 and then OCR.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            result: Result dictionary to fill in
+            verbose: Whether to print progress information
+            use_ocr_fallback: Whether to OCR pages native extraction could not read
+            extract_structure: Whether to attempt extracting document structure
+            progress_callback: Called with (pages done, pages to OCR) as OCR progresses
+            
+        Returns:
+            Dictionary containing extracted text, per-page methods, and structure
+        """
+        text_by_page = None
+        page_methods = []
+        
+        # Step 1: Native extraction of every page, PyMuPDF first
+        try:
+            if verbose:
+                logger.info(f"Attempting PyMuPDF extraction for {pdf_path}")
+            text_by_page, page_count, structure = self._extract_with_pymupdf(pdf_path, extract_structure)
+            page_methods = ["pymupdf"] * page_count
+            if extract_structure and structure:
+                result["structure"] = structure
+        except Exception as e:
+            self.last_error = str(e)
+            logger.warning(f"PyMuPDF extraction failed: {e}")
+        
+        # Step 2: PyPDF2 for the pages PyMuPDF left sparse (or all pages)
+        sparse_pages = self._sparse_pages(text_by_page)
+        if text_by_page is None or sparse_pages:
+            try:
+                if verbose:
+                    logger.info(f"Attempting PyPDF2 extraction for {pdf_path}")
+                pypdf2_text, page_count = self._extract_with_pypdf2(pdf_path, pages=sparse_pages)
+                if text_by_page is None:
+                    text_by_page, page_methods = pypdf2_text, ["pypdf2"] * page_count
+                else:
+                    self._merge_pages(text_by_page, page_methods, pypdf2_text, sparse_pages, "pypdf2")
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning(f"PyPDF2 extraction failed: {e}")
+        
+        # Step 3: OCR only the pages still below the density threshold
+        sparse_pages = self._sparse_pages(text_by_page)
+        if self.ocr_enabled and use_ocr_fallback and (text_by_page is None or sparse_pages):
+            try:
+                if verbose:
+                    logger.info(f"Attempting OCR extraction for {pdf_path} "
+                                f"({len(sparse_pages) if sparse_pages else 'all'} pages)")
+                ocr_text, page_count = self._extract_with_ocr(pdf_path, verbose, progress_callback,
+                                                              pages=sparse_pages)
+                if text_by_page is None:
+                    text_by_page, page_methods = ocr_text, ["ocr"] * page_count
+                else:
+                    self._merge_pages(text_by_page, page_methods, ocr_text, sparse_pages, "ocr")
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"OCR extraction failed: {e}")
+        
+        if not text_by_page or not any(page.strip() for page in text_by_page):
+            result["error"] = f"Text extraction failed with all methods. Last error: {self.last_error}"
+            return result
+        
+        methods_used = set(page_methods)
+        result["success"] = True
+        result["extraction_method"] = methods_used.pop() if len(methods_used) == 1 else "hybrid"
+        result["page_count"] = len(text_by_page)
+        result["text"] = "\n\n".join(text_by_page)
+        result["pages"] = [
+            {"number": i+1, "text": text, "method": method}
+            for i, (text, method) in enumerate(zip(text_by_page, page_methods))
+        ]
+        result["page_methods"] = page_methods
+        return result
+        
+    def _text_density(self, text: Optional[str]) -> int:
+        """Counts the non-whitespace characters of a page's text."""
+        return len(re.sub(r"\s+", "", text)) if text else 0
+        
+    def _sparse_pages(self, text_by_page: Optional[List[str]]) -> Optional[List[int]]:
+        """
+        Finds pages whose text falls below the density threshold.
+        
+        Args:
+            text_by_page: Page texts, or None if nothing has been extracted
+            
+        Returns:
+            1-based numbers of sparse pages, or None if there are no page texts
+        """
+        if text_by_page is None:
+            return None
+        return [
+            i + 1 for i, text in enumerate(text_by_page)
+            if self._text_density(text) < self.min_text_density
+        ]
+        
+    def _merge_pages(self, text_by_page: List[str], page_methods: List[str],
+                     candidate_text: List[str], pages: List[int], method: str) -> None:
+        """
+        Replaces page texts with re-extracted ones where they are denser.
+        
+        Args:
+            text_by_page: Current page texts (updated in place)
+            page_methods: Current per-page methods (updated in place)
+            candidate_text: Re-extracted page texts
+            pages: 1-based numbers of the re-extracted pages
+            method: Name of the re-extraction method
+        """
+        for page_number in pages:
+            index = page_number - 1
+            if index >= len(candidate_text):
+                continue
+            if self._text_density(candidate_text[index]) > self._text_density(text_by_page[index]):
+                text_by_page[index] = candidate_text[index]
+                page_methods[index] = method
+    
     def _extract_with_pymupdf(self, pdf_path: str, extract_structure: bool = True) -> Tuple[List[str], int, Optional[Dict[str, Any]]]:
         """
         Extract text using PyMuPDF (fitz).
@@ -146,6 +407,8 @@ class PDFReader:
         Returns:
             Tuple of (list of page texts, page count, optional structure dict)
         """
+        import fitz  # PyMuPDF
+        
         doc = fitz.open(pdf_path)
         page_count = len(doc)
         text_by_page = []
@@ -164,51 +427,128 @@ class PDFReader:
         doc.close()
         return text_by_page, page_count, structure
         
-    def _extract_with_pypdf2(self, pdf_path: str) -> Tuple[List[str], int]:
+    def _extract_with_pypdf2(self, pdf_path: str, pages: Optional[List[int]] = None) -> Tuple[List[str], int]:
         """
         Extract text using PyPDF2.
         
         Args:
             pdf_path: Path to the PDF file
+            pages: Optional 1-based page numbers to extract (others are left empty)
             
         Returns:
             Tuple of (list of page texts, page count)
         """
+        import PyPDF2
+        
         with open(pdf_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
             page_count = len(reader.pages)
-            text_by_page = []
+            text_by_page = [""] * page_count
             
-            for page_num in range(page_count):
+            page_numbers = range(page_count) if pages is None else [p - 1 for p in pages]
+            for page_num in page_numbers:
                 page = reader.pages[page_num]
                 text = page.extract_text()
-                text_by_page.append(text)
+                text_by_page[page_num] = text or ""
                 
         return text_by_page, page_count
         
-    def _extract_with_ocr(self, pdf_path: str, verbose: bool = True) -> Tuple[List[str], int]:
+    def _extract_with_ocr(self, pdf_path: str, verbose: bool = True,
+                          progress_callback: Optional[Callable[[int, int], None]] = None,
+                          pages: Optional[List[int]] = None) -> Tuple[List[str], int]:
         """
         Extract text using OCR via pdf2image and pytesseract.
         
+        Page ranges are rasterized and OCR'd in the shared worker pool, with at
+        most two tasks per worker in flight so memory stays bounded.
+        
         Args:
             pdf_path: Path to the PDF file
             verbose: Whether to print progress information
+            progress_callback: Called with (pages done, pages to OCR) as pages finish
+            pages: Optional 1-based page numbers to OCR (others are left empty)
             
         Returns:
             Tuple of (list of page texts, page count)
         """
-        images = convert_from_path(pdf_path, dpi=self.dpi)
-        page_count = len(images)
-        text_by_page = []
+        from pdf2image import pdfinfo_from_path
         
-        for i, img in enumerate(images):
-            text = pytesseract.image_to_string(img, lang=self.language)
-            if verbose:
-                char_count = len(text)
-                logger.info(f"[OCR] Page {i+1}/{page_count}: {char_count} characters")
-            text_by_page.append(text.strip())
+        page_count = pdfinfo_from_path(pdf_path)["Pages"]
+        return self._ocr_pages(pdf_path, pages, page_count, verbose, progress_callback), page_count
         
-        return text_by_page, page_count
+    def _ocr_pages(self, pdf_path: str, pages: Optional[List[int]], page_count: int,
+                   verbose: bool = True,
+                   progress_callback: Optional[Callable[[int, int], None]] = None) -> List[str]:
+        """
+        OCR the given pages, in the shared worker pool when there is more than
+        one page range.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            pages: 1-based page numbers to OCR (None for all pages)
+            page_count: Number of pages in the PDF
+            verbose: Whether to print progress information
+            progress_callback: Called with (pages done, pages to OCR) as pages finish
+            
+        Returns:
+            List of page texts (pages not OCR'd are left empty)
+        """
+        text_by_page = [""] * page_count
+        pages_done = 0
+        
+        # Split the requested pages into runs of consecutive pages, each at
+        # most ocr_pages_per_task long (1-based, inclusive)
+        if pages is None:
+            pages = range(1, page_count + 1)
+        ranges = []
+        for page_number in sorted(set(pages)):
+            if ranges and ranges[-1][1] == page_number - 1 and \
+                    page_number - ranges[-1][0] < self.ocr_pages_per_task:
+                ranges[-1] = (ranges[-1][0], page_number)
+            else:
+                ranges.append((page_number, page_number))
+        pages_to_ocr = sum(last - first + 1 for first, last in ranges)
+        
+        def record_range(first_page: int, texts: List[str]) -> None:
+            nonlocal pages_done
+            for offset, text in enumerate(texts):
+                text_by_page[first_page - 1 + offset] = text
+                pages_done += 1
+                if verbose:
+                    logger.info(f"[OCR] Page {first_page + offset}/{page_count}: {len(text)} characters")
+            if progress_callback:
+                progress_callback(pages_done, pages_to_ocr)
+        
+        if self.ocr_workers <= 1 or len(ranges) <= 1:
+            for first, last in ranges:
+                record_range(first, _ocr_page_range(pdf_path, first, last, self.dpi, self.language))
+            return text_by_page
+        
+        max_in_flight = self.ocr_workers * 2
+        executor = _get_ocr_pool(self.ocr_workers)
+        in_flight = {}
+        next_range = 0
+        try:
+            while next_range < len(ranges) or in_flight:
+                # Keep the window full
+                while next_range < len(ranges) and len(in_flight) < max_in_flight:
+                    first, last = ranges[next_range]
+                    future = executor.submit(_ocr_page_range, pdf_path, first, last, self.dpi, self.language)
+                    in_flight[future] = first
+                    next_range += 1
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record_range(in_flight.pop(future), future.result())
+        except BrokenProcessPool:
+            _discard_ocr_pool(executor)
+            raise
+        finally:
+            # Leave the shared pool free of this document's remaining tasks
+            for future in in_flight:
+                future.cancel()
+        
+        return text_by_page
         
     def _extract_metadata(self, pdf_path: str) -> Dict[str, Any]:
         """
@@ -224,12 +564,14 @@ class PDFReader:
         
         # Try PyMuPDF first
         try:
+            import fitz  # PyMuPDF
             doc = fitz.open(pdf_path)
             metadata = doc.metadata
             doc.close()
         except Exception:
             # Fall back to PyPDF2
             try:
+                import PyPDF2
                 with open(pdf_path, 'rb') as file:
                     reader = PyPDF2.PdfReader(file)
                     if reader.metadata:
@@ -242,7 +584,7 @@ class PDFReader:
         
         return metadata
         
-    def _extract_document_structure(self, doc: fitz.Document) -> Dict[str, Any]:
+    def _extract_document_structure(self, doc: "fitz.Document") -> Dict[str, Any]:
         """
         Extract document structure including TOC and potential sections.
         
@@ -281,6 +623,104 @@ class PDFReader:
         
         return structure
     
+    def extract_structure(self, pdf_path: str) -> Dict[str, Any]:
+        """
+        Extract a PDF's table of contents and sections without reading its text.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Dictionary with structure information (empty if unavailable)
+        """
+        try:
+            import fitz  # PyMuPDF
+            doc = fitz.open(pdf_path)
+            try:
+                return self._extract_document_structure(doc)
+            finally:
+                doc.close()
+        except Exception as e:
+            logger.warning(f"Failed to extract structure: {e}")
+            return {"toc": [], "sections": []}
+    
+    def iter_pages(self, pdf_path: str, use_ocr_fallback: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a PDF's pages, holding only a bounded window of pages at a time.
+        
+        Each window's sparse pages are OCR'd together in the shared worker pool
+        when OCR is enabled. With a cache, pages of identical bytes are served
+        from it, and a completed extraction is stored for the next time. If
+        PyMuPDF cannot open the file, the pages of a regular extraction are
+        yielded.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            use_ocr_fallback: Whether to OCR pages below the density threshold
+            
+        Returns:
+            Iterator of page dictionaries with number, text and method
+        """
+        ocr = self.ocr_enabled and use_ocr_fallback
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(pdf_path, {
+                "extractor": "pdf_pages",
+                "ocr": ocr,
+                "dpi": self.dpi,
+                "language": self.language,
+                "min_text_density": self.min_text_density
+            })
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield from cached["pages"]
+                return
+        
+        try:
+            import fitz  # PyMuPDF
+            doc = fitz.open(pdf_path)
+        except Exception as e:
+            logger.warning(f"PyMuPDF could not open {pdf_path}, extracting whole document: {e}")
+            result = self.extract_text(pdf_path, verbose=False, use_ocr_fallback=use_ocr_fallback,
+                                       extract_structure=False, extract_metadata=False)
+            for page in result.get("pages", []):
+                yield page
+            return
+        
+        # Twice the pool's in-flight limit, so workers stay busy through most of a window
+        window = self.ocr_workers * 4 * self.ocr_pages_per_task
+        extracted = [] if cache_key else None  # Page texts kept for the cache entry
+        complete = True
+        try:
+            page_count = len(doc)
+            for first in range(0, page_count, window):
+                numbers = range(first + 1, min(first + window, page_count) + 1)
+                texts = [doc.load_page(number - 1).get_text() for number in numbers]
+                methods = ["pymupdf"] * len(texts)
+                
+                sparse = [number for number, text in zip(numbers, texts)
+                          if self._text_density(text) < self.min_text_density]
+                if ocr and sparse:
+                    try:
+                        ocr_text = self._ocr_pages(pdf_path, sparse, page_count, verbose=False)
+                        self._merge_pages(texts, methods, ocr_text[first:first + len(texts)],
+                                          [number - first for number in sparse], "ocr")
+                    except Exception as e:
+                        complete = False
+                        logger.warning(f"OCR of pages {sparse[0]}-{sparse[-1]} failed: {e}")
+                
+                for number, text, method in zip(numbers, texts, methods):
+                    page = {"number": number, "text": text, "method": method}
+                    if extracted is not None:
+                        extracted.append(page)
+                    yield page
+        finally:
+            doc.close()
+        
+        # Only fully extracted documents are cached
+        if extracted is not None and complete:
+            self.cache.put(cache_key, {"pages": extracted})
+    
     def extract_images(self, pdf_path: str, output_dir: Optional[str] = None,
                       min_size: int = 100) -> List[Dict[str, Any]]:
         """
@@ -304,6 +744,10 @@ class PDFReader:
         images_info = []
         
         try:
+            import io
+            import fitz  # PyMuPDF
+            from PIL import Image
+            
             doc = fitz.open(pdf_path)
             
             for page_index in range(len(doc)):
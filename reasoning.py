@@ -1,11 +1,113 @@
 # sully_engine/reasoning.py
 # 🧠 Sully's Advanced Symbolic Reasoning Engine
 
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import json
+import multiprocessing
 import random
+import zlib
 from datetime import datetime
 
+class ReasoningContext:
+    """
+    Request-scoped cache of the lookups every cognitive mode shares.
+    
+    The codex search, memory search and math translation for a phrase are
+    computed on first use and reused by every mode that reasons about the
+    same phrase within one request.
+    """
+    def __init__(self, phrase: str, codex, translator, memory,
+                 lookups: Optional[Dict[Tuple[Any, ...], Any]] = None):
+        """
+        Initialize the context for a single phrase.
+        
+        Args:
+            phrase: The phrase being reasoned about
+            codex: The conceptual knowledge base
+            translator: The mathematical/symbolic translator
+            memory: The experiential memory system
+            lookups: Optional lookups computed elsewhere (e.g. in a parent process)
+        """
+        self.phrase = phrase
+        self.codex = codex
+        self.translator = translator
+        self.memory = memory
+        self._lookups = dict(lookups) if lookups else {}
+        
+    def _lookup(self, key: Tuple[Any, ...], compute) -> Any:
+        """Returns a cached lookup, computing it on first use."""
+        if key not in self._lookups:
+            self._lookups[key] = compute()
+        return self._lookups[key]
+        
+    def related_concepts(self, limit: Optional[int] = 10) -> Dict[str, Any]:
+        """Codex entries related to the phrase."""
+        return self._lookup(
+            ("codex", limit),
+            lambda: self.codex.search(self.phrase, semantic=True, limit=limit)
+        )
+        
+    def memory_matches(self, limit: Optional[int] = 5) -> Dict[int, Dict[str, Any]]:
+        """Memories matching the phrase, including associated memories."""
+        return self._lookup(
+            ("memory", limit),
+            lambda: self.memory.search(self.phrase, include_associations=True, limit=limit)
+        )
+        
+    def math_translation(self, rng: Optional[random.Random] = None) -> Union[Dict[str, Any], str]:
+        """
+        Mathematical interpretation of the phrase. The generator, if given,
+        drives the translator's phrasing when the lookup is first computed.
+        """
+        return self._lookup(("math",), lambda: self.translator.translate(self.phrase, rng=rng))
+        
+    def key_concepts(self) -> List[str]:
+        """Significant words of the phrase, in order of appearance."""
+        def extract():
+            return [
+                word.lower() for word in self.phrase.split()
+                if len(word) > 3 and word.lower() not in ["this", "that", "with", "from", "have", "what", "when", "where"]
+            ]
+        return self._lookup(("key_concepts",), extract)
+        
+    def prefetch(self, rng: Optional[random.Random] = None) -> Dict[Tuple[Any, ...], Any]:
+        """
+        Computes every lookup the baseline reasoning process needs, so the
+        context can be shared read-only across threads or shipped to workers.
+        
+        Args:
+            rng: Random generator for the math translation's phrasing
+            
+        Returns:
+            The computed lookups
+        """
+        self.related_concepts()
+        self.memory_matches()
+        self.math_translation(rng)
+        self.key_concepts()
+        return self._lookups
+
+
+def _mode_rng(seed: Optional[int], mode: str) -> random.Random:
+    """
+    Returns a random generator for one cognitive mode, derived from the request
+    seed. Unseeded requests draw a seed from the global random module, so
+    random.seed() still makes them reproducible.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    return random.Random(zlib.crc32(f"{seed}:{mode}".encode("utf-8")))
+
+
+def _run_mode_in_worker(mode: str, phrase: str, lookups: Dict[Tuple[Any, ...], Any],
+                        seed: Optional[int]) -> Dict[str, Any]:
+    """Runs one cognitive mode in a worker process against precomputed lookups."""
+    node = SymbolicReasoningNode(None, None, None)
+    context = ReasoningContext(phrase, None, None, None, lookups=lookups)
+    return node.cognitive_frameworks[mode]["process"](phrase, context, _mode_rng(seed, mode))
+
+
 class SymbolicReasoningNode:
     """
     Core reasoning engine that synthesizes meaning from symbolic input.
@@ -14,7 +116,9 @@ class SymbolicReasoningNode:
     and respond to input with varying tones, depths, and cognitive frameworks. It forms
     the central processing architecture of Sully's cognition.
     """
-    def __init__(self, codex, translator, memory):
+    def __init__(self, codex, translator, memory, executor: Optional[str] = None,
+                 max_workers: Optional[int] = None, seed: Optional[int] = None,
+                 memory_policy: str = "compact"):
         """
         Initialize the reasoning node with its core knowledge components.
         
@@ -22,11 +126,27 @@ class SymbolicReasoningNode:
             codex: The conceptual knowledge base
             translator: The mathematical/symbolic translator
             memory: The experiential memory system
+            executor: Pool used to run cognitive modes concurrently
+                ("thread", "process", or None to run them sequentially)
+            max_workers: Maximum number of pool workers
+            seed: Default seed for reproducible multi-mode responses
+            memory_policy: How reasoning results are written to memory
+                ("compact", "full", or "none")
         """
         self.codex = codex
         self.translator = translator
         self.memory = memory
         
+        # Multi-mode execution settings; the pool is created on first use
+        self.executor_type = executor if executor in ("thread", "process") else None
+        self.max_workers = max_workers
+        self.seed = seed
+        self._executor = None
+        
+        # Compact records store the response and reference related concepts
+        # and memories by key, instead of embedding their full content
+        self.memory_policy = memory_policy if memory_policy in ("compact", "full", "none") else "compact"
+        
         # Cognitive frameworks for different reasoning modes
         self.cognitive_frameworks = {
             "emergent": {
@@ -140,17 +260,52 @@ class SymbolicReasoningNode:
             }
         }
 
-    def reason(self, phrase: str, tone: str = "emergent") -> Union[str, Dict[str, Any]]:
+    def create_context(self, phrase: str) -> ReasoningContext:
+        """
+        Create a context that shares lookups between reasoning calls on one phrase.
+        
+        Args:
+            phrase: The phrase to be reasoned about
+            
+        Returns:
+            A fresh reasoning context
+        """
+        return ReasoningContext(phrase, self.codex, self.translator, self.memory)
+
+    def reason(self, phrase: str, tone: str = "emergent",
+               context: Optional[ReasoningContext] = None,
+               store: bool = True) -> Union[str, Dict[str, Any]]:
         """
         Process input through Sully's multi-modal reasoning system.
         
         Args:
             phrase: Input message or symbolic statement
             tone: Cognitive mode to engage (emergent, analytical, creative, etc.)
+            context: Optional shared context for lookups on the same phrase
+            store: Whether to write the result to memory (per the memory policy)
             
         Returns:
             Either a string response or a dictionary with reasoning components
         """
+        mode, result = self.think(phrase, tone, context)
+        return self._record_result(phrase, result, mode, store)
+
+    def think(self, phrase: str, tone: str = "emergent",
+              context: Optional[ReasoningContext] = None) -> Tuple[str, Union[str, Dict[str, Any]]]:
+        """
+        Process input through one cognitive mode without writing to memory.
+        
+        Pair with record_turn() to store the turn once its final response
+        is known.
+        
+        Args:
+            phrase: Input message or symbolic statement
+            tone: Cognitive mode to engage (emergent, analytical, creative, etc.)
+            context: Optional shared context for lookups on the same phrase
+            
+        Returns:
+            Tuple of (cognitive mode used, cognitive process result)
+        """
         # Normalize tone
         normalized_tone = tone.lower() if tone else "emergent"
         
@@ -162,40 +317,182 @@ class SymbolicReasoningNode:
         framework = self.cognitive_frameworks[normalized_tone]
         
         # Process through the appropriate cognitive process
-        result = framework["process"](phrase)
+        return normalized_tone, framework["process"](phrase, context)
+
+    def record_turn(self, phrase: str, result: Union[str, Dict[str, Any]], mode: str,
+                    response: Optional[str] = None) -> Union[str, Dict[str, Any]]:
+        """
+        Stores a turn reasoned with think() in memory, once, per the memory policy.
+        
+        Args:
+            phrase: The phrase that was reasoned about
+            result: The cognitive process result
+            mode: The cognitive mode that produced the result
+            response: Final response of the turn, if it extends the result's own
+            
+        Returns:
+            The response that was stored
+        """
+        return self._record_result(phrase, result, mode, response=response)
+
+    def _record_result(self, phrase: str, result: Union[str, Dict[str, Any]],
+                       mode: str, store: bool = True,
+                       response: Optional[str] = None) -> Union[str, Dict[str, Any]]:
+        """
+        Stores a reasoning result in memory and extracts its response.
+        
+        Args:
+            phrase: The phrase that was reasoned about
+            result: The cognitive process result
+            mode: The cognitive mode that produced the result
+            store: Whether to write the result to memory
+            response: Response to store and return in place of the result's own
+            
+        Returns:
+            Either a string response or the full reasoning object
+        """
+        if response is not None:
+            result = {**result, "response": response} if isinstance(result, dict) else response
         
         # Store in memory
-        self.memory.store_query(phrase, result)
+        if store and self.memory_policy == "full":
+            self.memory.store_query(phrase, result)
+        elif store and self.memory_policy == "compact":
+            if isinstance(result, dict) and "response" in result:
+                self.memory.store_query(phrase, result["response"],
+                                        metadata=self._compact_record(result, mode))
+            else:
+                self.memory.store_query(phrase, result, metadata={"mode": mode})
         
         # Return either just the text response or the full reasoning object
         if isinstance(result, dict) and "response" in result:
             return result["response"]
         return result
 
-    def _base_reasoning_process(self, phrase: str) -> Dict[str, Any]:
+    def _compact_record(self, result: Dict[str, Any], mode: str) -> Dict[str, Any]:
+        """
+        Builds the memory metadata for a reasoning result.
+        
+        Related concepts and memories are referenced by codex topic and memory
+        index, so stored entries never embed earlier entries.
+        
+        Args:
+            result: The cognitive process result
+            mode: The cognitive mode that produced the result
+            
+        Returns:
+            Compact reference record
+        """
+        math_translation = result.get("math_translation")
+        if isinstance(math_translation, dict):
+            math_translation = math_translation.get("matches", {})
+        
+        return {
+            "mode": mode,
+            "related_concepts": list(result.get("related_concepts") or {}),
+            "memory_refs": list(result.get("memory_context") or {}),
+            "math_matches": math_translation
+        }
+
+    def _get_executor(self):
+        """Returns the configured mode pool, creating it on first use."""
+        if self.executor_type is None:
+            return None
+        if self._executor is None:
+            if self.executor_type == "process":
+                # Spawned rather than forked, since the node is used from server threads
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="sully-reasoning")
+        return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Releases the mode pool, if one was created.
+        
+        Args:
+            wait: Whether to wait for running modes to finish
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _iter_mode_results(self, phrase: str, modes: List[str], context: ReasoningContext,
+                           seed: Optional[int]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Runs several cognitive mode processes, concurrently when a pool is configured.
+        
+        Each mode draws from its own generator seeded from (seed, mode), so a
+        seeded call gives the same responses whichever order modes finish in.
+        Unseeded calls draw their seed from the global random module here,
+        before any mode runs in a worker. The shared math translation is
+        phrased from its own generator derived from the same seed.
+        
+        Args:
+            phrase: Input to process
+            modes: Recognized cognitive modes to run
+            context: Shared context for the phrase
+            seed: Seed for the per-mode generators (None for unseeded)
+            
+        Returns:
+            Iterator of (mode, result) pairs in completion order
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+            
+        # Compute shared lookups up front so modes only read the context
+        lookups = context.prefetch(_mode_rng(seed, "math_translation"))
+        
+        executor = self._get_executor() if len(modes) > 1 else None
+        if executor is None:
+            for mode in modes:
+                process = self.cognitive_frameworks[mode]["process"]
+                yield mode, process(phrase, context, _mode_rng(seed, mode))
+            return
+        
+        if self.executor_type == "process":
+            futures = {
+                executor.submit(_run_mode_in_worker, mode, phrase, lookups, seed): mode
+                for mode in modes
+            }
+        else:
+            futures = {
+                executor.submit(self.cognitive_frameworks[mode]["process"],
+                                phrase, context, _mode_rng(seed, mode)): mode
+                for mode in modes
+            }
+        
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    def _base_reasoning_process(self, phrase: str,
+                                context: Optional[ReasoningContext] = None) -> Dict[str, Any]:
         """
         Shared baseline reasoning process used by all cognitive modes.
         
         Args:
             phrase: Input to reason about
+            context: Optional shared context holding lookups for this phrase
             
         Returns:
             Dictionary with basic reasoning components
         """
+        if context is None or context.phrase != phrase:
+            context = self.create_context(phrase)
+        
         # Step 1: Search for related concepts in codex
-        related_concepts = self.codex.search(phrase, semantic=True)
+        related_concepts = context.related_concepts()
         
         # Step 2: Search for related memories
-        memory_matches = self.memory.search(phrase, include_associations=True, limit=5)
+        memory_matches = context.memory_matches()
         
         # Step 3: Check for mathematical interpretation
-        math_translation = self.translator.translate(phrase)
+        math_translation = context.math_translation()
         
         # Step 4: Extract key concepts
-        key_concepts = []
-        for word in phrase.split():
-            if len(word) > 3 and word.lower() not in ["this", "that", "with", "from", "have", "what", "when", "where"]:
-                key_concepts.append(word.lower())
+        key_concepts = context.key_concepts()
         
         # Build baseline response structure
         return {
@@ -208,24 +505,26 @@ class SymbolicReasoningNode:
             "response": f"Processing: {phrase}"  # Default response, will be overridden
         }
 
-    def _emergent_process(self, phrase: str) -> Dict[str, Any]:
+    def _emergent_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                          rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using emergent, synthesizing reasoning.
         Combines multiple perspectives and evolves understanding.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["emergent"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Select connectors for flow
         connectors = framework["connectors"]
-        selected_connectors = random.sample(connectors, min(3, len(connectors)))
+        selected_connectors = rng.sample(connectors, min(3, len(connectors)))
         
         # Construct response
         response_parts = [framing]
@@ -252,19 +551,21 @@ class SymbolicReasoningNode:
         result["response"] = " ".join(response_parts)
         return result
 
-    def _analytical_process(self, phrase: str) -> Dict[str, Any]:
+    def _analytical_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                            rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using analytical, structured reasoning.
         Breaks down concepts and examines logical relationships.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["analytical"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Construct analytical response
@@ -294,19 +595,21 @@ class SymbolicReasoningNode:
         result["response"] = " ".join(response_parts)
         return result
 
-    def _creative_process(self, phrase: str) -> Dict[str, Any]:
+    def _creative_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                          rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using creative, divergent reasoning.
         Explores unusual connections and metaphorical thinking.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["creative"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Construct creative response
@@ -318,13 +621,13 @@ class SymbolicReasoningNode:
             f"What if {phrase} were a color? Perhaps it would be a shade that exists between the familiar spectrum.",
             f"{phrase} resembles an unexplored forest where each path leads to a different revelation."
         ]
-        response_parts.append(random.choice(metaphors))
+        response_parts.append(rng.choice(metaphors))
         
         # Add unexpected connection
         if result["related_concepts"]:
             concept_keys = list(result["related_concepts"].keys())
             if concept_keys:
-                random_concept = random.choice(concept_keys)
+                random_concept = rng.choice(concept_keys)
                 connection = f"{framework['connectors'][1].capitalize()}, the unexpected connection between {phrase} and {random_concept} creates a spark of insight that illuminates both."
                 response_parts.append(connection)
         
@@ -334,7 +637,7 @@ class SymbolicReasoningNode:
             f"How might {phrase} appear if viewed through the lens of its opposite?",
             f"What beautiful contradiction lies at the heart of {phrase}?"
         ]
-        response_parts.append(random.choice(questions))
+        response_parts.append(rng.choice(questions))
         
         # Add artistic synthesis
         synthesis = f"In this creative exploration, {phrase} becomes not just a concept to understand, but a palette of possibilities to play with and reimagine."
@@ -344,19 +647,21 @@ class SymbolicReasoningNode:
         result["response"] = " ".join(response_parts)
         return result
 
-    def _critical_process(self, phrase: str) -> Dict[str, Any]:
+    def _critical_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                          rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using critical, evaluative reasoning.
         Examines assumptions, contradictions, and limitations.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["critical"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Construct critical response
@@ -382,19 +687,21 @@ class SymbolicReasoningNode:
         result["response"] = " ".join(response_parts)
         return result
 
-    def _ethereal_process(self, phrase: str) -> Dict[str, Any]:
+    def _ethereal_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                          rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using ethereal, transcendent reasoning.
         Explores deeper meanings and philosophical implications.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["ethereal"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Construct ethereal response
@@ -420,19 +727,21 @@ class SymbolicReasoningNode:
         result["response"] = " ".join(response_parts)
         return result
         
-    def _humorous_process(self, phrase: str) -> Dict[str, Any]:
+    def _humorous_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                          rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using humorous, playful reasoning.
         Finds irony, absurdity, and unexpected connections.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["humorous"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Construct humorous response
@@ -444,7 +753,7 @@ class SymbolicReasoningNode:
             f"Trying to define {phrase} is like asking a fish to explain what water tastes like.",
             f"{phrase} makes about as much sense as a screen door on a submarine."
         ]
-        response_parts.append(random.choice(comparisons))
+        response_parts.append(rng.choice(comparisons))
         
         # Add ironic observation
         irony = f"{framework['connectors'][0].capitalize()}, the more we try to pin down {phrase}, the more it slips away. It's the conceptual equivalent of trying to nail jello to the wall."
@@ -462,19 +771,21 @@ class SymbolicReasoningNode:
         result["response"] = " ".join(response_parts)
         return result
 
-    def _professional_process(self, phrase: str) -> Dict[str, Any]:
+    def _professional_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                              rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using professional, formal reasoning.
         Focuses on best practices, research, and structured analysis.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["professional"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Construct professional response
@@ -500,19 +811,21 @@ class SymbolicReasoningNode:
         result["response"] = " ".join(response_parts)
         return result
 
-    def _casual_process(self, phrase: str) -> Dict[str, Any]:
+    def _casual_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                        rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using casual, conversational reasoning.
         Uses everyday language and relatable examples.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["casual"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Construct casual response
@@ -524,7 +837,7 @@ class SymbolicReasoningNode:
             f"You know how sometimes you get a song stuck in your head? {phrase} is a bit like that.",
             f"It's basically the mental equivalent of comfort food - familiar but still interesting."
         ]
-        response_parts.append(random.choice(examples))
+        response_parts.append(rng.choice(examples))
         
         # Add everyday insight
         insight = f"{framework['connectors'][0].capitalize()}, when you think about it, {phrase} is pretty much a part of everyday life, even if we don't always notice it."
@@ -538,19 +851,21 @@ class SymbolicReasoningNode:
         result["response"] = " ".join(response_parts)
         return result
 
-    def _musical_process(self, phrase: str) -> Dict[str, Any]:
+    def _musical_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                         rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using musical, rhythmic reasoning.
         Focuses on patterns, harmony, and resonance.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["musical"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Construct musical response
@@ -576,19 +891,21 @@ class SymbolicReasoningNode:
         result["response"] = " ".join(response_parts)
         return result
 
-    def _visual_process(self, phrase: str) -> Dict[str, Any]:
+    def _visual_process(self, phrase: str, context: Optional[ReasoningContext] = None,
+                        rng: Optional[random.Random] = None) -> Dict[str, Any]:
         """
         Process input using visual, spatial reasoning.
         Focuses on imagery, perspective, and visual metaphors.
         """
         # Get baseline reasoning components
-        result = self._base_reasoning_process(phrase)
+        result = self._base_reasoning_process(phrase, context)
+        rng = rng or random
         
         # Generate framework-specific insights
         framework = self.cognitive_frameworks["visual"]
         
         # Select a pattern for framing
-        pattern = random.choice(framework["patterns"])
+        pattern = rng.choice(framework["patterns"])
         framing = pattern.format(input=phrase)
         
         # Construct visual response
@@ -624,35 +941,45 @@ class SymbolicReasoningNode:
         Returns:
             Dictionary with comprehensive analysis
         """
+        # Share lookups between the analysis and every lens sample
+        context = self.create_context(phrase)
+        seed = self.seed if self.seed is not None else random.getrandbits(64)
+        rng = _mode_rng(seed, "analysis")
+        
         # Collect analysis from multiple perspectives
         analysis = {
             "raw_input": phrase,
             "timestamp": datetime.now().isoformat(),
-            "codex_matches": self.codex.search(phrase, semantic=True),
-            "memory_matches": self.memory.search(phrase, include_associations=True),
-            "math_translation": self.translator.translate(phrase),
+            "codex_matches": context.related_concepts(),
+            "memory_matches": context.memory_matches(limit=None),
+            "math_translation": context.math_translation(_mode_rng(seed, "math_translation")),
             "cognitive_lenses": {}
         }
         
         # Sample each cognitive framework for perspective
-        for mode, framework in self.cognitive_frameworks.items():
+        modes = list(self.cognitive_frameworks.keys())
+        samples = dict(self._iter_mode_results(phrase, modes, context, seed))
+        for mode in modes:
+            framework = self.cognitive_frameworks[mode]
             lens = framework["conceptual_lens"]
-            pattern = random.choice(framework["patterns"]).format(input=phrase)
+            pattern = rng.choice(framework["patterns"]).format(input=phrase)
             analysis["cognitive_lenses"][mode] = {
                 "perspective": lens,
                 "framing": pattern,
-                "sample": framework["process"](phrase)["response"][:100] + "..."  # Truncated sample
+                "sample": samples[mode]["response"][:100] + "..."  # Truncated sample
             }
         
         return analysis
         
-    def generate_multi_perspective(self, phrase: str, modes: List[str] = None) -> Dict[str, Any]:
+    def generate_multi_perspective(self, phrase: str, modes: List[str] = None,
+                                   seed: Optional[int] = None) -> Dict[str, Any]:
         """
         Generate responses from multiple cognitive perspectives.
         
         Args:
             phrase: Input to process
             modes: List of cognitive modes to use (defaults to all)
+            seed: Seed for reproducible responses (defaults to the node's seed)
             
         Returns:
             Dictionary with responses from each requested mode
@@ -660,23 +987,45 @@ class SymbolicReasoningNode:
         if not modes:
             modes = list(self.cognitive_frameworks.keys())
             
-        perspectives = {}
+        responses = dict(self.iter_multi_perspective(phrase, modes, seed))
         
-        for mode in modes:
-            if mode in self.cognitive_frameworks:
-                result = self.reason(phrase, mode)
-                if isinstance(result, dict) and "response" in result:
-                    perspectives[mode] = result["response"]
-                else:
-                    perspectives[mode] = result
+        # Report perspectives in the requested order
+        perspectives = {mode: responses[mode] for mode in modes if mode in responses}
                     
         return {
             "input": phrase,
             "perspectives": perspectives
         }
         
+    def iter_multi_perspective(self, phrase: str, modes: List[str] = None,
+                               seed: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Generate responses from multiple cognitive perspectives as each completes.
+        
+        Args:
+            phrase: Input to process
+            modes: List of cognitive modes to use (defaults to all)
+            seed: Seed for reproducible responses (defaults to the node's seed)
+            
+        Returns:
+            Iterator of (mode, response) pairs in completion order
+        """
+        if not modes:
+            modes = list(self.cognitive_frameworks.keys())
+        modes = [mode for mode in dict.fromkeys(modes) if mode in self.cognitive_frameworks]
+        if seed is None:
+            seed = self.seed
+        
+        # Every mode reasons over the same lookups
+        context = self.create_context(phrase)
+        
+        for mode, result in self._iter_mode_results(phrase, modes, context, seed):
+            # Memory writes stay on the calling thread
+            yield mode, self._record_result(phrase, result, mode)
+        
     def blend_cognitive_modes(self, phrase: str, primary_mode: str, 
-                             secondary_mode: str, blend_ratio: float = 0.7) -> str:
+                             secondary_mode: str, blend_ratio: float = 0.7,
+                             seed: Optional[int] = None) -> str:
         """
         Blend two cognitive modes to create a hybrid response.
         
@@ -685,6 +1034,7 @@ class SymbolicReasoningNode:
             primary_mode: Primary cognitive mode
             secondary_mode: Secondary cognitive mode
             blend_ratio: Ratio of primary to secondary (0.0-1.0)
+            seed: Seed for reproducible responses (defaults to the node's seed)
             
         Returns:
             Blended response
@@ -695,9 +1045,14 @@ class SymbolicReasoningNode:
         if secondary_mode not in self.cognitive_frameworks:
             secondary_mode = "analytical"
             
-        # Get responses from both modes
-        primary_result = self.cognitive_frameworks[primary_mode]["process"](phrase)
-        secondary_result = self.cognitive_frameworks[secondary_mode]["process"](phrase)
+        # Get responses from both modes, sharing their lookups
+        context = self.create_context(phrase)
+        results = dict(self._iter_mode_results(
+            phrase, list(dict.fromkeys([primary_mode, secondary_mode])), context,
+            seed if seed is not None else self.seed
+        ))
+        primary_result = results[primary_mode]
+        secondary_result = results[secondary_mode]
         
         primary_response = primary_result["response"]
         secondary_response = secondary_result["response"]
@@ -4,6 +4,10 @@ Sully - An advanced cognitive system capable of synthesis, creativity, and versa
 # --- Imports ---
 import os
 import json
+import time
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 
@@ -15,15 +19,22 @@ from memory import SullySearchMemory
 
 # Kernel Modules
 from judgement import JudgmentProtocol
-from dream import DreamCore
-from math_translator import SymbolicMathTranslator
-from fusion import SymbolFusionEngine
-from paradox import ParadoxLibrary
+from engine_snapshot import load_or_build_engines
 
-# Import consolidated PDF reader directly
+# Consolidated PDF reader; its PDF/OCR libraries load on first use
 from pdf_reader import PDFReader
+from extraction_cache import ExtractionCache
+from document_store import DocumentStore
+from knowledge_store import KnowledgeStore
+from ingestion import (SUPPORTED_FORMATS, DEFAULT_CHUNK_SIZE, extract_document_text, extract_and_chunk,
+                       iter_document_chunks)
 
-MEMORY_PATH = "sully_ingested.json"
+MEMORY_PATH = "sully_ingested.json"  # Legacy store, imported once into the document store
+DOCUMENT_STORE_PATH = "sully_documents.db"
+KNOWLEDGE_STORE_PATH = "sully_knowledge.seg"
+KNOWLEDGE_MEMORY_BUDGET = 64 * 1024 * 1024  # Bytes of knowledge text kept in RAM
+FUSION_DATA_PATH = "sully_fusion.jsonl"  # Fusion history and concept network, journaled
+PARADOX_DATA_PATH = "sully_paradoxes.jsonl"  # Paradox library additions, journaled
 
 
 class Sully:
@@ -32,19 +43,29 @@ class Sully:
     and expressing it through multiple cognitive modes and communication styles.
     """
 
-    def __init__(self):
-        """Initialize Sully's cognitive systems."""
+    def __init__(self, snapshot_path=None):
+        """
+        Initialize Sully's cognitive systems.
+        
+        Args:
+            snapshot_path: Optional pre-warmed snapshot of the static engine
+                tables, loaded if valid and written otherwise
+        """
         # Core cognitive architecture
         self.identity = SullyIdentity()
         self.memory = SullySearchMemory()
         self.codex = SullyCodex()
         
         # Specialized cognitive modules
-        self.translator = SymbolicMathTranslator()
+        engines = load_or_build_engines(
+            snapshot_path,
+            data_paths={"fusion": FUSION_DATA_PATH, "paradox": PARADOX_DATA_PATH}
+        )
+        self.translator = engines["translator"]
         self.judgment = JudgmentProtocol()
-        self.dream_core = DreamCore()
-        self.paradox = ParadoxLibrary()
-        self.fusion = SymbolFusionEngine()
+        self.dream_core = engines["dream_core"]
+        self.paradox = engines["paradox"]
+        self.fusion = engines["fusion"]
         
         # Symbolic reasoning engine - the heart of concept synthesis
         self.reasoning_node = SymbolicReasoningNode(
@@ -53,11 +74,18 @@ class Sully:
             memory=self.memory
         )
         
+        # Ingested documents, persisted one row per document
+        self.document_store = DocumentStore(DOCUMENT_STORE_PATH, legacy_json=MEMORY_PATH)
+        
+        # Extracted text is cached by file content, so re-uploads skip extraction
+        self.extraction_cache = ExtractionCache()
+        
         # PDF reader for direct document processing
-        self.pdf_reader = PDFReader(ocr_enabled=True, dpi=300)
+        self.pdf_reader = PDFReader(ocr_enabled=True, dpi=300, cache=self.extraction_cache)
         
-        # Experiential knowledge - unlimited and ever-growing
-        self.knowledge = []
+        # Experiential knowledge - unlimited and ever-growing, with only the
+        # most recently used items held in memory
+        self.knowledge = KnowledgeStore(KNOWLEDGE_STORE_PATH, max_memory_bytes=KNOWLEDGE_MEMORY_BUDGET)
 
     def speak_identity(self):
         """Express Sully's sense of self."""
@@ -173,49 +201,41 @@ class Sully:
         self.knowledge.append(message)
         return f"📘 Integrated: '{message}'"
 
-    def ingest_document(self, file_path):
+    def ingest_document(self, file_path, streaming=False, chunk_size=DEFAULT_CHUNK_SIZE, batch_size=32,
+                        document_key=None):
         """
         Absorb and synthesize content from various document formats.
         This is how Sully expands her knowledge from structured sources.
+        
+        Args:
+            file_path: Path to the document
+            streaming: Whether to ingest chunk by chunk, without holding the whole text
+            chunk_size: Maximum characters per chunk when streaming
+            batch_size: Chunks committed to memory per write when streaming
+            document_key: Name the document is stored and cited under (defaults
+                to file_path); re-ingesting the same key replaces the document
+            
+        Returns:
+            A synthesis message; when streaming, a summary dictionary that
+            carries an "error" message if the document was not ingested
         """
+        document_key = document_key or file_path
         try:
             if not os.path.exists(file_path):
-                return f"❌ File not found: '{file_path}'"
+                error = f"❌ File not found: '{file_path}'"
+                return {"file": document_key, "error": error} if streaming else error
+                
+            if streaming:
+                return self._ingest_document_streaming(file_path, chunk_size, batch_size, document_key)
                 
-            ext = os.path.splitext(file_path)[1].lower()
-            content = ""
-            
             # Extract content based on file type
-            if ext == ".pdf":
-                # Use PDFReader for PDF files
-                result = self.pdf_reader.extract_text(file_path, verbose=True)
-                if result["success"]:
-                    content = result["text"]
-                else:
-                    return f"[Extraction Failed: {result.get('error', 'Unknown error')}]"
-            elif ext in [".txt", ".md"]:
-                # Simple text file reading
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                except Exception as e:
-                    return f"[Text Extraction Error: {str(e)}]"
-            elif ext == ".docx":
-                # Handle Word documents
-                try:
-                    import docx
-                    doc = docx.Document(file_path)
-                    content = "\n".join(p.text for p in doc.paragraphs)
-                except ImportError:
-                    return "[Missing `python-docx`. Install it with `pip install python-docx`]"
-                except Exception as e:
-                    return f"[DOCX Error: {str(e)}]"
-            else:
-                return f"[Unsupported file type: {ext}]"
+            content, error = extract_document_text(file_path, self.pdf_reader, self.extraction_cache)
+            if error:
+                return error
             
             if content:
                 self.knowledge.append(content)
-                self.save_to_disk(file_path, content)
+                self.save_to_disk(document_key, content)
                 
                 # Generate a synthesis of what was learned
                 brief_synthesis = self.reasoning_node.reason(
@@ -223,71 +243,211 @@ class Sully:
                     "analytical"
                 )
                 
-                return f"[Knowledge Synthesized: {file_path}]\n{brief_synthesis}"
+                return f"[Knowledge Synthesized: {document_key}]\n{brief_synthesis}"
             
             return "[No Content Extracted]"
         except Exception as e:
-            return f"[Ingestion Process Incomplete: {str(e)}]"
+            error = f"[Ingestion Process Incomplete: {str(e)}]"
+            return {"file": document_key, "error": error} if streaming else error
+
+    def _ingest_document_streaming(self, file_path, chunk_size, batch_size, document_key):
+        """
+        Ingest a document as a stream of page/section chunks.
+        
+        Chunks are committed to memory, the codex and the document store a
+        batch at a time, so peak memory depends on the batch size rather than
+        on the size of the document.
+        
+        Args:
+            file_path: Path to the document
+            chunk_size: Maximum characters per chunk
+            batch_size: Chunks committed per write
+            document_key: Name the document and its chunks are stored under
+            
+        Returns:
+            Dictionary summarizing the ingestion, plus a synthesis; on failure
+            it carries an "error" message instead of the synthesis
+        """
+        started = time.perf_counter()
+        digest = hashlib.sha256()
+        summary = {
+            "file": document_key,
+            "chunks": 0,
+            "characters": 0,
+            "memories": 0,
+            "concepts": 0,
+            "error": None
+        }
+        
+        self.document_store.clear_chunks(document_key)
+        batch = []
+        
+        def commit(chunks):
+            experiences = []
+            for chunk in chunks:
+                location = document_key
+                if chunk["first_page"] is not None:
+                    location += f"#pages {chunk['first_page']}-{chunk['last_page']}"
+                if chunk["section"]:
+                    location += f" ({chunk['section']})"
+                experiences.append({"content": chunk["text"], "source": location})
+                summary["concepts"] += len(self.codex.batch_process(chunk["text"]))
+            summary["memories"] += len(self.memory.store_experience_batch(experiences))
+            self.document_store.put_chunks(document_key, chunks, summary["chunks"])
+            summary["chunks"] += len(chunks)
+        
+        try:
+            for chunk in iter_document_chunks(file_path, self.pdf_reader, chunk_size):
+                digest.update(chunk["text"].encode("utf-8"))
+                summary["characters"] += len(chunk["text"])
+                batch.append(chunk)
+                if len(batch) >= batch_size:
+                    commit(batch)
+                    batch = []
+            if batch:
+                commit(batch)
+        except ValueError as e:
+            summary["error"] = str(e)
+            return summary
+        except ImportError:
+            summary["error"] = "[Missing `python-docx`. Install it with `pip install python-docx`]"
+            return summary
+            
+        if not summary["chunks"]:
+            summary["error"] = "[No Content Extracted]"
+            return summary
+            
+        # The full text lives in the chunks table; the document row records its identity
+        self.document_store.put(document_key, "", content_hash=digest.hexdigest(), size=summary["characters"])
+        
+        summary["synthesis"] = self.reasoning_node.reason(
+            f"Briefly summarize the key insights from the recently ingested text", 
+            "analytical"
+        )
+        summary["total_seconds"] = round(time.perf_counter() - started, 4)
+        return summary
 
     def save_to_disk(self, path, content):
         """
         Preserve Sully's knowledge in persistent storage.
         """
-        data = {path: content}
         try:
-            if os.path.exists(MEMORY_PATH):
-                with open(MEMORY_PATH, "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-                existing.update(data)
-            else:
-                existing = data
-                
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(os.path.abspath(MEMORY_PATH)), exist_ok=True)
-            
-            with open(MEMORY_PATH, "w", encoding="utf-8") as f:
-                json.dump(existing, f, indent=2)
+            self.document_store.put(path, content)
         except Exception as e:
             # Knowledge is not lost; it remains in memory
             print(f"Note: Memory persistence encountered an issue: {str(e)}")
 
-    def load_documents_from_folder(self, folder_path="sully_documents"):
+    def load_documents_from_folder(self, folder_path="sully_documents", max_workers=None,
+                                   chunk_size=DEFAULT_CHUNK_SIZE):
         """
         Discover and absorb knowledge from a collection of documents.
         Processes various document formats simultaneously.
+        
+        Files flow through a pipeline: worker processes extract, normalize and
+        chunk each document, while this process commits finished documents to
+        the document store and codex one at a time, as they complete.
+        
+        Args:
+            folder_path: Folder to ingest
+            max_workers: Extraction processes (defaults to the CPU count)
+            chunk_size: Maximum characters per text chunk
+            
+        Returns:
+            Dictionary with per-file results and timings, plus a meta-synthesis;
+            on failure it carries an "error" message instead
         """
         if not os.path.exists(folder_path):
-            return f"❌ Knowledge source '{folder_path}' not found."
+            return {"folder": folder_path, "error": f"❌ Knowledge source '{folder_path}' not found."}
 
-        # Expanded list of supported formats for greater knowledge acquisition
-        supported_formats = [".pdf", ".epub", ".txt", ".docx", ".rtf", ".md", ".html", ".json", ".csv"]
+        started = time.perf_counter()
+        
+        # Collect documents in the supported formats
+        paths = [
+            os.path.join(folder_path, file) for file in sorted(os.listdir(folder_path))
+            if any(file.lower().endswith(fmt) for fmt in SUPPORTED_FORMATS)
+        ]
         results = []
-        synthesized_insights = []
         
         try:
-            for file in os.listdir(folder_path):
-                file_lower = file.lower()
-                if any(file_lower.endswith(fmt) for fmt in supported_formats):
-                    full_path = os.path.join(folder_path, file)
-                    result = self.ingest_document(full_path)
-                    results.append(result)
-                    
-                    # Extract the synthesis portion if available
-                    if "\n" in result:
-                        synthesis = result.split("\n", 1)[1]
-                        synthesized_insights.append(synthesis)
+            cache_dir = self.extraction_cache.cache_dir if self.extraction_cache else None
+            # Workers are spawned rather than forked, since the server runs threads
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                # Stage 1 and 2: extraction, normalization and chunking in worker processes
+                futures = {
+                    executor.submit(extract_and_chunk, path, self.pdf_reader.dpi, cache_dir, chunk_size): path
+                    for path in paths
+                }
+                
+                # Stage 3: a single writer commits documents as they finish
+                for future in as_completed(futures):
+                    path = futures[future]
+                    try:
+                        extracted = future.result()
+                    except Exception as e:
+                        extracted = {"file": path, "text": "", "chunks": [], "error": str(e),
+                                     "extract_seconds": None, "chunk_seconds": None}
+                    results.append(self._commit_extracted_document(extracted))
+            
+            ingested = [result for result in results if result["status"] == "ingested"]
             
             # If multiple documents were processed, create a meta-synthesis
-            if len(synthesized_insights) > 1:
+            meta_insight = None
+            if len(ingested) > 1:
                 meta_insight = self.reasoning_node.reason(
                     "Synthesize connections between the recently ingested documents", 
                     "creative"
                 )
-                results.append(f"[Meta-Synthesis]\n{meta_insight}")
                 
-            return results
+            results.sort(key=lambda result: result["file"])
+            return {
+                "folder": folder_path,
+                "files": results,
+                "ingested": len(ingested),
+                "failed": len(results) - len(ingested),
+                "meta_synthesis": meta_insight,
+                "total_seconds": round(time.perf_counter() - started, 4)
+            }
         except Exception as e:
-            return [f"Knowledge exploration encountered complexity: {str(e)}"]
+            return {
+                "folder": folder_path,
+                "files": results,
+                "error": f"Knowledge exploration encountered complexity: {str(e)}"
+            }
+            
+    def _commit_extracted_document(self, extracted):
+        """
+        Commit one extracted document to knowledge, the document store and codex.
+        
+        Args:
+            extracted: Result of the extraction stage
+            
+        Returns:
+            Per-file result with status and stage timings
+        """
+        started = time.perf_counter()
+        result = {
+            "file": extracted["file"],
+            "status": "failed",
+            "characters": len(extracted["text"]),
+            "chunks": len(extracted["chunks"]),
+            "concepts": 0,
+            "error": extracted["error"],
+            "extract_seconds": extracted["extract_seconds"],
+            "chunk_seconds": extracted["chunk_seconds"]
+        }
+        
+        if not extracted["error"] and not extracted["text"]:
+            result["error"] = "[No Content Extracted]"
+        elif not extracted["error"]:
+            self.knowledge.append(extracted["text"])
+            self.save_to_disk(extracted["file"], extracted["text"])
+            for chunk in extracted["chunks"]:
+                result["concepts"] += len(self.codex.batch_process(chunk))
+            result["status"] = "ingested"
+            
+        result["write_seconds"] = round(time.perf_counter() - started, 4)
+        return result
             
     def extract_images_from_pdf(self, pdf_path, output_dir="extracted_images"):
         """
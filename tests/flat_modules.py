@@ -0,0 +1,15 @@
+# tests/flat_modules.py
+# 🧪 pytest plugin: collects the repository root as a plain directory, not a package
+
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def pytest_collect_directory(path, parent):
+    """Keeps pytest from importing the root package __init__; the engine's modules are imported flat."""
+    if path == ROOT:
+        return pytest.Dir.from_parent(parent, path=path)
+    return None
@@ -0,0 +1,33 @@
+# tests/test_conversation_memory.py
+# 💬 Each chat turn is written to memory once, with its full reply
+
+import random
+
+from Codex import SullyCodex
+from conversation_engine import ConversationEngine
+from math_translator import SymbolicMathTranslator
+from memory import SullySearchMemory
+from reasoning import SymbolicReasoningNode
+
+MESSAGES = [
+    "What is the relationship between infinity and recursion?",
+    "Can you explain how time and memory connect?",
+    "Tell me about truth and identity",
+]
+
+
+def test_one_memory_record_per_turn():
+    random.seed(3)
+    memory = SullySearchMemory()
+    engine = ConversationEngine(SymbolicReasoningNode(SullyCodex(), SymbolicMathTranslator(), memory),
+                                memory, SullyCodex())
+    # Always elaborate and follow up, so the secondary reasoning calls run
+    engine.update_personality({"elaboration": 1.0, "curiosity": 1.0})
+
+    replies = [engine.process_message(message) for message in MESSAGES * 4]
+
+    assert len(memory) == len(replies)
+    for entry, message, reply in zip(memory.storage, MESSAGES * 4, replies):
+        assert entry["query"] == message
+        assert entry["result"] == reply
+        assert entry["metadata"]["mode"] == "emergent"
@@ -0,0 +1,62 @@
+# tests/test_document_store.py
+# 🗄️ Legacy JSON documents migrate into the SQLite store exactly once
+
+import json
+
+from document_store import DocumentStore
+
+
+def write_legacy(path, documents):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(documents, f)
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    legacy = tmp_path / "sully_ingested.json"
+    write_legacy(legacy, {"a.txt": "alpha text", "b.md": "beta ∞ text", "broken": 42})
+    db_path = str(tmp_path / "documents.db")
+
+    store = DocumentStore(db_path, legacy_json=str(legacy))
+    assert len(store) == 2
+    assert "broken" not in store
+    record = store.get("b.md")
+    assert record["content"] == "beta ∞ text"
+    assert record["size"] == len("beta ∞ text")
+    assert record["content_hash"] == DocumentStore.content_hash("beta ∞ text")
+    assert store.get_by_hash(DocumentStore.content_hash("alpha text"))[0]["path"] == "a.txt"
+
+    # A deleted document stays deleted when the store is reopened
+    assert store.delete("a.txt")
+    assert store.migrate_json(str(legacy)) == 0
+    store.close()
+
+    reopened = DocumentStore(db_path, legacy_json=str(legacy))
+    assert "a.txt" not in reopened
+    assert len(reopened) == 1
+    reopened.close()
+
+
+def test_migration_keeps_documents_already_in_the_store(tmp_path):
+    legacy = tmp_path / "sully_ingested.json"
+    write_legacy(legacy, {"a.txt": "old text", "c.txt": "gamma"})
+    store = DocumentStore(str(tmp_path / "documents.db"))
+    store.put("a.txt", "new text")
+
+    assert store.migrate_json(str(legacy)) == 2
+    assert store.get("a.txt")["content"] == "new text"
+    assert store.get("c.txt")["content"] == "gamma"
+    store.close()
+
+
+def test_unreadable_legacy_json_can_be_migrated_later(tmp_path):
+    legacy = tmp_path / "sully_ingested.json"
+    legacy.write_text("{not json", encoding="utf-8")
+    store = DocumentStore(str(tmp_path / "documents.db"))
+
+    assert store.migrate_json(str(legacy)) == 0
+    assert store.migrate_json(str(tmp_path / "missing.json")) == 0
+
+    write_legacy(legacy, {"a.txt": "alpha"})
+    assert store.migrate_json(str(legacy)) == 1
+    assert store.get("a.txt")["content"] == "alpha"
+    store.close()
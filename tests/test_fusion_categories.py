@@ -0,0 +1,58 @@
+# tests/test_fusion_categories.py
+# 🏷️ Concept categorization must follow every edit to the category tables
+
+import pickle
+
+from fusion import SymbolFusionEngine
+
+
+def test_in_place_keyword_swap_recategorizes():
+    engine = SymbolFusionEngine()
+    assert engine.categorize_concept("stone") == "concrete"
+    assert engine.categorize_concept("truth") == "abstract"
+
+    # Swap the two keywords without changing either table's size
+    abstract = engine.concept_categories["abstract"]
+    concrete = engine.concept_categories["concrete"]
+    abstract[abstract.index("truth")] = "stone"
+    concrete[concrete.index("stone")] = "truth"
+
+    assert engine.categorize_concept("stone") == "abstract"
+    assert engine.categorize_concept("truth") == "concrete"
+    assert engine.categorize_batch(["stone", "truth"]) == {"stone": "abstract", "truth": "concrete"}
+
+
+def test_in_place_pair_replacement_changes_the_fusion_pattern():
+    engine = SymbolFusionEngine()
+    pairs = engine.concept_categories["opposing_pairs"]
+    assert engine._determine_pattern_key(["abstract", "abstract"], ("order", "chaos")) == "opposing_concepts"
+
+    pairs[pairs.index(("order", "chaos"))] = ("silence", "noise")
+
+    assert engine._determine_pattern_key(["abstract", "abstract"], ("order", "chaos")) != "opposing_concepts"
+    assert engine._determine_pattern_key(["abstract", "abstract"], ("noise", "silence")) == "opposing_concepts"
+
+
+def test_replaced_tables_and_direct_override_edits_are_seen():
+    engine = SymbolFusionEngine()
+    assert engine.categorize_concept("lamp") == "concrete"
+
+    engine.category_overrides["lamp"] = "abstract"
+    assert engine.categorize_concept("lamp") == "abstract"
+
+    engine.category_overrides = {}
+    engine.concept_categories = {"abstract": ["stone"], "concrete": []}
+    assert engine.categorize_concept("lamp") == "concrete"
+    assert engine.categorize_concept("stone") == "abstract"
+
+
+def test_pickled_engine_keeps_its_category_index_current():
+    engine = SymbolFusionEngine()
+    engine.categorize_concept("stone")
+    restored = pickle.loads(pickle.dumps(engine))
+
+    assert restored._compiled_categories.is_current(restored.concept_categories, restored.category_overrides)
+    concrete = restored.concept_categories["concrete"]
+    concrete[concrete.index("stone")] = "pebble"
+    # Longer words are guessed abstract, so this shows the edited table is used
+    assert restored.categorize_concept("pebble") == "concrete"
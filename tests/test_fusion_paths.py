@@ -0,0 +1,75 @@
+# tests/test_fusion_paths.py
+# 🧭 k-shortest concept paths must match brute-force enumeration of simple paths
+
+import random
+
+import pytest
+
+from fusion import SymbolFusionEngine
+
+
+def random_network(rng, concepts, fusions):
+    """Builds an engine whose concept network comes from random pairwise fusions."""
+    engine = SymbolFusionEngine()
+    for _ in range(fusions):
+        first, second = rng.sample(concepts, 2)
+        engine.fuse_with_options(first, second, output_format="dict")
+    return engine
+
+
+def path_cost(engine, path, weighted):
+    ids = [engine.concept_ids[concept] for concept in path]
+    return sum(1.0 / engine.concept_edges[a][b] if weighted else 1.0 for a, b in zip(ids, ids[1:]))
+
+
+def all_simple_path_costs(engine, source, target, max_depth, weighted):
+    """Costs of every simple path of at most max_depth concepts, cheapest first."""
+    start, goal = engine.concept_ids[source], engine.concept_ids[target]
+    costs = []
+
+    def extend(path, cost):
+        node = path[-1]
+        if node == goal:
+            costs.append(cost)
+            return
+        if max_depth is not None and len(path) >= max_depth:
+            return
+        for connected, count in engine.concept_edges[node].items():
+            if connected not in path:
+                extend(path + [connected], cost + (1.0 / count if weighted else 1.0))
+
+    extend([start], 0.0)
+    return sorted(costs)
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("max_depth", [None, 3, 5])
+def test_k_shortest_paths_match_brute_force(weighted, max_depth):
+    rng = random.Random(f"{weighted}-{max_depth}")
+    concepts = [f"concept{i}" for i in range(9)]
+
+    for _ in range(25):
+        engine = random_network(rng, concepts, rng.randint(8, 30))
+        known = [concept for concept in concepts if concept in engine.concept_ids]
+        source, target = rng.sample(known, 2)
+        max_paths = rng.randint(1, 12)
+
+        paths = engine.find_path_between_concepts(source, target, max_depth=max_depth,
+                                                  max_paths=max_paths, weighted=weighted)
+        expected = all_simple_path_costs(engine, source, target, max_depth, weighted)[:max_paths]
+
+        assert len(paths) == len(expected)
+        assert len({tuple(path) for path in paths}) == len(paths)
+        for path in paths:
+            assert path[0] == source and path[-1] == target
+            assert len(set(path)) == len(path)
+            assert max_depth is None or len(path) <= max_depth
+        assert [path_cost(engine, path, weighted) for path in paths] == pytest.approx(expected)
+
+
+def test_paths_between_unknown_or_identical_concepts():
+    engine = random_network(random.Random(3), ["light", "shadow", "time"], 6)
+
+    assert engine.find_path_between_concepts("light", "nowhere") == []
+    assert engine.find_path_between_concepts("light", "light") == [["light"]]
+    assert engine.find_path_between_concepts("light", "shadow", max_paths=0) == []
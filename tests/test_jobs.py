@@ -0,0 +1,45 @@
+# tests/test_jobs.py
+# 📥 Ingestion jobs must report failed files as failed
+
+from jobs import IngestionJobQueue
+
+
+def fake_ingest(path, document_key=None):
+    """Stands in for streaming ingestion: errors are returned or raised like Sully's."""
+    if path.endswith(".xyz"):
+        return {"file": document_key, "chunks": 0, "error": "[Unsupported file type: .xyz]"}
+    if path.endswith(".boom"):
+        raise RuntimeError("extractor crashed")
+    return {"file": document_key, "chunks": 1, "error": None}
+
+
+def run_job(tmp_path, names):
+    files = []
+    for name in names:
+        path = tmp_path / name
+        path.write_text("content", encoding="utf-8")
+        files.append((name, str(path)))
+
+    queue = IngestionJobQueue(fake_ingest, max_workers=2)
+    job_id = queue.submit(files)
+    queue.shutdown(wait=True)
+    return queue.get(job_id)
+
+
+def test_failing_files_are_marked_failed(tmp_path):
+    job = run_job(tmp_path, ["notes.md", "upload.xyz", "scan.boom"])
+
+    statuses = {file["file"]: (file["status"], file["error"]) for file in job["files"]}
+    assert statuses["notes.md"] == ("ingested", None)
+    assert statuses["upload.xyz"] == ("failed", "[Unsupported file type: .xyz]")
+    assert statuses["scan.boom"] == ("failed", "extractor crashed")
+    assert (job["completed"], job["failed"]) == (1, 2)
+    assert job["status"] == "completed_with_errors"
+    assert not any((tmp_path / name).exists() for name in ("notes.md", "upload.xyz", "scan.boom"))
+
+
+def test_job_of_only_failures_fails(tmp_path):
+    job = run_job(tmp_path, ["upload.xyz"])
+
+    assert job["files"][0]["summary"]["error"] == "[Unsupported file type: .xyz]"
+    assert job["status"] == "failed"
@@ -0,0 +1,131 @@
+# tests/test_math_translator.py
+# 🔢 Compiled phrase matching must agree with phrase-by-phrase replacement
+
+import pickle
+import random
+
+import pytest
+
+from math_translator import SymbolicMathTranslator
+
+
+def reference_matches(translator, phrase, domain=None):
+    """The matching loop the compiled automata replaced, kept as an oracle."""
+    phrase_lower = phrase.lower()
+    domain = domain.lower() if domain else None
+
+    active_mappings = dict(translator.math_mappings)
+    if domain and domain in translator.domain_notations:
+        active_mappings.update(translator.domain_notations[domain])
+
+    matches = {}
+    for word, symbol in active_mappings.items():
+        if word in phrase_lower:
+            matches[word] = symbol
+
+    if not matches:
+        for word, symbol in active_mappings.items():
+            words = word.split()
+            if len(words) > 1:
+                matching_words = sum(1 for w in words if w in phrase_lower)
+                if matching_words >= len(words) / 2:
+                    matches[word] = symbol
+            elif len(word) >= 5:
+                if word[:4] in phrase_lower:
+                    matches[word] = symbol
+    return matches
+
+
+def random_phrase(rng, vocabulary):
+    """Builds a phrase from mapped phrases, their fragments, joins and noise."""
+    pieces = []
+    for _ in range(rng.randint(1, 6)):
+        word = rng.choice(vocabulary)
+        kind = rng.random()
+        if kind < 0.3:
+            pieces.append(word)
+        elif kind < 0.5:
+            # Fragment, possibly a stem or a component word
+            start = rng.randint(0, max(0, len(word) - 1))
+            pieces.append(word[start:start + rng.randint(1, 8)])
+        elif kind < 0.65:
+            # Overlapping phrases run together without a separator
+            pieces.append(word + rng.choice(vocabulary))
+        elif kind < 0.8:
+            pieces.append(word.upper() if rng.random() < 0.5 else word.title())
+        else:
+            pieces.append("".join(rng.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(rng.randint(1, 10))))
+    return rng.choice([" ", "", ", "]).join(pieces)
+
+
+@pytest.fixture(scope="module")
+def translator():
+    return SymbolicMathTranslator()
+
+
+def test_matches_agree_on_random_phrases(translator):
+    rng = random.Random(2024)
+    vocabulary = list(translator.math_mappings)
+    for notations in translator.domain_notations.values():
+        vocabulary.extend(notations)
+    domains = [None, "unknown"] + list(translator.domain_notations)
+
+    for _ in range(3000):
+        phrase = random_phrase(rng, vocabulary)
+        domain = rng.choice(domains)
+        result = translator.translate(phrase, domain=domain)
+        assert list(result["matches"].items()) == list(reference_matches(translator, phrase, domain).items()), \
+            (phrase, domain)
+
+
+def test_nested_and_overlapping_phrases_all_match(translator):
+    words = list(translator.math_mappings)
+    nested = [(inner, outer) for outer in words for inner in words if inner != outer and inner in outer]
+    assert nested, "expected mapped phrases that contain other mapped phrases"
+
+    for inner, outer in nested:
+        matches = translator.translate(outer)["matches"]
+        assert inner in matches and outer in matches
+        assert list(matches.items()) == list(reference_matches(translator, outer).items())
+
+
+def test_batch_agrees_with_single_translation(translator):
+    rng = random.Random(7)
+    vocabulary = list(translator.math_mappings)
+    phrases = [random_phrase(rng, vocabulary) for _ in range(200)]
+
+    batch = translator.translate_batch(phrases, domain="physics")
+    for phrase, result in zip(phrases, batch):
+        assert result["matches"] == reference_matches(translator, phrase, "physics")
+
+
+def test_in_place_edit_of_same_size_rebuilds_matchers():
+    translator = SymbolicMathTranslator()
+    translator.translate("warm up the compiled matchers")
+
+    # Swap one phrase for another, leaving the table size unchanged
+    removed = next(iter(translator.math_mappings))
+    del translator.math_mappings[removed]
+    translator.math_mappings["zyxwv phrase"] = "Z"
+
+    assert translator.translate("a zyxwv phrase appears")["matches"] == {"zyxwv phrase": "Z"}
+    assert removed not in translator.translate(removed)["matches"]
+
+
+def test_replaced_domain_table_rebuilds_matchers():
+    translator = SymbolicMathTranslator()
+    domain = next(iter(translator.domain_notations))
+    translator.translate("anything", domain=domain)
+
+    translator.domain_notations[domain] = {"qqqq": "Q"}
+    assert translator.translate("qqqq", domain=domain)["matches"] == {"qqqq": "Q"}
+
+
+def test_pickled_translator_keeps_compiled_matchers_current():
+    translator = SymbolicMathTranslator()
+    translator.translate("infinity")
+    restored = pickle.loads(pickle.dumps(translator))
+
+    assert restored._compiled[None].is_current(restored.math_mappings, None)
+    restored.add_mapping("zyxwv idea", "β")
+    assert restored.translate("a zyxwv idea")["matches"] == {"zyxwv idea": "β"}
@@ -0,0 +1,83 @@
+# tests/test_memory_journal.py
+# 💾 Journaled memory must survive compaction and reload
+
+import os
+import shutil
+
+from memory import SullySearchMemory
+
+
+def memory_state(memory):
+    """The persisted parts of a memory system, in comparable form."""
+    return (
+        memory.storage,
+        {concept: list(indices) for concept, indices in memory.associations.items()},
+        {key: list(indices) for key, indices in memory.temporal_index.items()},
+        {token: list(indices) for token, indices in memory.token_index.items()},
+    )
+
+
+def store_experiences(memory, start, count):
+    for i in range(start, start + count):
+        memory.store_experience(f"observation {i} about recursion and symbol {i % 3}", source="test",
+                                concepts=[f"concept{i % 4}", "recursion"])
+
+
+def test_memory_replays_journal_written_after_compaction(tmp_path):
+    path = str(tmp_path / "memory.json")
+    memory = SullySearchMemory(path, journal=True, compact_every=0)
+    store_experiences(memory, 0, 5)
+    memory.compact(background=False)
+    store_experiences(memory, 5, 3)
+
+    assert os.path.exists(path)
+    assert len(list(memory.journal.replay())) == 3
+
+    reloaded = SullySearchMemory(path, journal=True, compact_every=0)
+    assert len(reloaded) == 8
+    assert memory_state(reloaded) == memory_state(memory)
+
+
+def test_memory_skips_journal_records_already_in_the_snapshot(tmp_path):
+    path = str(tmp_path / "memory.json")
+    memory = SullySearchMemory(path, journal=True, compact_every=0)
+    store_experiences(memory, 0, 4)
+    journaled = memory.journal.path + ".before"
+    shutil.copy(memory.journal.path, journaled)
+    memory.compact(background=False)
+    store_experiences(memory, 4, 2)
+
+    # A crash after writing the snapshot but before discarding the rotated journal
+    os.replace(journaled, memory.journal.rotated_path)
+
+    reloaded = SullySearchMemory(path, journal=True, compact_every=0)
+    assert len(reloaded) == 6
+    assert memory_state(reloaded) == memory_state(memory)
+
+
+def test_memory_keeps_journal_when_compaction_fails(tmp_path):
+    path = str(tmp_path / "memory.json")
+    memory = SullySearchMemory(path, journal=True, compact_every=0)
+    store_experiences(memory, 0, 5)
+
+    def fail(data):
+        raise OSError("disk full")
+
+    memory._write_snapshot = fail
+    memory.compact(background=False)
+    store_experiences(memory, 5, 2)
+
+    assert os.path.exists(memory.journal.rotated_path)
+    reloaded = SullySearchMemory(path, journal=True, compact_every=0)
+    assert memory_state(reloaded) == memory_state(memory)
+
+
+def test_memory_background_compaction_reloads(tmp_path):
+    path = str(tmp_path / "memory.json")
+    memory = SullySearchMemory(path, journal=True, compact_every=4)
+    store_experiences(memory, 0, 10)
+    memory.journal.wait()
+
+    reloaded = SullySearchMemory(path, journal=True, compact_every=4)
+    assert len(reloaded) == 10
+    assert memory_state(reloaded) == memory_state(memory)
@@ -0,0 +1,61 @@
+# tests/test_reasoning.py
+# 🎲 Unseeded multi-mode reasoning must follow the global random seed
+
+import random
+
+import pytest
+
+from Codex import SullyCodex
+from math_translator import SymbolicMathTranslator
+from memory import SullySearchMemory
+from reasoning import SymbolicReasoningNode
+
+MODES = ["emergent", "analytical", "creative", "critical"]
+
+# Several math matches, so the translation's phrasing involves random choices
+MULTI_MATCH_PHRASE = "infinity and the limit of change"
+
+
+def perspectives(executor, seed, phrase=MULTI_MATCH_PHRASE):
+    node = SymbolicReasoningNode(SullyCodex(), SymbolicMathTranslator(), SullySearchMemory(),
+                                 executor=executor, max_workers=2, seed=seed)
+    try:
+        return node.generate_multi_perspective(phrase, MODES)
+    finally:
+        node.shutdown()
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_global_seed_reproduces_unseeded_perspectives(executor):
+    node = SymbolicReasoningNode(SullyCodex(), SymbolicMathTranslator(), SullySearchMemory(),
+                                 executor=executor, max_workers=2)
+    try:
+        responses = []
+        for seed in (11, 11, 12):
+            random.seed(seed)
+            responses.append(node.generate_multi_perspective("time folding into recursion", MODES))
+    finally:
+        node.shutdown()
+
+    assert responses[0] == responses[1]
+    assert responses[0] != responses[2]
+
+
+def test_seeded_perspectives_ignore_global_random_state():
+    assert len(SymbolicMathTranslator().translate(MULTI_MATCH_PHRASE)["matches"]) > 2
+
+    runs = []
+    for state in range(5):
+        random.seed(state)
+        runs.append(perspectives(None, seed=7))
+
+    assert all(run == runs[0] for run in runs)
+    assert perspectives(None, seed=8) != runs[0]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_seeded_perspectives_match_across_executors(executor):
+    random.seed(1)
+    expected = perspectives(None, seed=7)
+    random.seed(2)
+    assert perspectives(executor, seed=7) == expected
@@ -0,0 +1,88 @@
+# tests/test_record_logs.py
+# 💾 Journaled fusion and paradox state must survive compaction and reload
+
+import pickle
+
+from fusion import SymbolFusionEngine
+from paradox import ParadoxLibrary
+
+
+def fusion_state(engine):
+    """The journaled parts of a fusion engine, in comparable form."""
+    network = engine.get_concept_network(include_events=True)
+    # Edge order follows dict insertion order, which reloading need not keep
+    network["edges"] = sorted(network["edges"])
+    network["edge_events"] = sorted(network["edge_events"])
+    return (
+        list(engine.fusion_history),
+        engine.next_fusion_id,
+        network,
+        engine.fusion_styles,
+        engine.category_overrides,
+    )
+
+
+def fuse_pairs(engine, pairs):
+    for first, second in pairs:
+        engine.fuse_with_options(first, second, output_format="dict")
+
+
+def test_fusion_record_log_reloads_after_compaction(tmp_path):
+    path = str(tmp_path / "fusion.jsonl")
+    engine = SymbolFusionEngine(data_path=path, compact_every=0)
+    fuse_pairs(engine, [("light", "shadow"), ("time", "memory"), ("light", "time")])
+    engine.add_fusion_style("braid", "Interleaves the inputs", "⧓", ["woven through"])
+    engine.set_concept_category("shadow", "abstract")
+    engine.compact(background=False)
+    fuse_pairs(engine, [("memory", "shadow"), ("light", "shadow")])
+    engine.set_concept_category("memory", "emotional")
+
+    reloaded = SymbolFusionEngine(data_path=path, compact_every=0)
+    assert fusion_state(reloaded) == fusion_state(engine)
+
+    # New fusions continue the id sequence instead of reusing journaled ids
+    fuse_pairs(reloaded, [("time", "shadow")])
+    assert reloaded.fusion_history[-1]["id"] == engine.next_fusion_id
+
+
+def test_fusion_record_log_reloads_after_background_compaction(tmp_path):
+    path = str(tmp_path / "fusion.jsonl")
+    engine = SymbolFusionEngine(data_path=path, compact_every=3)
+    concepts = ["light", "shadow", "time", "memory", "form"]
+    fuse_pairs(engine, [(concepts[i % 5], concepts[(i * 2 + 1) % 5]) for i in range(11)])
+    engine.record_log.wait()
+
+    reloaded = SymbolFusionEngine(data_path=path, compact_every=3)
+    assert fusion_state(reloaded) == fusion_state(engine)
+
+
+def test_pickled_fusion_engine_does_not_write_to_the_record_log(tmp_path):
+    path = str(tmp_path / "fusion.jsonl")
+    engine = SymbolFusionEngine(data_path=path, compact_every=0)
+    fuse_pairs(engine, [("light", "shadow")])
+
+    restored = pickle.loads(pickle.dumps(engine))
+    assert restored.record_log is None
+    fuse_pairs(restored, [("time", "memory")])
+
+    reloaded = SymbolFusionEngine(data_path=path, compact_every=0)
+    assert fusion_state(reloaded) == fusion_state(engine)
+
+
+def paradox_state(library):
+    return library.paradoxes, library.paradox_types, library.concept_to_paradox
+
+
+def test_paradox_record_log_reloads_after_compaction(tmp_path):
+    path = str(tmp_path / "paradoxes.jsonl")
+    library = ParadoxLibrary(data_path=path, compact_every=0)
+    library.add("Mirror Of Mirrors", "self_reference", "A mirror reflecting only itself.",
+                "Reflection without an origin.", related_concepts=["mirror", "origin"])
+    library.compact(background=False)
+    library.add("Quiet Noise", "novel_tension", "Silence loud enough to hear.", "Absence as presence.")
+    library.add("Mirror Of Mirrors", "self_reference", "A mirror that remembers.",
+                "Memory as reflection.", related_concepts=["memory"])
+
+    reloaded = ParadoxLibrary(data_path=path, compact_every=0)
+    assert paradox_state(reloaded) == paradox_state(library)
+    assert reloaded.find_by_concept("memory")
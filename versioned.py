@@ -0,0 +1,111 @@
+# sully_engine/versioned.py
+# 🔢 Containers that count their mutations, so compiled lookups can tell when they are stale
+
+from typing import Any
+
+
+class VersionedDict(dict):
+    """
+    Dictionary that bumps its version on every mutation.
+
+    Lookups compiled from the dictionary record the version they were built
+    from and are rebuilt once it changes, including edits that keep the
+    dictionary's size.
+    """
+    version = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Kept per instance so unpickling restores it after re-adding the items
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
+class VersionedList(list):
+    """List that bumps its version on every mutation, like VersionedDict."""
+    version = 0
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Kept per instance so unpickling restores it after re-adding the items
+        self.version = 0
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.version += 1
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.version += 1
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self.version += 1
+        return result
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self.version += 1
+
+    def extend(self, items) -> None:
+        super().extend(items)
+        self.version += 1
+
+    def insert(self, index: int, item: Any) -> None:
+        super().insert(index, item)
+        self.version += 1
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self.version += 1
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.version += 1